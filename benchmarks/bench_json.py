@@ -0,0 +1,115 @@
+"""Compare JSON decoders and the Semantic Scholar adapter's ``/paper/batch`` modes.
+
+Run with ``python -m benchmarks.bench_json``; install ``meta-paper[fast-json]``
+to include the fast backend. The decoders are first timed on the bare
+payload, then through the adapter's ``get_many`` against an in-process
+transport which sends the payload in chunks: streaming, and whole-body
+decoding with both the standard library and the fast backend, so the
+timings include converting papers to ``PaperDetails``.
+"""
+
+import asyncio
+import json
+import time
+import timeit
+import tracemalloc
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+from unittest import mock
+
+import httpx
+
+from benchmarks.payloads import semantic_scholar_batch
+from meta_paper.adapters import SemanticScholarAdapter
+from meta_paper.adapters import _semantic_scholar
+from meta_paper.adapters._json import JSON_BACKEND, loads
+
+PAPERS = 500
+
+
+class Unlimited:
+    """Rate limiter which never waits; the transport is local."""
+
+    async def acquire(self, tokens: float = 1) -> None:
+        pass
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, payload: bytes, chunk_size: int = 65536) -> None:
+        self.__payload = payload
+        self.__chunk_size = chunk_size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for i in range(0, len(self.__payload), self.__chunk_size):
+            yield self.__payload[i : i + self.__chunk_size]
+
+
+async def decode(
+    payload: bytes,
+    stream_batches: bool,
+    decoder: Callable[[bytes], Any] = loads,
+    trace: bool = False,
+) -> float:
+    """Fetch one batch; return the elapsed seconds, or the peak memory traced."""
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=ChunkedStream(payload))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        sut = SemanticScholarAdapter(
+            http,
+            rate_limiter=Unlimited(),
+            page_related=False,
+            stream_batches=stream_batches,
+        )
+        identifiers = [f"10.{1000 + i % 9000}/bench.{i}" for i in range(PAPERS)]
+        if trace:
+            tracemalloc.start()
+        started = time.perf_counter()
+        with mock.patch.object(_semantic_scholar, "loads", decoder):
+            papers = await sut.get_many(identifiers)
+        result = time.perf_counter() - started
+        if trace:
+            result = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    assert len(list(papers)) == PAPERS
+    return result
+
+
+def report(name: str, elapsed: float, baseline: float, peak: int | None = None):
+    line = f"{name:>24}: {elapsed * 1e3:8.1f} ms ({baseline / elapsed:4.2f}x)"
+    if peak is not None:
+        line += f", peak {peak / 1e6:6.1f} MB"
+    print(line)
+
+
+def main() -> None:
+    payload = semantic_scholar_batch(PAPERS)
+    print(f"payload: {len(payload) / 1e6:.1f} MB, fast backend: {JSON_BACKEND}")
+
+    print("decoder only")
+    decoders = {"json whole body": json.loads, f"{JSON_BACKEND} whole body": loads}
+    baseline = None
+    for name, decoder in decoders.items():
+        elapsed = min(timeit.repeat(lambda: decoder(payload), number=3, repeat=3)) / 3
+        baseline = baseline or elapsed
+        report(name, elapsed, baseline)
+
+    print("adapter get_many")
+    modes = {
+        "json streaming": (True, loads),
+        "json whole body": (False, json.loads),
+        f"{JSON_BACKEND} whole body": (False, loads),
+    }
+    baseline = None
+    for name, (stream_batches, decoder) in modes.items():
+        elapsed = min(
+            asyncio.run(decode(payload, stream_batches, decoder)) for _ in range(5)
+        )
+        peak = asyncio.run(decode(payload, stream_batches, decoder, trace=True))
+        baseline = baseline or elapsed
+        report(name, elapsed, baseline, peak)
+
+
+if __name__ == "__main__":
+    main()
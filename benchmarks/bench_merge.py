@@ -0,0 +1,72 @@
+"""Micro-benchmark comparing the single-pass merger with the previous merge path.
+
+Run with ``python -m benchmarks.bench_merge``.
+"""
+
+import itertools
+import timeit
+
+from meta_paper.adapters import PaperDetails
+from meta_paper.merge import PaperDetailsMerger
+
+
+def _longest_str(items, attr_selector):
+    return max(
+        (value for obj in items if (value := attr_selector(obj))), key=len, default=""
+    )
+
+
+def legacy_merge(paper_data: list[PaperDetails]) -> PaperDetails:
+    return PaperDetails(
+        doi=_longest_str(paper_data, lambda x: x.doi),
+        title=_longest_str(paper_data, lambda x: x.title),
+        abstract=_longest_str(paper_data, lambda x: x.abstract),
+        source=_longest_str(paper_data, lambda x: x.source),
+        citations=sorted(
+            set(itertools.chain.from_iterable(x.citations for x in paper_data))
+        ),
+        references=sorted(
+            set(itertools.chain.from_iterable(x.references for x in paper_data))
+        ),
+        authors=list(set(itertools.chain.from_iterable(x.authors for x in paper_data))),
+        has_pdf=any(x.has_pdf for x in paper_data),
+        pdf_url=_longest_str(paper_data, lambda x: x.pdf_url),
+        url=_longest_str(paper_data, lambda x: x.url),
+        year=max(x.year for x in paper_data),
+    )
+
+
+def new_papers(citation_count: int, providers: int = 2) -> list[PaperDetails]:
+    return [
+        PaperDetails(
+            doi=f"10.1234/{provider}",
+            title="title",
+            authors=[f"author {i}" for i in range(10)],
+            abstract="abstract" * provider,
+            source="venue",
+            citations=[f"DOI:10.{i % 9000 + 1000}/{i}" for i in range(citation_count)],
+            references=[f"DOI:10.5555/{i}" for i in range(citation_count // 10)],
+            url="https://example.org",
+            year=2020 + provider,
+        )
+        for provider in range(providers)
+    ]
+
+
+def main() -> None:
+    merger = PaperDetailsMerger()
+    for citation_count in (1_000, 10_000, 50_000):
+        papers = new_papers(citation_count)
+        legacy = min(timeit.repeat(lambda: legacy_merge(papers), number=20, repeat=5))
+        single_pass = min(
+            timeit.repeat(lambda: merger.merge(papers), number=20, repeat=5)
+        )
+        print(
+            f"{citation_count:>6} citations: legacy {legacy / 20 * 1e3:7.2f} ms,"
+            f" single-pass {single_pass / 20 * 1e3:7.2f} ms,"
+            f" speedup {legacy / single_pass:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
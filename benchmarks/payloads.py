@@ -0,0 +1,98 @@
+"""Payloads shaped like recorded provider responses, generated deterministically."""
+
+import json
+import random
+
+
+def semantic_scholar_paper(
+    index: int, citations: int, references: int, doi: str | None = None
+) -> dict:
+    rng = random.Random(index)
+    return {
+        "paperId": f"{index:040x}",
+        "externalIds": {"DOI": doi or f"10.{1000 + index % 9000}/bench.{index}"},
+        "title": f"Benchmark paper {index} " + "word " * rng.randint(5, 15),
+        "authors": [
+            {"authorId": str(rng.randint(1, 10**9)), "name": f"Author {i}"}
+            for i in range(rng.randint(1, 8))
+        ],
+        "publicationVenue": {"id": str(index % 97), "name": f"Venue {index % 97}"},
+        "citations": [
+            {
+                "paperId": f"{rng.getrandbits(160):040x}",
+                "externalIds": {"DOI": f"10.{rng.randint(1000, 9999)}/c.{i}"},
+            }
+            for i in range(citations)
+        ],
+        "citationCount": citations,
+        "references": [
+            {
+                "paperId": f"{rng.getrandbits(160):040x}",
+                "externalIds": {"DOI": f"10.{rng.randint(1000, 9999)}/r.{i}"},
+            }
+            for i in range(references)
+        ],
+        "referenceCount": references,
+        "abstract": "lorem ipsum " * rng.randint(50, 150),
+        "isOpenAccess": bool(index % 2),
+        "openAccessPdf": {"url": f"https://example.org/{index}.pdf", "status": "GREEN"},
+        "url": f"https://www.semanticscholar.org/paper/{index:040x}",
+        "year": 1990 + index % 35,
+    }
+
+
+def semantic_scholar_batch(
+    papers: int = 500, citations: int = 200, references: int = 40
+) -> bytes:
+    return json.dumps(
+        [semantic_scholar_paper(i, citations, references) for i in range(papers)]
+    ).encode("utf-8")
+
+
+def semantic_scholar_search_page(offset: int, limit: int, total: int) -> bytes:
+    end = min(offset + limit, total)
+    page = {
+        "total": total,
+        "offset": offset,
+        "data": [
+            {
+                "paperId": f"{i:040x}",
+                "title": f"Benchmark paper {i}",
+                "externalIds": {"DOI": f"10.5555/bench.{i}"},
+                "authors": [{"authorId": str(i), "name": f"Author {i}"}],
+            }
+            for i in range(offset, end)
+        ],
+    }
+    if end < total:
+        page["next"] = end
+    return json.dumps(page).encode("utf-8")
+
+
+def open_citations_related(doi: str, relation_type: str, count: int) -> bytes:
+    attr = "cited" if relation_type == "references" else "citing"
+    return json.dumps(
+        [
+            {
+                "oci": f"0{i}-0{i}",
+                attr: f"omid:br/06{i} doi:10.7777/{relation_type}.{i} openalex:W{i}",
+                "creation": "2020-01-01",
+            }
+            for i in range(count)
+        ]
+    ).encode("utf-8")
+
+
+def open_citations_metadata(dois: list[str]) -> bytes:
+    return json.dumps(
+        [
+            {
+                "id": f"{doi} omid:br/06{i}",
+                "title": f"Benchmark paper {doi}",
+                "authors": "Surname, Name [orcid:0000-0000]; Other, Name",
+                "pub_date": "2020-05-01",
+                "venue": "Journal of Benchmarks",
+            }
+            for i, doi in enumerate(dois)
+        ]
+    ).encode("utf-8")
@@ -0,0 +1,144 @@
+"""In-process stand-in for the Semantic Scholar and OpenCitations APIs.
+
+``ProviderStub`` is an httpx transport answering every endpoint the adapters
+call with payloads from ``benchmarks.payloads``, after a configurable latency
+and jitter, and optionally throttling a share of the requests with 429s.
+"""
+
+import asyncio
+import json
+import random
+import zlib
+from functools import lru_cache
+
+import httpx
+
+from benchmarks.payloads import (
+    open_citations_metadata,
+    open_citations_related,
+    semantic_scholar_paper,
+    semantic_scholar_search_page,
+)
+
+
+@lru_cache(maxsize=100_000)
+def _semantic_scholar_paper_json(doi: str, citations: int, references: int) -> bytes:
+    index = zlib.crc32(doi.encode("utf-8"))
+    return json.dumps(
+        semantic_scholar_paper(index, citations, references, doi=doi)
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=100_000)
+def _open_citations_related_json(doi: str, relation_type: str, count: int) -> bytes:
+    return open_citations_related(doi, relation_type, count)
+
+
+class ProviderStub(httpx.AsyncBaseTransport):
+    SEMANTIC_SCHOLAR_HOST = "api.semanticscholar.org"
+    OPEN_CITATIONS_HOST = "opencitations.net"
+    OPEN_CITATIONS_META_HOST = "w3id.org"
+
+    def __init__(
+        self,
+        latency: float = 0.02,
+        jitter: float = 0.01,
+        throttle_rate: float = 0.0,
+        citations: int = 200,
+        references: int = 40,
+        search_hits: int = 1000,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.citations = citations
+        self.references = references
+        self.search_hits = search_hits
+        self.requests = 0
+        self.throttled = 0
+        self.__rng = random.Random(seed)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        await asyncio.sleep(
+            max(0.0, self.latency + self.__rng.uniform(-self.jitter, self.jitter))
+        )
+        if self.__rng.random() < self.throttle_rate:
+            self.throttled += 1
+            return httpx.Response(429, request=request)
+
+        host = request.url.host
+        if host == self.SEMANTIC_SCHOLAR_HOST:
+            body = self.__semantic_scholar(request)
+        elif host == self.OPEN_CITATIONS_HOST:
+            body = self.__open_citations(request)
+        elif host == self.OPEN_CITATIONS_META_HOST:
+            body = self.__open_citations_meta(request)
+        else:
+            body = None
+        if body is None:
+            return httpx.Response(404, request=request)
+        return httpx.Response(
+            200,
+            content=body,
+            headers={"Content-Type": "application/json"},
+            request=request,
+        )
+
+    def __semantic_scholar(self, request: httpx.Request) -> bytes | None:
+        path = request.url.path.removeprefix("/graph/v1/paper/")
+        if path == "batch":
+            ids = json.loads(request.content)["ids"]
+            return b"[" + b",".join(map(self.__semantic_scholar_paper, ids)) + b"]"
+        if path == "search":
+            params = request.url.params
+            return semantic_scholar_search_page(
+                int(params.get("offset", 0)),
+                int(params.get("limit", 100)),
+                self.search_hits,
+            )
+        if path.startswith("DOI:"):
+            return self.__semantic_scholar_paper(path)
+        paper_id, _, relation_type = path.partition("/")
+        if relation_type in ("citations", "references"):
+            return self.__semantic_scholar_related(request, paper_id, relation_type)
+        return None
+
+    def __semantic_scholar_related(
+        self, request: httpx.Request, paper_id: str, relation_type: str
+    ) -> bytes:
+        params = request.url.params
+        offset, limit = int(params.get("offset", 0)), int(params.get("limit", 100))
+        count = self.citations if relation_type == "citations" else self.references
+        paper_key = "citingPaper" if relation_type == "citations" else "citedPaper"
+        return json.dumps(
+            {
+                "offset": offset,
+                "data": [
+                    {paper_key: {"externalIds": {"DOI": f"10.7777/{paper_id}.{i}"}}}
+                    for i in range(offset, min(offset + limit, count))
+                ],
+            }
+        ).encode("utf-8")
+
+    def __semantic_scholar_paper(self, identifier: str) -> bytes:
+        return _semantic_scholar_paper_json(
+            identifier.removeprefix("DOI:"), self.citations, self.references
+        )
+
+    def __open_citations(self, request: httpx.Request) -> bytes | None:
+        relation_type, _, doi = request.url.path.removeprefix(
+            "/index/api/v2/"
+        ).partition("/")
+        if relation_type == "references":
+            return _open_citations_related_json(doi, relation_type, self.references)
+        if relation_type == "citations":
+            return _open_citations_related_json(doi, relation_type, self.citations)
+        return None
+
+    def __open_citations_meta(self, request: httpx.Request) -> bytes | None:
+        path = request.url.path.removeprefix("/oc/meta/api/v1/metadata/")
+        if path == request.url.path:
+            return None
+        return open_citations_metadata(path.split("__"))
@@ -0,0 +1,199 @@
+"""Throughput, latency and memory benchmarks against a local provider stub.
+
+Run with ``python -m benchmarks.suite``; ``--output results.json`` writes the
+machine-readable results for comparison across versions, ``--help`` lists
+the stub and workload settings.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import sys
+import time
+import tomllib
+import tracemalloc
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import httpx
+
+from benchmarks.bench_merge import new_papers
+from benchmarks.stub import ProviderStub
+from meta_paper.client import PaperMetadataClient
+from meta_paper.merge import PaperDetailsMerger
+from meta_paper.search import QueryParameters
+
+SCENARIOS = ("get_one", "get_many", "search", "merge")
+
+
+class Unlimited:
+    """Rate limiter which never waits; the stub is not rate limited."""
+
+    async def acquire(self, tokens: float = 1) -> None:
+        pass
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def new_client(stub: ProviderStub) -> PaperMetadataClient:
+    return (
+        PaperMetadataClient(httpx.AsyncClient(transport=stub))
+        .use_open_citations(rate_limiter=Unlimited(), max_concurrency=16)
+        .use_semantic_scholar(rate_limiter=Unlimited(), max_concurrency=16)
+    )
+
+
+def dois(count: int, start: int = 0) -> list[str]:
+    return [f"10.{1000 + i % 9000}/bench.{i}" for i in range(start, start + count)]
+
+
+async def bench_get_one(client: PaperMetadataClient, args) -> tuple[int, list[float]]:
+    slots = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async def lookup(doi: str) -> None:
+        async with slots:
+            started_at = time.perf_counter()
+            await client.get_one(doi)
+            latencies.append(time.perf_counter() - started_at)
+
+    await asyncio.gather(*map(lookup, dois(args.lookups)))
+    return args.lookups, latencies
+
+
+async def bench_get_many(client: PaperMetadataClient, args) -> tuple[int, list[float]]:
+    latencies = []
+    for start in range(0, args.lookups, args.batch_size):
+        started_at = time.perf_counter()
+        list(await client.get_many(dois(args.batch_size, start)))
+        latencies.append(time.perf_counter() - started_at)
+    return args.lookups, latencies
+
+
+async def bench_search(client: PaperMetadataClient, args) -> tuple[int, list[float]]:
+    latencies, listings = [], 0
+    for i in range(args.searches):
+        started_at = time.perf_counter()
+        listings += len(
+            await client.search(QueryParameters().title(f"query {i}").max_results(1000))
+        )
+        latencies.append(time.perf_counter() - started_at)
+    return listings, latencies
+
+
+async def bench_merge(_: PaperMetadataClient, args) -> tuple[int, list[float]]:
+    merger, latencies = PaperDetailsMerger(), []
+    papers = new_papers(args.citations * 10)
+    for _ in range(args.merges):
+        started_at = time.perf_counter()
+        merger.merge(papers)
+        latencies.append(time.perf_counter() - started_at)
+    return args.merges, latencies
+
+
+# operations are lookups for get_one, requested DOIs for get_many, listings
+# for search and merges for merge; latencies are per call
+BENCHMARKS: dict[
+    str, Callable[[PaperMetadataClient, argparse.Namespace], Awaitable]
+] = {
+    "get_one": bench_get_one,
+    "get_many": bench_get_many,
+    "search": bench_search,
+    "merge": bench_merge,
+}
+
+
+async def run_scenario(name: str, args) -> dict:
+    stub = ProviderStub(
+        args.latency, args.jitter, args.throttle_rate, args.citations, seed=args.seed
+    )
+    client = new_client(stub)
+    started_at = time.perf_counter()
+    operations, latencies = await BENCHMARKS[name](client, args)
+    elapsed = time.perf_counter() - started_at
+    return {
+        "operations": operations,
+        "seconds": elapsed,
+        "throughput": operations / elapsed if elapsed else None,
+        "p50_ms": percentile(latencies, 0.5) * 1e3 if latencies else None,
+        "p99_ms": percentile(latencies, 0.99) * 1e3 if latencies else None,
+        "requests": stub.requests,
+        "throttled": stub.throttled,
+    }
+
+
+def measure_peak_memory(name: str, args) -> float:
+    # tracemalloc slows allocation heavy code down, so memory gets its own run
+    tracemalloc.start()
+    try:
+        asyncio.run(run_scenario(name, args))
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def package_version() -> str:
+    pyproject = Path(__file__).resolve().parents[1] / "pyproject.toml"
+    with pyproject.open("rb") as f:
+        return tomllib.load(f)["project"]["version"]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="seconds")
+    parser.add_argument(
+        "--throttle-rate", type=float, default=0.0, help="share of 429 responses"
+    )
+    parser.add_argument("--citations", type=int, default=200)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--searches", type=int, default=5)
+    parser.add_argument("--merges", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    results = {}
+    for name in args.scenarios:
+        results[name] = asyncio.run(run_scenario(name, args))
+        if not args.no_memory:
+            results[name]["peak_memory_mb"] = measure_peak_memory(name, args)
+        print(
+            f"{name:>8}: {results[name]['throughput']:10.1f} ops/s,"
+            f" p50 {results[name]['p50_ms']:8.2f} ms,"
+            f" p99 {results[name]['p99_ms']:8.2f} ms",
+            file=sys.stderr,
+        )
+
+    report = json.dumps(
+        {
+            "version": package_version(),
+            "python": platform.python_version(),
+            "config": {
+                key: str(value) if isinstance(value, Path) else value
+                for key, value in vars(args).items()
+            },
+            "results": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,23 @@
-from meta_paper.adapters._base import PaperMetadataAdapter, PaperDetails, PaperListing
+from meta_paper.adapters._base import (
+    PAPER_DETAIL_FIELDS,
+    FrozenPaperDetails,
+    FrozenPaperListing,
+    PaperMetadataAdapter,
+    PaperDetails,
+    PaperListing,
+    select_fields,
+)
 from meta_paper.adapters._open_citations import OpenCitationsAdapter
 from meta_paper.adapters._semantic_scholar import SemanticScholarAdapter
 
 __all__ = [
+    "PAPER_DETAIL_FIELDS",
+    "FrozenPaperDetails",
+    "FrozenPaperListing",
     "OpenCitationsAdapter",
     "PaperDetails",
     "PaperListing",
     "PaperMetadataAdapter",
     "SemanticScholarAdapter",
+    "select_fields",
 ]
@@ -1,20 +1,36 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, fields
 from typing import Protocol, Iterable
 
 from meta_paper.search import QueryParameters
 
 
-@dataclass
+def intern_doi(doi: str) -> str:
+    """Return the canonical copy of a DOI string so duplicates share memory."""
+    return sys.intern(doi) if type(doi) is str else doi
+
+
+def _intern_dois(dois: Iterable[str]) -> list[str]:
+    return [intern_doi(doi) for doi in dois]
+
+
+@dataclass(slots=True)
 class PaperListing:
     doi: str
     title: str
     authors: list[str]
 
+    def __post_init__(self):
+        self.doi = intern_doi(self.doi)
+
     def __hash__(self):
         return hash(self.doi)
 
+    def freeze(self) -> "FrozenPaperListing":
+        return FrozenPaperListing(self.doi, self.title, tuple(self.authors))
 
-@dataclass
+
+@dataclass(slots=True)
 class PaperDetails:
     doi: str
     title: str
@@ -28,16 +44,82 @@ class PaperDetails:
     has_pdf: bool = False
     pdf_url: str | None = None
 
+    def __post_init__(self):
+        self.doi = intern_doi(self.doi)
+        self.citations = _intern_dois(self.citations)
+        self.references = _intern_dois(self.references)
+
+    def __hash__(self):
+        return hash(self.doi)
+
+    def freeze(self) -> "FrozenPaperDetails":
+        values = {field.name: getattr(self, field.name) for field in fields(self)}
+        for name in ("authors", "citations", "references"):
+            values[name] = tuple(values[name])
+        return FrozenPaperDetails(**values)
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenPaperListing:
+    doi: str
+    title: str
+    authors: tuple[str, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "doi", intern_doi(self.doi))
+
+    def __hash__(self):
+        return hash(self.doi)
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenPaperDetails:
+    doi: str
+    title: str
+    authors: tuple[str, ...]
+    abstract: str
+    source: str
+    citations: tuple[str, ...]
+    references: tuple[str, ...]
+    url: str
+    year: int
+    has_pdf: bool = False
+    pdf_url: str | None = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "doi", intern_doi(self.doi))
+        object.__setattr__(self, "citations", tuple(_intern_dois(self.citations)))
+        object.__setattr__(self, "references", tuple(_intern_dois(self.references)))
+
     def __hash__(self):
         return hash(self.doi)
 
 
+PAPER_DETAIL_FIELDS = tuple(field.name for field in fields(PaperDetails))
+
+
+def select_fields(requested: Iterable[str] | None) -> frozenset[str]:
+    """Validate a field projection; ``None`` selects every field, ``doi`` is implied."""
+    if requested is None:
+        return frozenset(PAPER_DETAIL_FIELDS)
+    if isinstance(requested, str):
+        requested = [requested]
+    selected = frozenset(requested) | {"doi"}
+    if unknown := selected.difference(PAPER_DETAIL_FIELDS):
+        raise ValueError(f"unknown paper details fields: {', '.join(sorted(unknown))}")
+    return selected
+
+
 class PaperMetadataAdapter(Protocol):
     async def search(self, query: QueryParameters) -> list[PaperListing]:
         pass
 
-    async def get_one(self, doi: str) -> PaperDetails:
+    async def get_one(
+        self, doi: str, fields: Iterable[str] | None = None
+    ) -> PaperDetails:
         pass
 
-    async def get_many(self, identifiers: Iterable[str]) -> Iterable[PaperDetails]:
+    async def get_many(
+        self, identifiers: Iterable[str], fields: Iterable[str] | None = None
+    ) -> Iterable[PaperDetails]:
         pass
@@ -13,3 +13,11 @@ class DOIPrefixMixin:
 
     def _has_doi_prefix(self, doi: str) -> bool:
         return bool(self.__DOI_RE.search(doi))
+
+
+def normalize_doi(doi: str) -> str:
+    """Strip the optional ``doi:`` prefix and lower-case the DOI."""
+    doi = str(doi).strip()
+    if doi[:4].lower() == "doi:":
+        doi = doi[4:]
+    return doi.strip().lower()
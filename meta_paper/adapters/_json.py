@@ -0,0 +1,38 @@
+"""JSON decoding for adapter responses.
+
+``orjson`` or ``msgspec`` are used when installed (``pip install
+meta-paper[fast-json]``); otherwise the standard library decoder is used.
+"""
+
+import json
+from typing import Any, Callable
+
+import httpx
+
+
+def _stdlib_loads(data: bytes | str) -> Any:
+    return json.loads(data)
+
+
+def _select_backend() -> tuple[str, Callable[[bytes | str], Any]]:
+    try:
+        import orjson
+
+        return "orjson", orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        return "msgspec", msgspec.json.decode
+    except ImportError:
+        pass
+    return "json", _stdlib_loads
+
+
+JSON_BACKEND, loads = _select_backend()
+
+
+def response_json(response: httpx.Response) -> Any:
+    """Decode a response body with the fastest available JSON backend."""
+    return loads(response.content)
@@ -0,0 +1,86 @@
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+
+class JSONArrayScanner:
+    """Incrementally decode the elements of a top-level JSON array.
+
+    Text is fed in arbitrary pieces; every complete element is decoded as soon
+    as it is available so the whole document never has to be held in memory.
+    A failed attempt to decode a partial element is only retried once the
+    pending text has doubled, which keeps the total work linear.
+    """
+
+    __WHITESPACE = " \t\n\r"
+    __TERMINATORS = __WHITESPACE + ",]"
+
+    def __init__(self) -> None:
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__state = "start"
+        self.__retry_size = 0
+
+    def feed(self, text: str, final: bool = False) -> list[Any]:
+        self.__buffer += text
+        if len(self.__buffer) < self.__retry_size and not final:
+            return []
+
+        values = []
+        buffer, pos, state = self.__buffer, 0, self.__state
+        while (pos := self.__skip_whitespace(buffer, pos)) < len(buffer):
+            char = buffer[pos]
+            if state == "start":
+                if char != "[":
+                    raise ValueError("expected a JSON array")
+                state, pos = "value_or_end", pos + 1
+            elif state in ("value_or_end", "separator_or_end") and char == "]":
+                state, pos = "done", pos + 1
+            elif state == "separator_or_end":
+                if char != ",":
+                    raise ValueError(f"unexpected character {char!r} in JSON array")
+                state, pos = "value", pos + 1
+            elif state in ("value_or_end", "value"):
+                try:
+                    value, end = self.__decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                if (
+                    not final
+                    and isinstance(value, int | float)
+                    and (end == len(buffer) or buffer[end] not in self.__TERMINATORS)
+                ):
+                    # a number cut off by the chunk boundary may still continue
+                    break
+                values.append(value)
+                state, pos = "separator_or_end", end
+            else:
+                raise ValueError("unexpected data after JSON array")
+
+        self.__buffer, self.__state = buffer[pos:], state
+        self.__retry_size = 2 * len(self.__buffer)
+        if final and state != "done":
+            raise ValueError("incomplete JSON array")
+        return values
+
+    @classmethod
+    def __skip_whitespace(cls, buffer: str, pos: int) -> int:
+        while pos < len(buffer) and buffer[pos] in cls.__WHITESPACE:
+            pos += 1
+        return pos
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes], encoding: str = "utf-8"
+) -> AsyncIterator[Any]:
+    """Yield the elements of a JSON array read from a stream of byte chunks."""
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    scanner = JSONArrayScanner()
+    async for chunk in chunks:
+        for value in scanner.feed(text_decoder.decode(chunk)):
+            yield value
+    for value in scanner.feed(text_decoder.decode(b"", final=True), final=True):
+        yield value
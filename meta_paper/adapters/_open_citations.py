@@ -1,16 +1,35 @@
+import asyncio
+import itertools
 import re
+from logging import Logger
 from typing import Iterable, Literal
 
 import httpx
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception,
     wait_exponential_jitter,
-    stop_after_delay,
 )
 
-from meta_paper.adapters._base import PaperDetails, PaperListing, PaperMetadataAdapter
-from meta_paper.adapters._doi_prefix import DOIPrefixMixin
+from meta_paper.adapters._base import (
+    PaperDetails,
+    PaperListing,
+    PaperMetadataAdapter,
+    select_fields,
+)
+from meta_paper.adapters._doi_prefix import DOIPrefixMixin, normalize_doi
+from meta_paper.adapters._json import response_json
+from meta_paper.concurrency import (
+    RateLimiter,
+    SingleFlight,
+    TokenBucket,
+    record_send,
+    start_retry_clock,
+    stop_after_sent_delay,
+)
+from meta_paper.instrumentation import Instrumentation, NullInstrumentation
+from meta_paper.logging import null_logger
 from meta_paper.search import QueryParameters
 
 
@@ -22,21 +41,64 @@ def _retry_open_citations(exc: BaseException) -> bool:
     return False
 
 
+def _record_open_citations_retry(retry_state: RetryCallState) -> None:
+    # retried callables are adapter methods, so the adapter comes first
+    adapter = retry_state.args[0]
+    adapter.instrumentation.add(
+        "http.retry", attributes={"provider": type(adapter).__name__}
+    )
+
+
+_open_citations_retry = retry(
+    retry=retry_if_exception(_retry_open_citations),
+    wait=wait_exponential_jitter(max=10),
+    stop=stop_after_sent_delay(10),
+    before=start_retry_clock,
+    before_sleep=_record_open_citations_retry,
+)
+
+
 class OpenCitationsAdapter(DOIPrefixMixin, PaperMetadataAdapter):
     REFERENCES_REST_API = "https://opencitations.net/index/api/v2"
     META_REST_API = "https://w3id.org/oc/meta/api/v1"
     DOI_RE = re.compile(r"^(doi:10\.\d{4,9}/\S+)$", re.IGNORECASE)
+    META_BATCH_SIZE = 20
+    # PaperDetails attributes filled in from the metadata endpoint
+    METADATA_FIELDS = frozenset({"title", "authors", "source", "year"})
+    # OpenCitations asks clients to stay under 180 requests per minute; allow
+    # bursts of one second's worth instead of the whole minute's budget
+    RATE_LIMIT = (3.0, 3.0)
 
     def __init__(
-        self, http_client: httpx.AsyncClient, api_token: str | None = None
+        self,
+        http_client: httpx.AsyncClient,
+        api_token: str | None = None,
+        logger: Logger | None = None,
+        max_concurrency: int = 10,
+        rate_limiter: RateLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         self.__http = http_client
         self.__headers = {} if not api_token else {"Authorization": api_token}
+        self.__logger = logger or null_logger()
+        self.__max_concurrency = max(1, max_concurrency)
+        self.__request_slots = asyncio.Semaphore(self.__max_concurrency)
+        self.__rate_limiter = rate_limiter or TokenBucket(*self.RATE_LIMIT)
+        self.__in_flight: SingleFlight[PaperDetails] = SingleFlight()
+        self.__instrumentation = instrumentation or NullInstrumentation()
 
     @property
     def http_headers(self):
         return self.__headers
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self.__rate_limiter
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        return self.__instrumentation
+
     async def search(self, _: QueryParameters) -> list[PaperListing]:
         return []
 
@@ -44,53 +106,246 @@ class OpenCitationsAdapter(DOIPrefixMixin, PaperMetadataAdapter):
         self, doi: str, relation_type: Literal["references", "citations"]
     ):
         endpoint_url = f"{self.REFERENCES_REST_API}/{relation_type}/{doi}"
-        response = await self.__http.get(endpoint_url, headers=self.__headers)
+        response = await self.__send(endpoint_url)
         response.raise_for_status()
 
         citation_attr = "cited" if relation_type == "references" else "citing"
         return [
             self.DOI_RE.search(ref[citation_attr]).group(1)
-            for ref in response.json()
+            for ref in response_json(response)
             if self.DOI_RE.search(ref[citation_attr])
         ]
 
-    @retry(
-        retry=retry_if_exception(_retry_open_citations),
-        wait=wait_exponential_jitter(max=10),
-        stop=stop_after_delay(10),
-    )
-    async def get_one(self, doi: str | Iterable[str]) -> PaperDetails:
+    async def __get_metadata(self, doi: str) -> dict:
+        response = await self.__send(f"{self.META_REST_API}/metadata/{doi}")
+        response.raise_for_status()
+        return next(iter(response_json(response)))
+
+    async def get_one(
+        self, doi: str | Iterable[str], fields: Iterable[str] | None = None
+    ) -> PaperDetails:
         """Fetch references and citations for a DOI."""
+        selected = select_fields(fields)
+        return await self.__in_flight.do(
+            (normalize_doi(doi), selected), lambda: self.__get_one(doi, selected)
+        )
+
+    @_open_citations_retry
+    async def __get_one(self, doi: str, selected: frozenset[str]) -> PaperDetails:
         doi = self._prepend_doi(doi, False)
         if not self.DOI_RE.match(doi):
             raise ValueError(f"{doi} is not a valid DOI")
 
-        refs = await self.__get_related(doi, "references")
-        citations = await self.__get_related(doi, "citations")
+        metadata, refs, citations = await self.__gather(
+            self.__get_selected_metadata(doi, selected),
+            self.__get_selected_related(doi, "references", selected),
+            self.__get_selected_related(doi, "citations", selected),
+        )
+        return self.__to_paper_details(doi, metadata, refs, citations, selected)
+
+    async def get_many(
+        self, identifiers: Iterable[str], fields: Iterable[str] | None = None
+    ) -> Iterable[PaperDetails]:
+        """Fetch metadata in batches, then references and citations per DOI.
+
+        Only the Meta API accepts several DOIs per request; the Index API
+        has no batch endpoint, so every DOI still costs one request for each
+        of ``references`` and ``citations`` that is selected. Select neither
+        to keep large lookups at one request per ``META_BATCH_SIZE`` DOIs.
+        Without any of ``METADATA_FIELDS`` selected, Meta is not asked at all.
+        """
+        selected = select_fields(fields)
+        if identifiers:
+            identifiers = list(
+                dict.fromkeys(
+                    doi
+                    for doi in map(
+                        lambda x: self._prepend_doi(x, False), filter(bool, identifiers)
+                    )
+                    if self.DOI_RE.match(doi)
+                )
+            )
+        if not identifiers:
+            return []
+
+        if selected & self.METADATA_FIELDS:
+            metadata_by_doi = await self.__get_metadata_by_doi(identifiers)
+            found = [doi for doi in identifiers if doi.lower() in metadata_by_doi]
+        else:
+            # like get_one, look up related papers without asking Meta first
+            metadata_by_doi = {doi.lower(): {} for doi in identifiers}
+            found = identifiers
+
+        related = await self.__map_bounded(
+            lambda doi: self.__get_all_related(doi, selected), found
+        )
+        return [
+            self.__to_paper_details(
+                doi, metadata_by_doi[doi.lower()], *doi_related, selected
+            )
+            for doi, doi_related in zip(
+                found, self.__successful(related, "related papers lookup")
+            )
+            if doi_related is not None
+        ]
+
+    async def __get_metadata_by_doi(self, identifiers: list[str]) -> dict[str, dict]:
+        metadata_batches = await self.__map_bounded(
+            self.__get_metadata_batch,
+            list(self.__batch(identifiers, self.META_BATCH_SIZE)),
+        )
+        return dict(
+            itertools.chain.from_iterable(
+                filter(None, self.__successful(metadata_batches, "metadata batch"))
+            )
+        )
+
+    async def __map_bounded(self, call, items: list) -> list:
+        """Call ``call`` for every item, returning results or raised errors.
+
+        A few workers pull the items one at a time instead of creating a task
+        per item up front; the request slots bound them anyway.
+        """
+        results: list = [None] * len(items)
+        queue = iter(enumerate(items))
+
+        async def worker() -> None:
+            for i, item in queue:
+                try:
+                    results[i] = await call(item)
+                except Exception as exc:
+                    results[i] = exc
+
+        await self.__gather(
+            *(worker() for _ in range(min(self.__max_concurrency, len(items))))
+        )
+        return results
+
+    def __successful(self, results: list, description: str) -> list:
+        """Replace failed results with ``None``; raise when all of them failed.
+
+        Raising lets the client's circuit breaker see a degraded provider
+        instead of an empty answer.
+        """
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures and len(failures) == len(results):
+            raise failures[0]
+        for exc in failures:
+            self.__logger.warning("failed %s", description)
+            self.__logger.debug("error details", exc_info=exc)
+        return [
+            None if isinstance(result, BaseException) else result for result in results
+        ]
+
+    @_open_citations_retry
+    async def __get_all_related(
+        self, doi: str, selected: frozenset[str]
+    ) -> tuple[list[str], list[str]]:
+        return await self.__gather(
+            self.__get_selected_related(doi, "references", selected),
+            self.__get_selected_related(doi, "citations", selected),
+        )
 
-        response = await self.__http.get(
-            f"{self.META_REST_API}/metadata/{doi}", headers=self.__headers
+    async def __get_selected_metadata(self, doi: str, selected: frozenset[str]) -> dict:
+        if not selected & self.METADATA_FIELDS:
+            return {}
+        return await self.__get_metadata(doi)
+
+    async def __get_selected_related(
+        self,
+        doi: str,
+        relation_type: Literal["references", "citations"],
+        selected: frozenset[str],
+    ) -> list[str]:
+        if relation_type not in selected:
+            return []
+        return await self.__get_related(doi, relation_type)
+
+    async def __get_metadata_batch(self, batch: list[str]) -> list[tuple[str, dict]]:
+        attributes = {"provider": type(self).__name__}
+        self.__instrumentation.add("provider.batch.items", len(batch), attributes)
+        with self.__instrumentation.measure("provider.batch", attributes):
+            records = await self.__get_metadata_records(batch)
+        return [
+            (doi, record)
+            for record in records
+            for doi in self.__get_record_dois(record)
+        ]
+
+    @_open_citations_retry
+    async def __get_metadata_records(self, batch: list[str]) -> list[dict]:
+        response = await self.__send(
+            f"{self.META_REST_API}/metadata/{'__'.join(batch)}"
         )
         response.raise_for_status()
-        metadata = next(iter(response.json()))
+        return list(filter(bool, response_json(response)))
+
+    @staticmethod
+    def __get_record_dois(record: dict) -> list[str]:
+        return [
+            identifier.lower()
+            for identifier in str(record.get("id") or "").split()
+            if identifier.lower().startswith("doi:")
+        ]
+
+    @staticmethod
+    def __to_paper_details(
+        doi: str,
+        metadata: dict,
+        refs: list[str],
+        citations: list[str],
+        selected: frozenset[str],
+    ) -> PaperDetails:
         pub_date_parts = metadata.get("pub_date", "").split("-")
         year = (
             int(pub_date_parts[0])
-            if len(pub_date_parts) > 0 and pub_date_parts[0]
+            if "year" in selected and len(pub_date_parts) > 0 and pub_date_parts[0]
             else 0
         )
 
         return PaperDetails(
             doi=doi,
-            title=metadata["title"],
-            authors=metadata.get("authors", "").split(";"),
+            title=metadata["title"] if "title" in selected else "",
+            authors=(
+                metadata.get("authors", "").split(";") if "authors" in selected else []
+            ),
             abstract="",
             references=refs,
             citations=citations,
-            source=metadata.get("venue", ""),
-            url=f"https://dx.doi.org/{doi}",
+            source=metadata.get("venue", "") if "source" in selected else "",
+            url=f"https://dx.doi.org/{doi}" if "url" in selected else "",
             year=year,
         )
 
-    async def get_many(self, identifiers: Iterable[str]) -> Iterable[PaperDetails]:
-        return []
+    @staticmethod
+    async def __gather(*coros):
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def __send(self, url: str) -> httpx.Response:
+        provider = type(self).__name__
+        async with self.__request_slots:
+            await self.__rate_limiter.acquire()
+            record_send()
+            with self.__instrumentation.measure(
+                "http.request", {"provider": provider, "method": "GET"}
+            ) as attributes:
+                response = await self.__http.get(url, headers=self.__headers)
+                attributes["status"] = response.status_code
+        self.__instrumentation.add(
+            "http.response.bytes",
+            response.num_bytes_downloaded,
+            attributes={"provider": provider},
+        )
+        return response
+
+    @staticmethod
+    def __batch(identifiers: list[str], batch_size: int) -> Iterable[list[str]]:
+        it = iter(identifiers)
+        while batch := list(itertools.islice(it, batch_size)):
+            yield batch
@@ -1,29 +1,71 @@
+import asyncio
 import itertools
-from datetime import timedelta
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 from logging import Logger
 from typing import Literal
 
 import httpx
 from tenacity import (
-    stop_after_delay,
+    RetryCallState,
     wait_exponential_jitter,
     retry_if_exception,
     AsyncRetrying,
 )
 
-from meta_paper.adapters._base import PaperListing, PaperDetails, PaperMetadataAdapter
-from meta_paper.adapters._doi_prefix import DOIPrefixMixin
+from meta_paper.adapters._base import (
+    PaperListing,
+    PaperDetails,
+    PaperMetadataAdapter,
+    intern_doi,
+    select_fields,
+)
+from meta_paper.adapters._doi_prefix import DOIPrefixMixin, normalize_doi
+from meta_paper.adapters._json import loads, response_json
+from meta_paper.adapters._json_stream import iter_json_array
+from meta_paper.concurrency import (
+    RateLimiter,
+    SingleFlight,
+    TokenBucket,
+    record_send,
+    start_retry_clock,
+    stop_after_sent_delay,
+)
+from meta_paper.instrumentation import Instrumentation, NullInstrumentation
 from meta_paper.logging import null_logger
 from meta_paper.search import QueryParameters
 
 
 class SemanticScholarAdapter(DOIPrefixMixin, PaperMetadataAdapter):
     __BASE_URL = "https://api.semanticscholar.org/graph/v1"
-    __DETAIL_FIELDS = {
-        "fields": "externalIds,title,authors,publicationVenue,citations.externalIds,references.externalIds,abstract,isOpenAccess,openAccessPdf,url,year"
+    __DETAIL_FIELDS = (
+        ("externalIds", "doi"),
+        ("title", "title"),
+        ("authors", "authors"),
+        ("publicationVenue", "source"),
+        ("citations.externalIds", "citations"),
+        ("citationCount", "citations"),
+        ("references.externalIds", "references"),
+        ("referenceCount", "references"),
+        ("abstract", "abstract"),
+        ("isOpenAccess", "has_pdf"),
+        ("openAccessPdf", "pdf_url"),
+        ("url", "url"),
+        ("year", "year"),
+    )
+    # unauthenticated requests share a global pool, keys get 1 request/second
+    ANONYMOUS_RATE_LIMIT = (10.0, 10.0)
+    API_KEY_RATE_LIMIT = (1.0, 1.0)
+    # embedded citation/reference lists stop at this many entries
+    __EMBEDDED_RELATED_CAP = 1000
+    __RELATED_PAGE_LIMIT = 1000
+    __RELATED_COUNT_FIELDS = {
+        "citations": "citationCount",
+        "references": "referenceCount",
     }
+    __SEARCH_PAGE_LIMIT = 100
+    __SEARCH_RESULT_CAP = 1000
     __RETRY_MESSAGES = {
         int(HTTPStatus.TOO_MANY_REQUESTS): "rate limited",
         int(HTTPStatus.GATEWAY_TIMEOUT): "gateway timeout",
@@ -34,10 +76,24 @@ class SemanticScholarAdapter(DOIPrefixMixin, PaperMetadataAdapter):
         http_client: httpx.AsyncClient,
         api_key: str | None = None,
         logger: Logger | None = None,
+        max_concurrency: int = 4,
+        rate_limiter: RateLimiter | None = None,
+        page_related: bool = True,
+        stream_batches: bool = True,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         self.__http = http_client
         self.__request_headers = {} if not api_key else {"x-api-key": api_key}
         self.__logger = logger or null_logger()
+        self.__request_slots = asyncio.Semaphore(max(1, max_concurrency))
+        self.__rate_limiter = rate_limiter or TokenBucket(
+            *(self.API_KEY_RATE_LIMIT if api_key else self.ANONYMOUS_RATE_LIMIT)
+        )
+        self.__in_flight: SingleFlight[PaperDetails] = SingleFlight()
+        self.__page_related = page_related
+        self.__instrumentation = instrumentation or NullInstrumentation()
+        # whole-body decoding holds the entire batch response in memory
+        self.__stream_batches = stream_batches
 
     def _retry_semantic_scholar(self, exc: BaseException) -> bool:
         if isinstance(exc, httpx.HTTPStatusError):
@@ -47,143 +103,387 @@ class SemanticScholarAdapter(DOIPrefixMixin, PaperMetadataAdapter):
                 return True
         return False
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self.__rate_limiter
+
     @property
     def request_headers(self) -> dict:
         return self.__request_headers
 
+    @property
+    def instrumentation(self) -> Instrumentation:
+        return self.__instrumentation
+
     async def search(self, query: QueryParameters) -> list[PaperListing]:
-        result = []
+        return [listing async for listing in self.iter_search(query)]
+
+    async def iter_search(self, query: QueryParameters) -> AsyncIterator[PaperListing]:
+        """Page through search results, prefetching pages concurrently.
+
+        Pages after the first are requested concurrently once the total number
+        of hits is known; the adapter's request slots and rate limiter bound
+        how many are actually in flight.
+        """
+        offset, limit, max_results = query.pagination
+        offset = offset or 0
+        limit = min(limit or self.__SEARCH_PAGE_LIMIT, self.__SEARCH_PAGE_LIMIT)
+        end = self.__SEARCH_RESULT_CAP
+        if max_results is not None:
+            end = min(end, offset + max_results)
+
+        if offset >= end:
+            return
+        page = await self.__get_search_page(query, offset, min(limit, end - offset))
+        while True:
+            for listing in self.__to_listings(page.get("data") or []):
+                yield listing
+            next_offset = page.get("next")
+            if next_offset is None or next_offset >= end:
+                return
+            if page.get("total") is not None:
+                break
+            page = await self.__get_search_page(
+                query, next_offset, min(limit, end - next_offset)
+            )
+
+        end = min(end, int(page["total"]))
+        tasks = [
+            asyncio.ensure_future(
+                self.__get_search_page(
+                    query, page_offset, min(limit, end - page_offset)
+                )
+            )
+            for page_offset in range(next_offset, end, limit)
+        ]
+        try:
+            for task in tasks:
+                for listing in self.__to_listings((await task).get("data") or []):
+                    yield listing
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def iter_bulk_search(
+        self, query: QueryParameters
+    ) -> AsyncIterator[PaperListing]:
+        """Stream results of the bulk search endpoint, following continuation tokens.
+
+        Bulk search is not relevance ranked and is not capped at 1000 hits;
+        ``max_results`` still bounds how many hits are scanned.
+        """
+        remaining = query.pagination.max_results
+        query_params = query.semantic_scholar_bulk().set(
+            "fields", "title,externalIds,authors"
+        )
+        while True:
+            page = await self.__get_page(
+                f"{self.__BASE_URL}/paper/search/bulk", query_params
+            )
+            data = page.get("data") or []
+            if remaining is not None:
+                data = data[:remaining]
+                remaining -= len(data)
+            for listing in self.__to_listings(data):
+                yield listing
+            if not (token := page.get("token")) or remaining == 0:
+                return
+            query_params = query_params.set("token", token)
+
+    async def __get_page(self, endpoint: str, query_params: httpx.QueryParams) -> dict:
         async for attempt in self.__new_retry_manager():
             with attempt:
-                search_endpoint = f"{self.__BASE_URL}/paper/search"
-                query_params = query.semantic_scholar().set(
-                    "fields", "title,externalIds,authors"
-                )
-                response = await self.__http.get(
-                    search_endpoint, headers=self.__request_headers, params=query_params
-                )
+                response = await self.__send("GET", endpoint, params=query_params)
                 response.raise_for_status()
+                return response_json(response)
 
-                search_results = response.json().get("data", [])
-                for paper_info in search_results:
-                    if not self.__has_valid_doi(paper_info):
-                        continue
-                    if not paper_info.get("title"):
-                        continue
-                    if not (author_names := self.__get_author_names(paper_info)):
-                        continue
-                    result.append(
-                        PaperListing(
-                            doi=paper_info["externalIds"]["DOI"],
-                            title=paper_info["title"],
-                            authors=author_names,
-                        )
-                    )
+    async def __get_search_page(
+        self, query: QueryParameters, offset: int, limit: int
+    ) -> dict:
+        search_endpoint = f"{self.__BASE_URL}/paper/search"
+        query_params = (
+            query.semantic_scholar()
+            .set("fields", "title,externalIds,authors")
+            .set("offset", offset)
+            .set("limit", limit)
+        )
+        return await self.__get_page(search_endpoint, query_params)
+
+    def __to_listings(self, search_results: list[dict]) -> list[PaperListing]:
+        result = []
+        for paper_info in search_results:
+            if not self.__has_valid_doi(paper_info):
+                continue
+            if not paper_info.get("title"):
+                continue
+            if not (author_names := self.__get_author_names(paper_info)):
+                continue
+            result.append(
+                PaperListing(
+                    doi=paper_info["externalIds"]["DOI"],
+                    title=paper_info["title"],
+                    authors=author_names,
+                )
+            )
         return result
 
-    async def get_one(self, doi: str) -> PaperDetails:
+    async def get_one(
+        self, doi: str, fields: Iterable[str] | None = None
+    ) -> PaperDetails:
+        selected = select_fields(fields)
+        return await self.__in_flight.do(
+            (normalize_doi(doi), selected), lambda: self.__get_one(doi, selected)
+        )
+
+    async def __get_one(self, doi: str, selected: frozenset[str]) -> PaperDetails:
         async for attempt in self.__new_retry_manager():
             with attempt:
                 doi = self._prepend_doi(doi)
                 paper_details_endpoint = f"{self.__BASE_URL}/paper/{doi}"
-                response = await self.__http.get(
-                    paper_details_endpoint,
-                    headers=self.__request_headers,
-                    params=self.__DETAIL_FIELDS,
+                response = await self.__send(
+                    "GET", paper_details_endpoint, params=self.__detail_params(selected)
                 )
                 response.raise_for_status()
 
-                paper_data = response.json()
-                if not (title := paper_data.get("title")):
-                    raise ValueError("paper title missing")
-                if not (authors := self.__get_author_names(paper_data)):
-                    raise ValueError("paper authors missing")
-                if not (abstract := paper_data.get("abstract")):
-                    abstract = ""
-                if not (source := self.__get_publication_venue(paper_data)):
-                    source = ""
-                if not (url := paper_data.get("url")):
-                    url = ""
+                paper_data = response_json(response)
+        paper = self.__to_paper_details(paper_data, selected)
+        await self.__complete_related(paper, *self.__truncation(paper_data, selected))
+        return paper
+
+    async def get_many(
+        self, identifiers: Iterable[str], fields: Iterable[str] | None = None
+    ) -> Iterable[PaperDetails]:
+        selected = select_fields(fields)
+        if identifiers:
+            identifiers = list(map(self._prepend_doi, filter(bool, identifiers)))
+        if not identifiers:
+            return []
+
+        batch_results = await self.__gather(
+            *(
+                self.__process_identifier_batch(batch, selected)
+                for batch in self.__batch(identifiers)
+            )
+        )
+        return list(itertools.chain.from_iterable(batch_results))
+
+    async def __process_identifier_batch(
+        self, batch: list[str], selected: frozenset[str]
+    ) -> list[PaperDetails]:
+        attributes = {"provider": type(self).__name__}
+        self.__instrumentation.add("provider.batch.items", len(batch), attributes)
+        async for attempt in self.__new_retry_manager():
+            with attempt, self.__instrumentation.measure("provider.batch", attributes):
+                result = []
+                truncated = []
+                async with self.__stream(
+                    "POST",
+                    f"{self.__BASE_URL}/paper/batch",
+                    params=self.__detail_params(selected),
+                    json={"ids": batch},
+                ) as response:
+                    if response.is_error:
+                        await response.aread()
+                    response.raise_for_status()
+
+                    async for paper_data in self.__decode_batch(response):
+                        if paper_data is None:
+                            continue
+                        try:
+                            paper = self.__to_paper_details(paper_data, selected)
+                        except ValueError as err:
+                            self.__logger.debug(str(err))
+                            continue
+                        result.append(paper)
+                        paper_id, counts = self.__truncation(paper_data, selected)
+                        if counts:
+                            truncated.append((paper, paper_id, counts))
+
+        await asyncio.gather(
+            *(self.__complete_related(*truncation) for truncation in truncated)
+        )
+        return result
+
+    async def __decode_batch(self, response: httpx.Response) -> AsyncIterator[dict]:
+        if self.__stream_batches:
+            # decode one paper at a time instead of the whole batch body
+            async for paper_data in iter_json_array(response.aiter_bytes()):
+                yield paper_data
+        else:
+            for paper_data in loads(await response.aread()):
+                yield paper_data
+
+    def __truncation(
+        self, paper_data: dict, selected: frozenset[str]
+    ) -> tuple[str, dict[str, int]]:
+        """Find embedded related-paper lists which were cut off by the API."""
+        counts = {}
+        if self.__page_related:
+            for relation_type, count_field in self.__RELATED_COUNT_FIELDS.items():
+                if relation_type not in selected:
+                    continue
+                embedded = len(paper_data.get(relation_type) or [])
+                count = paper_data.get(count_field) or 0
+                if embedded >= self.__EMBEDDED_RELATED_CAP and count > embedded:
+                    counts[relation_type] = count
+        paper_id = paper_data.get("paperId") or self.__get_doi(
+            paper_data.get("externalIds")
+        )
+        return paper_id, counts
+
+    async def __complete_related(
+        self, paper: PaperDetails, paper_id: str, counts: dict[str, int]
+    ) -> None:
+        for relation_type, related in zip(
+            counts,
+            await asyncio.gather(
+                *(
+                    self.__get_all_related(paper_id, relation_type, count)
+                    for relation_type, count in counts.items()
+                ),
+                return_exceptions=True,
+            ),
+        ):
+            if isinstance(related, Exception):
+                self.__logger.warning(
+                    "failed paging %s of '%s', keeping truncated list",
+                    relation_type,
+                    paper.doi,
+                )
+                self.__logger.debug("error details", exc_info=related)
+                continue
+            setattr(paper, relation_type, related)
+
+    async def __get_all_related(
+        self,
+        paper_id: str,
+        relation_type: Literal["citations", "references"],
+        count: int,
+    ) -> list[str]:
+        pages = await self.__gather(
+            *(
+                self.__get_related_page(paper_id, relation_type, offset)
+                for offset in range(0, count, self.__RELATED_PAGE_LIMIT)
+            )
+        )
+        # assigned to the paper directly, so intern like __post_init__ does
+        return list(
+            dict.fromkeys(map(intern_doi, itertools.chain.from_iterable(pages)))
+        )
+
+    async def __get_related_page(
+        self,
+        paper_id: str,
+        relation_type: Literal["citations", "references"],
+        offset: int,
+    ) -> list[str]:
+        page = await self.__get_page(
+            f"{self.__BASE_URL}/paper/{paper_id}/{relation_type}",
+            httpx.QueryParams(
+                {
+                    "fields": "externalIds",
+                    "offset": offset,
+                    "limit": self.__RELATED_PAGE_LIMIT,
+                }
+            ),
+        )
+        paper_key = "citingPaper" if relation_type == "citations" else "citedPaper"
+        return [
+            doi
+            for item in page.get("data") or []
+            if item
+            and (doi := self.__get_doi((item.get(paper_key) or {}).get("externalIds")))
+        ]
+
+    def __to_paper_details(
+        self, paper_data: dict, selected: frozenset[str]
+    ) -> PaperDetails:
+        if not (title := paper_data.get("title")) and "title" in selected:
+            raise ValueError("paper title missing")
+        if not (authors := self.__get_author_names(paper_data)) and (
+            "authors" in selected
+        ):
+            raise ValueError("paper authors missing")
 
         return PaperDetails(
             doi=self.__get_doi(paper_data.get("externalIds")),
-            title=title,
+            title=title or "",
             authors=authors,
-            abstract=abstract,
+            abstract=paper_data.get("abstract") or "",
             citations=self.__get_related_papers(paper_data, "citations"),
             references=self.__get_related_papers(paper_data),
             has_pdf=paper_data.get("isOpenAccess") or False,
             pdf_url=self.__get_pdf_url(paper_data),
-            url=url,
-            source=source,
+            url=paper_data.get("url") or "",
+            source=self.__get_publication_venue(paper_data),
             year=self.__get_year(paper_data),
         )
 
-    async def get_many(self, identifiers: Iterable[str]) -> Iterable[PaperDetails]:
-        if identifiers:
-            identifiers = list(map(self._prepend_doi, filter(bool, identifiers)))
-        if not identifiers:
-            return []
+    def __detail_params(self, selected: frozenset[str]) -> dict[str, str]:
+        return {
+            "fields": ",".join(
+                upstream
+                for upstream, attr in self.__DETAIL_FIELDS
+                if attr in selected
+                and (self.__page_related or not upstream.endswith("Count"))
+            )
+        }
 
-        result = []
-        for batch in self.__batch(identifiers):
-            result.extend(await self.__process_identifier_batch(batch))
-        return result
+    @asynccontextmanager
+    async def __stream(
+        self, method: str, url: str, **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        provider = type(self).__name__
+        async with self.__request_slots:
+            await self.__rate_limiter.acquire()
+            record_send()
+            with self.__instrumentation.measure(
+                "http.request", {"provider": provider, "method": method}
+            ) as attributes:
+                async with self.__http.stream(
+                    method, url, headers=self.__request_headers, **kwargs
+                ) as response:
+                    attributes["status"] = response.status_code
+                    try:
+                        yield response
+                    finally:
+                        self.__instrumentation.add(
+                            "http.response.bytes",
+                            response.num_bytes_downloaded,
+                            attributes={"provider": provider},
+                        )
 
-    async def __process_identifier_batch(self, batch: list[str]) -> list[PaperDetails]:
-        result = []
-        async for attempt in self.__new_retry_manager():
-            with attempt:
-                response = await self.__http.post(
-                    f"{self.__BASE_URL}/paper/batch",
-                    headers=self.__request_headers,
-                    params=self.__DETAIL_FIELDS,
-                    json={"ids": batch},
+    async def __send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        provider = type(self).__name__
+        async with self.__request_slots:
+            await self.__rate_limiter.acquire()
+            record_send()
+            with self.__instrumentation.measure(
+                "http.request", {"provider": provider, "method": method}
+            ) as attributes:
+                response = await self.__http.request(
+                    method, url, headers=self.__request_headers, **kwargs
                 )
-                response.raise_for_status()
-                paper_list = response.json()
-
-                for paper_data in paper_list:
-                    if paper_data is None:
-                        continue
-                    if not (title := paper_data.get("title")):
-                        self.__logger.debug("paper title missing")
-                        continue
-                    if not (authors := self.__get_author_names(paper_data)):
-                        self.__logger.debug("paper authors missing")
-                        continue
-                    if not (abstract := paper_data.get("abstract")):
-                        abstract = ""
-                    if not (source := self.__get_publication_venue(paper_data)):
-                        source = ""
-                    if not (url := paper_data.get("url")):
-                        url = ""
-                    doi = self.__get_doi(paper_data.get("externalIds"))
-
-                    result.append(
-                        PaperDetails(
-                            doi=doi,
-                            title=title,
-                            authors=authors,
-                            abstract=abstract,
-                            citations=self.__get_related_papers(
-                                paper_data, "citations"
-                            ),
-                            references=self.__get_related_papers(paper_data),
-                            has_pdf=paper_data.get("isOpenAccess") or False,
-                            pdf_url=self.__get_pdf_url(paper_data),
-                            source=source,
-                            url=url,
-                            year=self.__get_year(paper_data),
-                        )
-                    )
-        return result
+                attributes["status"] = response.status_code
+        self.__instrumentation.add(
+            "http.response.bytes",
+            response.num_bytes_downloaded,
+            attributes={"provider": provider},
+        )
+        return response
 
     def __new_retry_manager(self) -> AsyncRetrying:
         return AsyncRetrying(
             retry=retry_if_exception(self._retry_semantic_scholar),
-            stop=stop_after_delay(timedelta(seconds=60)),
+            stop=stop_after_sent_delay(60),
+            before=start_retry_clock,
             wait=wait_exponential_jitter(3, 27, 3, 1.5),
+            before_sleep=self.__record_retry,
+        )
+
+    def __record_retry(self, _: RetryCallState) -> None:
+        self.__instrumentation.add(
+            "http.retry", attributes={"provider": type(self).__name__}
         )
 
     @staticmethod
@@ -244,6 +544,17 @@ class SemanticScholarAdapter(DOIPrefixMixin, PaperMetadataAdapter):
         )
         return list(filter(bool, map(self.__get_doi, external_id_objs)))
 
+    @staticmethod
+    async def __gather(*coros):
+        # plain gather leaves the other requests running after one failed
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
     @staticmethod
     def __batch(
         identifiers: Iterable[str], batch_size: int = 500
@@ -0,0 +1,14 @@
+from meta_paper.bulk._resolver import (
+    DEFAULT_RATE_LIMITS,
+    BulkResolver,
+    ClientFactory,
+    default_client_factory,
+)
+
+
+__all__ = [
+    "BulkResolver",
+    "ClientFactory",
+    "DEFAULT_RATE_LIMITS",
+    "default_client_factory",
+]
@@ -0,0 +1,168 @@
+import asyncio
+import itertools
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing.context import BaseContext
+
+from meta_paper.adapters import (
+    OpenCitationsAdapter,
+    PaperDetails,
+    SemanticScholarAdapter,
+)
+from meta_paper.adapters._doi_prefix import normalize_doi
+from meta_paper.client import PaperMetadataClient
+from meta_paper.concurrency import RateLimiter, SharedTokenBucket
+
+ClientFactory = Callable[[Mapping[str, RateLimiter]], PaperMetadataClient]
+
+DEFAULT_RATE_LIMITS: Mapping[str, tuple[float, float]] = {
+    "open_citations": OpenCitationsAdapter.RATE_LIMIT,
+    "semantic_scholar": SemanticScholarAdapter.ANONYMOUS_RATE_LIMIT,
+}
+
+
+def default_client_factory(
+    rate_limiters: Mapping[str, RateLimiter],
+    open_citations_token: str | None = None,
+    semantic_scholar_api_key: str | None = None,
+) -> PaperMetadataClient:
+    """Client using both built-in providers with the shared rate limiters.
+
+    Bind credentials with ``functools.partial``; with a Semantic Scholar key,
+    pass ``SemanticScholarAdapter.API_KEY_RATE_LIMIT`` as its rate limit.
+    """
+    return (
+        PaperMetadataClient()
+        .use_open_citations(
+            open_citations_token, rate_limiter=rate_limiters.get("open_citations")
+        )
+        .use_semantic_scholar(
+            semantic_scholar_api_key,
+            rate_limiter=rate_limiters.get("semantic_scholar"),
+        )
+    )
+
+
+class BulkResolver:
+    """Resolve very large DOI streams with one ``PaperMetadataClient`` per process.
+
+    Identifiers are split into shards of ``shard_size`` which worker processes
+    fetch through ``PaperMetadataClient.iter_many``. The rate limits, given as
+    ``(rate, capacity)`` per name, are enforced across all workers by shared
+    token buckets which ``client_factory`` receives by the same names.
+    ``client_factory`` must be picklable, e.g. a module level function.
+    """
+
+    def __init__(
+        self,
+        client_factory: ClientFactory = default_client_factory,
+        rate_limits: Mapping[str, tuple[float, float]] = DEFAULT_RATE_LIMITS,
+        processes: int | None = None,
+        shard_size: int = 1000,
+        chunk_size: int = 500,
+        max_pending_shards: int | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        self.__client_factory = client_factory
+        self.__rate_limits = dict(rate_limits)
+        self.__processes = max(1, processes or os.cpu_count() or 1)
+        self.__shard_size = max(1, shard_size)
+        self.__chunk_size = max(1, chunk_size)
+        # bounds memory: shards are read from the input as results come back,
+        # and shards buffered for ordered output count against the window
+        self.__max_pending_shards = max(1, max_pending_shards or 2 * self.__processes)
+        self.__mp_context = mp_context or multiprocessing.get_context()
+
+    def resolve(
+        self,
+        identifiers: Iterable[str],
+        fields: Iterable[str] | None = None,
+        ordered: bool = True,
+    ) -> Iterator[PaperDetails]:
+        """Yield merged paper details, in input order unless ``ordered`` is false.
+
+        Duplicate identifiers within a shard are resolved once and unknown
+        DOIs are skipped.
+        """
+        fields = None if fields is None else frozenset(fields)
+        shards = enumerate(self.__shards(identifiers))
+        rate_limiters = {
+            name: SharedTokenBucket(*limit, context=self.__mp_context)
+            for name, limit in self.__rate_limits.items()
+        }
+        pool = ProcessPoolExecutor(
+            self.__processes,
+            mp_context=self.__mp_context,
+            initializer=_start_worker,
+            initargs=(self.__client_factory, rate_limiters),
+        )
+        pending: dict[Future, int] = {}
+        finished: dict[int, list[PaperDetails]] = {}
+        next_shard = 0
+        try:
+            while True:
+                for shard_index, shard in itertools.islice(
+                    shards, self.__max_pending_shards - len(pending) - len(finished)
+                ):
+                    future = pool.submit(
+                        _resolve_shard, shard, fields, self.__chunk_size
+                    )
+                    pending[future] = shard_index
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard_index = pending.pop(future)
+                    if ordered:
+                        finished[shard_index] = future.result()
+                    else:
+                        yield from future.result()
+                while next_shard in finished:
+                    yield from finished.pop(next_shard)
+                    next_shard += 1
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def __shards(self, identifiers: Iterable[str]) -> Iterator[list[str]]:
+        it = iter(filter(bool, identifiers or []))
+        while shard := list(itertools.islice(it, self.__shard_size)):
+            yield shard
+
+
+# per worker process state, set up once by the pool initializer
+_worker_loop: asyncio.AbstractEventLoop | None = None
+_worker_client: PaperMetadataClient | None = None
+
+
+def _start_worker(
+    client_factory: ClientFactory, rate_limiters: Mapping[str, RateLimiter]
+) -> None:
+    global _worker_loop, _worker_client
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_client = client_factory(rate_limiters)
+
+
+def _resolve_shard(
+    shard: list[str], fields: frozenset[str] | None, chunk_size: int
+) -> list[PaperDetails]:
+    return _worker_loop.run_until_complete(
+        _collect_shard(_worker_client, shard, fields, chunk_size)
+    )
+
+
+async def _collect_shard(
+    client: PaperMetadataClient,
+    shard: list[str],
+    fields: frozenset[str] | None,
+    chunk_size: int,
+) -> list[PaperDetails]:
+    papers = {
+        normalize_doi(paper.doi): paper
+        async for paper in client.iter_many(shard, chunk_size, fields=fields)
+    }
+    # iter_many yields in completion order, restore the input order
+    return [papers.pop(doi) for doi in map(normalize_doi, shard) if doi in papers]
@@ -0,0 +1,6 @@
+from meta_paper.cache._base import MetadataCache, doi_key, search_key
+from meta_paper.cache._memory import InMemoryCache
+from meta_paper.cache._sqlite import SQLiteCache
+
+
+__all__ = ["InMemoryCache", "MetadataCache", "SQLiteCache", "doi_key", "search_key"]
@@ -0,0 +1,36 @@
+from typing import Any, Iterable, Mapping, Protocol
+
+from meta_paper.adapters._doi_prefix import normalize_doi
+from meta_paper.search import QueryParameters
+
+
+def doi_key(doi: str, fields: Iterable[str] | None = None) -> str:
+    key = f"doi:{normalize_doi(doi)}"
+    if fields is None:
+        return key
+    return f"{key}|fields={','.join(sorted(fields))}"
+
+
+def search_key(query: QueryParameters) -> str:
+    params = sorted(query.semantic_scholar().multi_items())
+    if (max_results := query.pagination.max_results) is not None:
+        params.append(("max_results", str(max_results)))
+    return "search:" + "&".join(f"{name}={value}" for name, value in params)
+
+
+class MetadataCache(Protocol):
+    # the client calls blocking caches from a worker thread, so they have to
+    # be thread-safe
+    blocking: bool = False
+
+    def get(self, provider: str, key: str) -> Any | None:
+        pass
+
+    def get_many(self, provider: str, keys: Iterable[str]) -> dict[str, Any]:
+        pass
+
+    def set(self, provider: str, key: str, value: Any) -> None:
+        pass
+
+    def set_many(self, provider: str, items: Mapping[str, Any]) -> None:
+        pass
@@ -0,0 +1,62 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Mapping
+
+from meta_paper.cache._base import MetadataCache
+
+
+class InMemoryCache(MetadataCache):
+    """Size-bounded LRU cache with per-entry expiry."""
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float | None = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.__max_size = max(1, max_size)
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__entries: OrderedDict[tuple[str, str], tuple[float | None, Any]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, provider: str, key: str) -> Any | None:
+        entry_key = (provider, key)
+        entry = self.__entries.get(entry_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self.__clock():
+            del self.__entries[entry_key]
+            return None
+        self.__entries.move_to_end(entry_key)
+        return value
+
+    def get_many(self, provider: str, keys: Iterable[str]) -> dict[str, Any]:
+        result = {}
+        for key in keys:
+            if (value := self.get(provider, key)) is not None:
+                result[key] = value
+        return result
+
+    def set(
+        self, provider: str, key: str, value: Any, ttl: float | None = None
+    ) -> None:
+        ttl = self.__ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self.__clock() + ttl
+        entry_key = (provider, key)
+        self.__entries[entry_key] = (expires_at, value)
+        self.__entries.move_to_end(entry_key)
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    def set_many(self, provider: str, items: Mapping[str, Any]) -> None:
+        for key, value in items.items():
+            self.set(provider, key, value)
+
+    def clear(self) -> None:
+        self.__entries.clear()
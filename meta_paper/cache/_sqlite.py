@@ -0,0 +1,122 @@
+import dataclasses
+import itertools
+import json
+import sqlite3
+import threading
+import time
+from os import PathLike
+from typing import Any, Callable, Iterable, Mapping
+
+from meta_paper.adapters import PaperDetails, PaperListing
+from meta_paper.cache._base import MetadataCache
+
+
+class SQLiteCache(MetadataCache):
+    """Persistent cache storing paper metadata in a SQLite database (WAL mode)."""
+
+    blocking = True
+
+    __MAX_QUERY_VARIABLES = 900
+    __SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            provider TEXT NOT NULL,
+            key TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (provider, key)
+        ) WITHOUT ROWID
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__db = sqlite3.connect(path, check_same_thread=False)
+        self.__db.execute("PRAGMA journal_mode=WAL")
+        self.__db.execute("PRAGMA synchronous=NORMAL")
+        self.__db.execute(self.__SCHEMA)
+        self.__db.commit()
+
+    def get(self, provider: str, key: str) -> Any | None:
+        return self.get_many(provider, [key]).get(key)
+
+    def get_many(self, provider: str, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(dict.fromkeys(keys))
+        min_fetched_at = (
+            float("-inf") if self.__ttl is None else self.__clock() - self.__ttl
+        )
+        result = {}
+        with self.__lock:
+            for chunk in self.__chunks(keys):
+                rows = self.__db.execute(
+                    "SELECT key, kind, payload FROM entries"
+                    " WHERE provider = ? AND fetched_at > ?"
+                    f" AND key IN ({','.join('?' * len(chunk))})",
+                    (provider, min_fetched_at, *chunk),
+                )
+                for key, kind, payload in rows:
+                    result[key] = self.__deserialize(kind, payload)
+        return result
+
+    def set(self, provider: str, key: str, value: Any) -> None:
+        self.set_many(provider, {key: value})
+
+    def set_many(self, provider: str, items: Mapping[str, Any]) -> None:
+        fetched_at = self.__clock()
+        rows = [
+            (provider, key, *self.__serialize(value), fetched_at)
+            for key, value in items.items()
+        ]
+        if not rows:
+            return
+        with self.__lock, self.__db:
+            self.__db.executemany(
+                "INSERT OR REPLACE INTO entries"
+                " (provider, key, kind, payload, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def fetched_at(self, provider: str, key: str) -> float | None:
+        with self.__lock:
+            row = self.__db.execute(
+                "SELECT fetched_at FROM entries WHERE provider = ? AND key = ?",
+                (provider, key),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def clear(self) -> None:
+        with self.__lock, self.__db:
+            self.__db.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__db.close()
+
+    @staticmethod
+    def __serialize(value: Any) -> tuple[str, str]:
+        if isinstance(value, PaperDetails):
+            return "details", json.dumps(dataclasses.asdict(value))
+        if isinstance(value, list) and all(
+            isinstance(item, PaperListing) for item in value
+        ):
+            return "listings", json.dumps(list(map(dataclasses.asdict, value)))
+        raise TypeError(f"cannot cache values of type {type(value).__name__}")
+
+    @staticmethod
+    def __deserialize(kind: str, payload: str) -> Any:
+        data = json.loads(payload)
+        if kind == "details":
+            return PaperDetails(**data)
+        return [PaperListing(**item) for item in data]
+
+    @classmethod
+    def __chunks(cls, keys: list[str]) -> Iterable[list[str]]:
+        it = iter(keys)
+        while chunk := list(itertools.islice(it, cls.__MAX_QUERY_VARIABLES)):
+            yield chunk
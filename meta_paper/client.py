@@ -1,8 +1,8 @@
 import asyncio
 import itertools
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from logging import Logger
-from typing import Iterable, Generator, Callable
+from typing import Awaitable, Callable, Generator, Iterable, TypeVar
 
 import httpx
 from tenacity import RetryError
@@ -13,21 +13,83 @@ from meta_paper.adapters import (
     PaperListing,
     PaperDetails,
     PaperMetadataAdapter,
+    select_fields,
 )
+from meta_paper.cache import MetadataCache, doi_key, search_key
+from meta_paper.concurrency import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyTracker,
+    RateLimiter,
+    SingleFlight,
+)
+from meta_paper.instrumentation import Instrumentation, NullInstrumentation
 from meta_paper.logging import null_logger
+from meta_paper.merge import PaperDetailsMerger
 from meta_paper.search import QueryParameters
 
+T = TypeVar("T")
+
 
 class PaperMetadataClient:
+    # each built-in provider caps its concurrent requests well below the pool
+    # size, so a slow provider cannot hold every connection
+    DEFAULT_LIMITS = httpx.Limits(
+        max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0
+    )
+
     def __init__(
-        self, http_client: httpx.AsyncClient | None = None, logger: Logger | None = None
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        logger: Logger | None = None,
+        cache: MetadataCache | None = None,
+        merger: PaperDetailsMerger | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        hedge_percentile: float | None = None,
+        circuit_breaker: Callable[[], CircuitBreaker] | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
+        """``hedge_percentile`` enables hedged ``get_one`` calls.
+
+        A provider call still running after that percentile of the provider's
+        recent upstream latencies gets one duplicate request, and the first
+        answer wins. Cache hits are neither timed nor hedged.
+
+        ``circuit_breaker`` builds one breaker per provider; providers with an
+        open circuit are skipped and the healthy providers' data is merged.
+
+        ``instrumentation`` receives timings and counters from the client and
+        from the built-in adapters it creates.
+
+        Cached entries are stored per provider instance, under the provider's
+        class name; further instances of the same class get a ``#<n>`` suffix
+        in registration order, so differently configured providers never
+        share entries.
+        """
+        if http_client is not None and (limits is not None or http2):
+            raise ValueError("limits and http2 only apply to the default http client")
         self.__providers: list[PaperMetadataAdapter] = []
+        # the pool of a caller supplied http client is unknown
+        self.__limits = None if http_client else limits or self.DEFAULT_LIMITS
+        self.__reserved_connections = 0
+        self.__cache = cache
+        self.__cache_namespaces: dict[int, str] = {}
+        self.__merger = merger or PaperDetailsMerger()
+        self.__in_flight: SingleFlight[PaperDetails] = SingleFlight()
+        self.__hedge_percentile = hedge_percentile
+        self.__latencies: dict[int, LatencyTracker] = {}
+        self.__circuit_breaker = circuit_breaker
+        self.__breakers: dict[int, CircuitBreaker] = {}
+        self.__instrumentation = instrumentation or NullInstrumentation()
+        self.__owns_http = http_client is None
         self.__http = http_client or httpx.AsyncClient(
             headers={
                 "Accept": "application/json",
                 "Accept-Encoding": "deflate,gzip;q=1.0",
-            }
+            },
+            limits=self.__limits,
+            http2=http2,
         )
         self.__logger = (logger or null_logger()).getChild(self.__class__.__name__)
 
@@ -35,16 +97,73 @@ class PaperMetadataClient:
     def providers(self) -> Sequence[PaperMetadataAdapter]:
         return self.__providers
 
-    def use_open_citations(self, token: str | None = None) -> "PaperMetadataClient":
-        """Add OpenCitations adapter to the client."""
-        self.__providers.append(OpenCitationsAdapter(self.__http, token))
+    @property
+    def limits(self) -> httpx.Limits | None:
+        return self.__limits
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        return self.__instrumentation
+
+    async def aclose(self) -> None:
+        """Close the http client, unless it was supplied by the caller."""
+        if self.__owns_http:
+            await self.__http.aclose()
+
+    def use_open_citations(
+        self,
+        token: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        max_concurrency: int = 10,
+    ) -> "PaperMetadataClient":
+        """Add OpenCitations adapter to the client.
+
+        ``max_concurrency`` is the number of pooled connections the adapter may
+        hold at once.
+        """
+        self.__reserve_connections("OpenCitationsAdapter", max_concurrency)
+        self.__add_provider(
+            OpenCitationsAdapter(
+                self.__http,
+                token,
+                self.__logger.getChild("OpenCitationsAdapter"),
+                max_concurrency=max_concurrency,
+                rate_limiter=rate_limiter,
+                instrumentation=self.__instrumentation,
+            )
+        )
         return self
 
-    def use_semantic_scholar(self, api_key: str | None = None):
-        """Add SemanticScholar adapter to the client."""
-        self.__providers.append(
+    def use_semantic_scholar(
+        self,
+        api_key: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        max_concurrency: int = 4,
+        stream_batches: bool = True,
+    ):
+        """Add SemanticScholar adapter to the client.
+
+        ``max_concurrency`` is the number of pooled connections the adapter may
+        hold at once.
+
+        ``stream_batches`` decodes ``/paper/batch`` responses one paper at a
+        time, so a batch never sits in memory as a whole. Turning it off
+        decodes each body in one call, with the ``fast-json`` backend when it
+        is installed, and holds the entire response and all its decoded
+        papers (tens of MB for 500 papers with citations) in memory per batch
+        in flight. It is not faster than streaming end to end, even with the
+        fast backend; ``python -m benchmarks.bench_json`` compares the modes.
+        """
+        self.__reserve_connections("SemanticScholarAdapter", max_concurrency)
+        self.__add_provider(
             SemanticScholarAdapter(
-                self.__http, api_key, self.__logger.getChild("SemanticScholarAdapter")
+                self.__http,
+                api_key,
+                self.__logger.getChild("SemanticScholarAdapter"),
+                max_concurrency=max_concurrency,
+                rate_limiter=rate_limiter,
+                stream_batches=stream_batches,
+                instrumentation=self.__instrumentation,
             )
         )
         return self
@@ -52,91 +171,455 @@ class PaperMetadataClient:
     def use_custom_provider(
         self, provider: PaperMetadataAdapter
     ) -> "PaperMetadataClient":
-        self.__providers.append(provider)
+        self.__add_provider(provider)
         return self
 
+    def __add_provider(self, provider: PaperMetadataAdapter) -> None:
+        if id(provider) not in self.__cache_namespaces:
+            class_name = type(provider).__name__
+            siblings = {
+                id(other) for other in self.__providers if type(other) is type(provider)
+            }
+            self.__cache_namespaces[id(provider)] = (
+                f"{class_name}#{len(siblings)}" if siblings else class_name
+            )
+        self.__providers.append(provider)
+
+    def __reserve_connections(self, provider_name: str, max_concurrency: int) -> None:
+        self.__reserved_connections += max(1, max_concurrency)
+        if self.__limits is None or self.__limits.max_connections is None:
+            return
+        max_connections = self.__limits.max_connections
+        if self.__reserved_connections > max_connections:
+            self.__logger.warning(
+                "%s raises provider concurrency to %d over a pool of %d connections;"
+                " slow providers may starve the others",
+                provider_name,
+                self.__reserved_connections,
+                max_connections,
+            )
+
     async def search(self, query: QueryParameters) -> list[PaperListing]:
         """Perform an asynchronous search across all providers."""
-        tasks = [provider.search(query) for provider in self.providers]
-        results = await asyncio.gather(*tasks)
+        tasks = [self.__search(provider, query) for provider in self.providers]
+        with self.__instrumentation.measure("client.search"):
+            results = await asyncio.gather(*tasks)
         results = list(itertools.chain.from_iterable(results))
         return list(self.__dedupe_by_doi(results))
 
-    async def get_one(self, doi: str) -> PaperDetails:
-        """Fetch paper summaries asynchronously from all providers."""
-        tasks = [provider.get_one(doi) for provider in self.providers]
-        paper_data = []
+    async def get_one(
+        self,
+        doi: str,
+        fields: Iterable[str] | None = None,
+        timeout: float | None = None,
+    ) -> PaperDetails:
+        """Fetch paper summaries asynchronously from all providers.
 
-        for coro in asyncio.as_completed(tasks):
+        ``fields`` restricts which ``PaperDetails`` attributes are fetched.
+        When ``timeout`` is set, providers still running after ``timeout``
+        seconds are cancelled and whatever arrived until then is merged;
+        ``TimeoutError`` is raised when nothing arrived in time.
+        """
+        fields = self.__select_fields(fields)
+        with self.__instrumentation.measure("client.get_one"):
+            return await self.__in_flight.do(
+                (doi_key(doi, fields), timeout),
+                lambda: self.__fetch_one(doi, fields, timeout),
+            )
+
+    async def __fetch_one(
+        self, doi: str, fields: frozenset[str] | None, timeout: float | None
+    ) -> PaperDetails:
+        tasks = [
+            asyncio.ensure_future(self.__get_one(provider, doi, fields))
+            for provider in self.providers
+        ]
+        if not tasks:
+            raise ValueError("no providers registered")
+
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            for task in tasks:
+                task.cancel()
+        if pending:
+            self.__logger.warning(
+                "%d providers missed the deadline for '%s'", len(pending), doi
+            )
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        paper_data = []
+        for task in tasks:
+            if task not in done:
+                continue
             try:
-                paper_data.append(await coro)
+                paper_data.append(task.result())
+            except CircuitOpenError as exc:
+                self.__logger.debug("skipped '%s': %s", doi, exc)
             except RetryError:
                 self.__logger.error("retry count exceeded for doi '%s'", doi)
             except Exception as exc:
                 self.__logger.fatal("generic error fetching '%s': %s", doi, exc)
                 self.__logger.debug("error details", exc_info=exc)
 
-        return self.__to_paper_details(paper_data)
+        if pending and not paper_data:
+            raise TimeoutError(f"no provider answered for '{doi}' within {timeout}s")
+        return self.__merge(paper_data)
 
-    async def get_many(self, identifiers: Iterable[str]) -> Iterable[PaperDetails]:
+    async def __get_one_upstream(
+        self,
+        provider: PaperMetadataAdapter,
+        doi: str,
+        fields: frozenset[str] | None,
+    ) -> PaperDetails:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        latencies = self.__latencies.setdefault(id(provider), LatencyTracker())
+        hedge_delay = (
+            None
+            if self.__hedge_percentile is None
+            else latencies.percentile(self.__hedge_percentile)
+        )
+        primary = asyncio.ensure_future(
+            self.__project(provider, provider.get_one, doi, fields)
+        )
+        try:
+            if hedge_delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+                if not done:
+                    paper = await self.__hedge(provider, doi, fields, primary)
+                    latencies.record(loop.time() - started_at)
+                    return paper
+            paper = await primary
+            latencies.record(loop.time() - started_at)
+            return paper
+        finally:
+            primary.cancel()
+
+    async def __hedge(
+        self,
+        provider: PaperMetadataAdapter,
+        doi: str,
+        fields: frozenset[str] | None,
+        primary: asyncio.Future,
+    ) -> PaperDetails:
+        # adapters coalesce concurrent get_one calls for the same DOI, so the
+        # duplicate goes through the batch endpoint instead
+        self.__logger.debug("hedging %s request for '%s'", type(provider).__name__, doi)
+        hedge = asyncio.ensure_future(
+            self.__project(provider, provider.get_many, [doi], fields)
+        )
+        try:
+            done, _ = await asyncio.wait(
+                {primary, hedge}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if primary in done:
+                return primary.result()
+            papers = [] if hedge.exception() else list(hedge.result() or [])
+            if papers:
+                return papers[0]
+            return await primary
+        finally:
+            hedge.cancel()
+
+    async def get_many(
+        self, identifiers: Iterable[str], fields: Iterable[str] | None = None
+    ) -> Iterable[PaperDetails]:
         """Fetch paper summaries asynchronously from all providers."""
-        tasks = [provider.get_many(identifiers) for provider in self.providers]
-        paper_data = {}
+        fields = self.__select_fields(fields)
+        identifiers = list(identifiers or [])
+        tasks = [
+            self.__get_many(provider, identifiers, fields)
+            for provider in self.providers
+        ]
+        self.__instrumentation.add("client.get_many.items", len(identifiers))
+        with self.__instrumentation.measure("client.get_many"):
+            paper_data = await self.__collect_many(tasks)
+        return map(self.__merge, paper_data.values())
+
+    async def __collect_many(
+        self, tasks: list[Awaitable[Iterable[PaperDetails]]]
+    ) -> dict[str, list[PaperDetails]]:
+        paper_data: dict[str, list[PaperDetails]] = {}
         for coro in asyncio.as_completed(tasks):
             try:
                 provider_papers = await coro
                 for paper in provider_papers:
-                    doi_papers = paper_data.get(paper.doi) or set()
-                    doi_papers.add(paper)
-                    paper_data[paper.doi] = doi_papers
+                    paper_data.setdefault(doi_key(paper.doi), []).append(paper)
+            except CircuitOpenError as exc:
+                self.__logger.debug("skipped batch: %s", exc)
             except RetryError as exc:
                 self.__logger.error("retry count exceeded while fetching batch")
                 self.__logger.debug("error details", exc_info=exc)
             except Exception as exc:
                 self.__logger.fatal("generic error while fetching batch")
                 self.__logger.debug("error details", exc_info=exc)
+        return paper_data
 
-        return map(self.__to_paper_details, paper_data.values())
+    async def iter_many(
+        self,
+        identifiers: Iterable[str],
+        chunk_size: int = 500,
+        timeout: float | None = None,
+        fields: Iterable[str] | None = None,
+        max_pending_chunks: int = 4,
+    ) -> AsyncIterator[PaperDetails]:
+        """Yield merged paper details as soon as all providers answered for them.
 
-    def __to_paper_details(self, paper_data: Iterable[PaperDetails]) -> PaperDetails:
-        doi = self.__longest_str(paper_data, lambda x: x.doi)
-        title = self.__longest_str(paper_data, lambda x: x.title)
-        abstract = self.__longest_str(paper_data, lambda x: x.abstract)
-        unique_citations = list(
-            sorted(set(itertools.chain.from_iterable(x.citations for x in paper_data)))
-        )
-        unique_references = list(
-            sorted(set(itertools.chain.from_iterable(x.references for x in paper_data)))
+        Identifiers are read lazily and split into chunks which are fetched
+        from every provider concurrently. At most ``max_pending_chunks`` chunks
+        are in flight; the next one is dispatched once a chunk was yielded.
+        When ``timeout`` is set, a chunk is yielded with whatever data arrived
+        ``timeout`` seconds after it was dispatched.
+        """
+        fields = self.__select_fields(fields)
+        if not self.providers:
+            return
+        chunks = enumerate(self.__chunk(filter(bool, identifiers or []), chunk_size))
+        max_pending_chunks = max(1, max_pending_chunks)
+
+        loop = asyncio.get_running_loop()
+        tasks: dict[asyncio.Future, int] = {}
+        pending_answers: dict[int, int] = {}
+        chunk_papers: dict[int, dict[str, list[PaperDetails]]] = {}
+        deadlines: dict[int, float] = {}
+
+        def dispatch() -> None:
+            free_slots = max_pending_chunks - len(pending_answers)
+            for chunk_index, chunk in itertools.islice(chunks, free_slots):
+                for provider in self.providers:
+                    task = asyncio.ensure_future(
+                        self.__get_many(provider, chunk, fields)
+                    )
+                    tasks[task] = chunk_index
+                pending_answers[chunk_index] = len(self.providers)
+                chunk_papers[chunk_index] = {}
+                if timeout is not None:
+                    deadlines[chunk_index] = loop.time() + timeout
+
+        try:
+            dispatch()
+            while pending_answers:
+                wait_timeout = None
+                if deadlines:
+                    wait_timeout = max(0.0, min(deadlines.values()) - loop.time())
+                done, _ = await asyncio.wait(
+                    tasks, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                completed_chunks = []
+                for task in done:
+                    chunk_index = tasks.pop(task)
+                    papers = chunk_papers[chunk_index]
+                    for paper in self.__task_papers(task):
+                        papers.setdefault(doi_key(paper.doi), []).append(paper)
+                    pending_answers[chunk_index] -= 1
+                    if pending_answers[chunk_index] == 0:
+                        completed_chunks.append(chunk_index)
+
+                now = loop.time()
+                completed_chunks.extend(
+                    chunk_index
+                    for chunk_index, deadline in deadlines.items()
+                    if deadline <= now and chunk_index not in completed_chunks
+                )
+
+                for chunk_index in sorted(completed_chunks):
+                    self.__cancel_chunk(tasks, chunk_index)
+                    del pending_answers[chunk_index]
+                    deadlines.pop(chunk_index, None)
+                    for papers in chunk_papers.pop(chunk_index).values():
+                        yield self.__merge(papers)
+                dispatch()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def __task_papers(self, task: asyncio.Future) -> Iterable[PaperDetails]:
+        try:
+            return task.result()
+        except CircuitOpenError as exc:
+            self.__logger.debug("skipped batch: %s", exc)
+        except RetryError as exc:
+            self.__logger.error("retry count exceeded while fetching batch")
+            self.__logger.debug("error details", exc_info=exc)
+        except Exception as exc:
+            self.__logger.fatal("generic error while fetching batch")
+            self.__logger.debug("error details", exc_info=exc)
+        return []
+
+    @staticmethod
+    def __cancel_chunk(tasks: dict[asyncio.Future, int], chunk_index: int) -> None:
+        for task in [task for task, index in tasks.items() if index == chunk_index]:
+            task.cancel()
+            del tasks[task]
+
+    @staticmethod
+    def __chunk(identifiers: Iterable[str], chunk_size: int) -> Iterable[list[str]]:
+        it = iter(identifiers)
+        while chunk := list(itertools.islice(it, max(1, chunk_size))):
+            yield chunk
+
+    async def __search(
+        self, provider: PaperMetadataAdapter, query: QueryParameters
+    ) -> list[PaperListing]:
+        try:
+            return await self.__search_provider(provider, query)
+        except CircuitOpenError as exc:
+            self.__logger.debug("skipped search: %s", exc)
+            return []
+
+    async def __search_provider(
+        self, provider: PaperMetadataAdapter, query: QueryParameters
+    ) -> list[PaperListing]:
+        if self.__cache is None:
+            return await self.__guarded(
+                provider, "search", lambda: provider.search(query)
+            )
+        namespace, key = self.__cache_namespaces[id(provider)], search_key(query)
+        if (
+            results := await self.__cached(self.__cache.get, namespace, key)
+        ) is not None:
+            self.__count_cache_lookups(provider, hits=1)
+            return results
+        self.__count_cache_lookups(provider, misses=1)
+        results = await self.__guarded(
+            provider, "search", lambda: provider.search(query)
         )
-        unique_author_names = set(
-            a for a in itertools.chain.from_iterable(d.authors for d in paper_data)
+        await self.__cached(self.__cache.set, namespace, key, results)
+        return results
+
+    async def __get_one(
+        self,
+        provider: PaperMetadataAdapter,
+        doi: str,
+        fields: frozenset[str] | None,
+    ) -> PaperDetails:
+        if self.__cache is None:
+            return await self.__get_one_upstream(provider, doi, fields)
+        namespace, key = self.__cache_namespaces[id(provider)], doi_key(doi, fields)
+        if (paper := await self.__cached(self.__cache.get, namespace, key)) is not None:
+            self.__count_cache_lookups(provider, hits=1)
+            return paper
+        self.__count_cache_lookups(provider, misses=1)
+        paper = await self.__get_one_upstream(provider, doi, fields)
+        await self.__cached(self.__cache.set, namespace, key, paper)
+        return paper
+
+    async def __get_many(
+        self,
+        provider: PaperMetadataAdapter,
+        identifiers: list[str],
+        fields: frozenset[str] | None,
+    ) -> Iterable[PaperDetails]:
+        if self.__cache is None:
+            return await self.__project(
+                provider, provider.get_many, identifiers, fields
+            )
+        namespace = self.__cache_namespaces[id(provider)]
+        keys = {doi_key(doi, fields): doi for doi in identifiers if doi}
+        cached = await self.__cached(self.__cache.get_many, namespace, list(keys))
+        misses = [doi for key, doi in keys.items() if key not in cached]
+        self.__count_cache_lookups(provider, len(cached), len(misses))
+        fetched = (
+            list(await self.__project(provider, provider.get_many, misses, fields))
+            if misses
+            else []
         )
-        has_pdf = any(d.has_pdf for d in paper_data)
-        pdf_url = self.__longest_str(paper_data, lambda x: x.pdf_url)
-        url = self.__longest_str(paper_data, lambda x: x.url)
-        source = self.__longest_str(paper_data, lambda x: x.source)
-        return PaperDetails(
-            doi=doi,
-            title=title,
-            abstract=abstract,
-            source=source,
-            citations=unique_citations,
-            references=list(unique_references),
-            authors=list(unique_author_names),
-            has_pdf=has_pdf,
-            pdf_url=pdf_url,
-            url=url,
-            year=max(d.year for d in paper_data),
+        await self.__cached(
+            self.__cache.set_many,
+            namespace,
+            {doi_key(paper.doi, fields): paper for paper in fetched},
         )
+        return list(cached.values()) + fetched
+
+    async def __cached(self, method: Callable[..., T], *args) -> T:
+        # blocking caches do I/O and (de)serialization, keep it off the loop
+        if getattr(self.__cache, "blocking", False):
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    def __count_cache_lookups(
+        self, provider: PaperMetadataAdapter, hits: int = 0, misses: int = 0
+    ) -> None:
+        attributes = {"provider": type(provider).__name__}
+        if hits:
+            self.__instrumentation.add("cache.hit", hits, attributes)
+        if misses:
+            self.__instrumentation.add("cache.miss", misses, attributes)
+
+    def __merge(self, papers: Iterable[PaperDetails]) -> PaperDetails:
+        with self.__instrumentation.measure("client.merge"):
+            return self.__merger.merge(papers)
 
     @staticmethod
-    def __longest_str(
-        items: Iterable[PaperDetails], attr_selector: Callable[[PaperDetails], str]
-    ) -> str:
-        generate_attr_values = (
-            attr_value for obj in items if (attr_value := attr_selector(obj))
+    def __select_fields(fields: Iterable[str] | None) -> frozenset[str] | None:
+        return None if fields is None else select_fields(fields)
+
+    def __project(
+        self,
+        provider: PaperMetadataAdapter,
+        method,
+        argument,
+        fields: frozenset[str] | None,
+    ):
+        # custom providers written before field projection only take one argument
+        if fields is None:
+            return self.__guarded(provider, method.__name__, lambda: method(argument))
+        return self.__guarded(
+            provider, method.__name__, lambda: method(argument, fields=fields)
         )
-        return max(generate_attr_values, key=len, default="")
+
+    async def __guarded(
+        self,
+        provider: PaperMetadataAdapter,
+        operation: str,
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        with self.__instrumentation.measure(
+            "provider.call",
+            {"provider": type(provider).__name__, "operation": operation},
+        ):
+            return await self.__call_provider(provider, call)
+
+    async def __call_provider(
+        self, provider: PaperMetadataAdapter, call: Callable[[], Awaitable[T]]
+    ) -> T:
+        if self.__circuit_breaker is None:
+            return await call()
+        breaker = self.__breakers.get(id(provider))
+        if breaker is None:
+            breaker = self.__breakers[id(provider)] = self.__circuit_breaker()
+        if not breaker.allow():
+            raise CircuitOpenError(f"{type(provider).__name__} circuit is open")
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            breaker.abandon(loop.time() - started_at)
+            raise
+        except Exception as exc:
+            if self.__is_provider_failure(exc):
+                breaker.record_failure(loop.time() - started_at)
+            else:
+                breaker.record_success(loop.time() - started_at)
+            raise
+        breaker.record_success(loop.time() - started_at)
+        return result
+
+    @staticmethod
+    def __is_provider_failure(exc: Exception) -> bool:
+        """Whether an error says the provider is unhealthy.
+
+        Unknown DOIs (4xx responses) and papers failing validation were still
+        answered, so they do not count against the provider's circuit.
+        """
+        if isinstance(exc, httpx.HTTPStatusError):
+            status_code = exc.response.status_code
+            return status_code >= 500 or status_code == 429
+        return isinstance(exc, (httpx.TransportError, TimeoutError, RetryError))
 
     @staticmethod
     def __dedupe_by_doi(
@@ -0,0 +1,29 @@
+from meta_paper.concurrency._circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from meta_paper.concurrency._latency import LatencyTracker
+from meta_paper.concurrency._rate_limit import RateLimiter, TokenBucket
+from meta_paper.concurrency._retry_clock import (
+    record_send,
+    start_retry_clock,
+    stop_after_sent_delay,
+)
+from meta_paper.concurrency._shared_rate_limit import SharedTokenBucket
+from meta_paper.concurrency._single_flight import SingleFlight
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "LatencyTracker",
+    "RateLimiter",
+    "SharedTokenBucket",
+    "SingleFlight",
+    "TokenBucket",
+    "record_send",
+    "start_retry_clock",
+    "stop_after_sent_delay",
+]
@@ -0,0 +1,124 @@
+import time
+from collections import deque
+from typing import Callable, Literal
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Stop calling a provider once too many recent calls failed or were slow.
+
+    The circuit opens when at least ``min_calls`` of the last ``window`` calls
+    were recorded and either ``failure_rate`` of them failed or
+    ``slow_call_rate`` of them took longer than ``slow_call_duration``
+    seconds. After ``reset_timeout`` seconds it lets ``half_open_calls``
+    probes through; it closes again when they all succeed and reopens on
+    the first bad probe.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_rate: float = 1.0,
+        slow_call_duration: float | None = None,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < failure_rate <= 1 or not 0 < slow_call_rate <= 1:
+            raise ValueError("failure and slow call rates must be in (0, 1]")
+        if window < 1 or half_open_calls < 1:
+            raise ValueError("window and half open calls must be positive")
+        self.__failure_rate = failure_rate
+        self.__slow_call_rate = slow_call_rate
+        self.__slow_call_duration = slow_call_duration
+        self.__min_calls = max(1, min(min_calls, window))
+        self.__reset_timeout = reset_timeout
+        self.__half_open_calls = half_open_calls
+        self.__clock = clock
+        # one (failed, slow) outcome per recorded call
+        self.__outcomes: deque[tuple[bool, bool]] = deque(maxlen=window)
+        self.__state: CircuitState = "closed"
+        self.__opened_at = 0.0
+        self.__probes = 0
+        self.__probe_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self.__state == "open"
+            and self.__clock() - self.__opened_at >= self.__reset_timeout
+        ):
+            self.__state = "half_open"
+            self.__probes = self.__probe_successes = 0
+        return self.__state
+
+    def allow(self) -> bool:
+        """Whether a call may go through; reserves a probe while half open."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open" or self.__probes >= self.__half_open_calls:
+            return False
+        self.__probes += 1
+        return True
+
+    def record_success(self, seconds: float) -> None:
+        self.__record(False, seconds)
+
+    def record_failure(self, seconds: float) -> None:
+        self.__record(True, seconds)
+
+    def abandon(self, seconds: float) -> None:
+        """Record a call cancelled before it finished.
+
+        It counts as a slow call once it ran past the slow call duration,
+        otherwise it is forgotten.
+        """
+        if self.__is_slow(seconds):
+            self.__record(False, seconds)
+        elif self.__state == "half_open" and self.__probes > 0:
+            self.__probes -= 1
+
+    def __record(self, failed: bool, seconds: float) -> None:
+        slow = self.__is_slow(seconds)
+        if self.__state == "half_open":
+            if failed or slow:
+                self.__open()
+                return
+            self.__probe_successes += 1
+            if self.__probe_successes >= self.__half_open_calls:
+                self.__state = "closed"
+                self.__outcomes.clear()
+            return
+        if self.__state == "open":
+            return
+
+        self.__outcomes.append((failed, slow))
+        if len(self.__outcomes) < self.__min_calls:
+            return
+        calls = len(self.__outcomes)
+        failures = sum(failed for failed, _ in self.__outcomes)
+        slow_calls = sum(slow for _, slow in self.__outcomes)
+        if (
+            failures / calls >= self.__failure_rate
+            or slow_calls / calls >= self.__slow_call_rate
+        ):
+            self.__open()
+
+    def __is_slow(self, seconds: float) -> bool:
+        return (
+            self.__slow_call_duration is not None
+            and seconds > self.__slow_call_duration
+        )
+
+    def __open(self) -> None:
+        self.__state = "open"
+        self.__opened_at = self.__clock()
+        self.__outcomes.clear()
@@ -0,0 +1,27 @@
+import math
+from collections import deque
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies, in seconds."""
+
+    def __init__(self, window: int = 256, min_samples: int = 20) -> None:
+        if window < 1:
+            raise ValueError("window must hold at least one sample")
+        self.__samples: deque[float] = deque(maxlen=window)
+        self.__min_samples = max(1, min(min_samples, window))
+
+    def __len__(self) -> int:
+        return len(self.__samples)
+
+    def record(self, seconds: float) -> None:
+        self.__samples.append(max(0.0, seconds))
+
+    def percentile(self, q: float) -> float | None:
+        """Nearest-rank percentile for ``0 < q <= 1``, ``None`` until enough samples."""
+        if not 0 < q <= 1:
+            raise ValueError("percentile must be in (0, 1]")
+        if len(self.__samples) < self.__min_samples:
+            return None
+        ordered = sorted(self.__samples)
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from typing import Callable, Protocol
+
+
+class RateLimiter(Protocol):
+    async def acquire(self, tokens: float = 1) -> None:
+        pass
+
+
+class TokenBucket(RateLimiter):
+    """Async token bucket refilled at ``rate`` tokens per second.
+
+    Waiters are served in arrival order, so a single bucket can be shared by
+    every coroutine that talks to the same provider.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.__rate = float(rate)
+        self.__capacity = float(capacity if capacity is not None else rate)
+        if self.__capacity < 1:
+            raise ValueError("capacity must allow at least one token")
+        self.__clock = clock
+        self.__tokens = self.__capacity
+        self.__updated_at = clock()
+        self.__lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    @property
+    def capacity(self) -> float:
+        return self.__capacity
+
+    @property
+    def tokens(self) -> float:
+        self.__refill()
+        return self.__tokens
+
+    async def acquire(self, tokens: float = 1) -> None:
+        if tokens > self.__capacity:
+            raise ValueError("cannot acquire more tokens than the bucket capacity")
+        async with self.__lock:
+            self.__refill()
+            while self.__tokens < tokens:
+                await asyncio.sleep((tokens - self.__tokens) / self.__rate)
+                self.__refill()
+            self.__tokens -= tokens
+
+    def __refill(self) -> None:
+        now = self.__clock()
+        elapsed = max(0.0, now - self.__updated_at)
+        self.__tokens = min(self.__capacity, self.__tokens + elapsed * self.__rate)
+        self.__updated_at = now
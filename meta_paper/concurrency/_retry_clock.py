@@ -0,0 +1,40 @@
+import time
+from contextvars import ContextVar
+
+from tenacity import RetryCallState
+
+# monotonic time of the first request sent by the retried call in this context
+_first_sent_at: ContextVar[list[float | None]] = ContextVar("first_sent_at")
+
+
+def start_retry_clock(retry_state: RetryCallState) -> None:
+    """tenacity ``before`` hook; resets the clock on a call's first attempt."""
+    if retry_state.attempt_number == 1:
+        _first_sent_at.set([None])
+
+
+def record_send() -> None:
+    """Start the retry clock of the current call, unless it already runs.
+
+    Called once a request got its connection slot and rate limiter token, so
+    time spent queued behind other requests does not use up the budget.
+    """
+    first_sent_at = _first_sent_at.get(None)
+    if first_sent_at is not None and first_sent_at[0] is None:
+        first_sent_at[0] = time.monotonic()
+
+
+class stop_after_sent_delay:
+    """Stop retrying ``max_delay`` seconds after the first request was sent.
+
+    Used together with ``start_retry_clock`` as the ``before`` hook; calls
+    which never sent a request fall back to the first attempt's start.
+    """
+
+    def __init__(self, max_delay: float) -> None:
+        self.max_delay = max_delay
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        first_sent_at = _first_sent_at.get([None])[0]
+        started_at = retry_state.start_time if first_sent_at is None else first_sent_at
+        return time.monotonic() - started_at >= self.max_delay
@@ -0,0 +1,80 @@
+import asyncio
+import multiprocessing
+import time
+from multiprocessing.context import BaseContext
+
+from meta_paper.concurrency._rate_limit import RateLimiter
+
+
+class SharedTokenBucket(RateLimiter):
+    """Token bucket whose budget is shared by every process it is passed to.
+
+    The bucket state lives in shared memory, so it must reach worker processes
+    when they are created, e.g. through a process pool initializer. Within a
+    process, waiters are served in arrival order like ``TokenBucket``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        context: BaseContext | None = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.__rate = float(rate)
+        self.__capacity = float(capacity if capacity is not None else rate)
+        if self.__capacity < 1:
+            raise ValueError("capacity must allow at least one token")
+        context = context or multiprocessing.get_context()
+        self.__lock = context.Lock()
+        self.__tokens = context.Value("d", self.__capacity, lock=False)
+        # CLOCK_MONOTONIC is system wide, so processes agree on elapsed time
+        self.__updated_at = context.Value("d", time.monotonic(), lock=False)
+        self.__waiters: asyncio.Lock | None = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_SharedTokenBucket__waiters"] = None
+        return state
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    @property
+    def capacity(self) -> float:
+        return self.__capacity
+
+    @property
+    def tokens(self) -> float:
+        with self.__lock:
+            self.__refill()
+            return self.__tokens.value
+
+    async def acquire(self, tokens: float = 1) -> None:
+        if tokens > self.__capacity:
+            raise ValueError("cannot acquire more tokens than the bucket capacity")
+        if self.__waiters is None:
+            self.__waiters = asyncio.Lock()
+        async with self.__waiters:
+            while (wait := self.__try_acquire(tokens)) > 0:
+                await asyncio.sleep(wait)
+
+    def __try_acquire(self, tokens: float) -> float:
+        """Take ``tokens`` and return 0, or return how long to wait for them."""
+        with self.__lock:
+            self.__refill()
+            missing = tokens - self.__tokens.value
+            if missing <= 0:
+                self.__tokens.value -= tokens
+                return 0.0
+        return missing / self.__rate
+
+    def __refill(self) -> None:
+        now = time.monotonic()
+        elapsed = max(0.0, now - self.__updated_at.value)
+        self.__tokens.value = min(
+            self.__capacity, self.__tokens.value + elapsed * self.__rate
+        )
+        self.__updated_at.value = now
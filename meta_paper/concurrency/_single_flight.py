@@ -0,0 +1,49 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Share one in-flight call between concurrent callers using the same key.
+
+    The shared call is cancelled only when every caller waiting on it has been
+    cancelled.
+    """
+
+    def __init__(self) -> None:
+        self.__calls: dict[Hashable, asyncio.Future] = {}
+        self.__waiters: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.__calls)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        future = self.__calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self.__calls[key] = future
+            self.__waiters[key] = 0
+            future.add_done_callback(lambda done: self.__forget(key, done))
+
+        self.__waiters[key] += 1
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if self.__calls.get(key) is future and self.__waiters[key] == 1:
+                # forget the call right away, later callers must not join it
+                # while it is still being cancelled
+                del self.__calls[key]
+                del self.__waiters[key]
+                future.cancel()
+            raise
+        finally:
+            if self.__calls.get(key) is future:
+                self.__waiters[key] -= 1
+
+    def __forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self.__calls.get(key) is future:
+            del self.__calls[key]
+            del self.__waiters[key]
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,5 @@
+from meta_paper.graph._crawler import CitationCrawler, CrawledPaper
+from meta_paper.graph._index import CitationGraph
+
+
+__all__ = ["CitationCrawler", "CitationGraph", "CrawledPaper"]
@@ -0,0 +1,110 @@
+import asyncio
+import itertools
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Iterable, Literal
+
+from meta_paper.adapters import PaperDetails
+from meta_paper.cache import doi_key
+from meta_paper.client import PaperMetadataClient
+
+
+@dataclass(slots=True)
+class CrawledPaper:
+    depth: int
+    paper: PaperDetails
+
+
+class CitationCrawler:
+    """Breadth-first crawler over the citation/reference neighbourhood of papers.
+
+    Each frontier level is fetched through ``PaperMetadataClient.get_many`` in
+    batches of ``batch_size``, with at most ``workers`` batches in flight.
+    """
+
+    def __init__(
+        self,
+        client: PaperMetadataClient,
+        max_depth: int = 1,
+        max_nodes: int | None = None,
+        direction: Literal["citations", "references", "both"] = "both",
+        batch_size: int = 500,
+        workers: int = 4,
+    ) -> None:
+        if direction not in ("citations", "references", "both"):
+            raise ValueError(f"unknown crawl direction '{direction}'")
+        self.__client = client
+        self.__max_depth = max(0, max_depth)
+        self.__max_nodes = max_nodes
+        self.__direction = direction
+        self.__batch_size = max(1, batch_size)
+        self.__workers = max(1, workers)
+
+    async def crawl(self, seeds: Iterable[str]) -> AsyncIterator[CrawledPaper]:
+        """Yield papers as they are fetched, level by level, starting at the seeds."""
+        visited: set[str] = set()
+        frontier = self.__unvisited(seeds, visited)
+        budget = self.__max_nodes
+        depth = 0
+        while frontier and depth <= self.__max_depth:
+            if budget is not None:
+                frontier = frontier[:budget]
+                budget -= len(frontier)
+
+            next_frontier: list[str] = []
+            async for paper in self.__fetch_level(frontier):
+                yield CrawledPaper(depth, paper)
+                if depth < self.__max_depth:
+                    next_frontier.extend(
+                        self.__unvisited(self.__neighbours(paper), visited)
+                    )
+
+            if budget is not None and budget <= 0:
+                return
+            frontier = next_frontier
+            depth += 1
+
+    async def crawl_all(self, seeds: Iterable[str]) -> dict[str, CrawledPaper]:
+        """Crawl the neighbourhood and return the papers keyed by their DOI."""
+        return {result.paper.doi: result async for result in self.crawl(seeds)}
+
+    async def __fetch_level(self, frontier: list[str]) -> AsyncIterator[PaperDetails]:
+        workers = asyncio.Semaphore(self.__workers)
+
+        async def fetch_batch(batch: list[str]) -> list[PaperDetails]:
+            async with workers:
+                return list(await self.__client.get_many(batch))
+
+        tasks = [
+            asyncio.ensure_future(fetch_batch(batch))
+            for batch in self.__batch(frontier, self.__batch_size)
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                for paper in await next_result:
+                    yield paper
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def __neighbours(self, paper: PaperDetails) -> Iterable[str]:
+        if self.__direction == "citations":
+            return paper.citations
+        if self.__direction == "references":
+            return paper.references
+        return itertools.chain(paper.citations, paper.references)
+
+    @staticmethod
+    def __unvisited(dois: Iterable[str], visited: set[str]) -> list[str]:
+        result = []
+        for doi in filter(bool, dois):
+            if (key := doi_key(doi)) not in visited:
+                visited.add(key)
+                result.append(doi)
+        return result
+
+    @staticmethod
+    def __batch(identifiers: list[str], batch_size: int) -> Iterable[list[str]]:
+        it = iter(identifiers)
+        while batch := list(itertools.islice(it, batch_size)):
+            yield batch
@@ -0,0 +1,194 @@
+import json
+import struct
+import sys
+from array import array
+from collections import Counter
+from os import PathLike
+from typing import Iterable
+
+from meta_paper.adapters import PaperDetails
+from meta_paper.adapters._doi_prefix import normalize_doi
+
+
+class CitationGraph:
+    """Immutable citation graph with compressed sparse row (CSR) adjacency.
+
+    DOIs are normalized and mapped to integer node ids. Outgoing edges point
+    from a citing paper to the papers it references; incoming edges are kept
+    in a second CSR structure so both directions are O(degree) lookups.
+    """
+
+    __MAGIC = b"MPCG\x01"
+    __HEADER_SIZE = struct.Struct("<Q")
+
+    def __init__(
+        self,
+        dois: list[str],
+        out_offsets: array,
+        out_targets: array,
+        in_offsets: array,
+        in_targets: array,
+    ) -> None:
+        self.__dois = dois
+        self.__ids = {doi: node_id for node_id, doi in enumerate(dois)}
+        self.__out_offsets = out_offsets
+        self.__out_targets = out_targets
+        self.__in_offsets = in_offsets
+        self.__in_targets = in_targets
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[PaperDetails]) -> "CitationGraph":
+        ids: dict[str, int] = {}
+        edges: set[tuple[int, int]] = set()
+
+        def node_id(doi: str) -> int:
+            doi = normalize_doi(doi)
+            if (result := ids.get(doi)) is None:
+                result = ids[doi] = len(ids)
+            return result
+
+        for paper in papers:
+            paper_id = node_id(paper.doi)
+            edges.update((paper_id, node_id(ref)) for ref in paper.references if ref)
+            edges.update(
+                (node_id(citer), paper_id) for citer in paper.citations if citer
+            )
+
+        node_count = len(ids)
+        out_offsets, out_targets = cls.__to_csr(node_count, sorted(edges))
+        in_offsets, in_targets = cls.__to_csr(
+            node_count, sorted((target, source) for source, target in edges)
+        )
+        return cls(list(ids), out_offsets, out_targets, in_offsets, in_targets)
+
+    def __len__(self) -> int:
+        return len(self.__dois)
+
+    def __contains__(self, doi: str) -> bool:
+        return normalize_doi(doi) in self.__ids
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.__out_targets)
+
+    @property
+    def dois(self) -> list[str]:
+        return list(self.__dois)
+
+    @property
+    def out_csr(self) -> tuple[array, array]:
+        """Offsets and targets of outgoing edges, usable with ``numpy.frombuffer``."""
+        return self.__out_offsets, self.__out_targets
+
+    @property
+    def in_csr(self) -> tuple[array, array]:
+        """Offsets and targets of incoming edges, usable with ``numpy.frombuffer``."""
+        return self.__in_offsets, self.__in_targets
+
+    def node_id(self, doi: str) -> int:
+        return self.__ids[normalize_doi(doi)]
+
+    def doi(self, node_id: int) -> str:
+        return self.__dois[node_id]
+
+    def references(self, doi: str) -> list[str]:
+        return [self.__dois[i] for i in self.__out_neighbours(self.node_id(doi))]
+
+    def citations(self, doi: str) -> list[str]:
+        return [self.__dois[i] for i in self.__in_neighbours(self.node_id(doi))]
+
+    def out_degree(self, doi: str) -> int:
+        node_id = self.node_id(doi)
+        return self.__out_offsets[node_id + 1] - self.__out_offsets[node_id]
+
+    def in_degree(self, doi: str) -> int:
+        node_id = self.node_id(doi)
+        return self.__in_offsets[node_id + 1] - self.__in_offsets[node_id]
+
+    def co_citation_count(self, first: str, second: str) -> int:
+        """Number of papers citing both ``first`` and ``second``."""
+        return len(
+            set(self.__in_neighbours(self.node_id(first))).intersection(
+                self.__in_neighbours(self.node_id(second))
+            )
+        )
+
+    def bibliographic_coupling(self, first: str, second: str) -> int:
+        """Number of references shared by ``first`` and ``second``."""
+        return len(
+            set(self.__out_neighbours(self.node_id(first))).intersection(
+                self.__out_neighbours(self.node_id(second))
+            )
+        )
+
+    def co_cited_with(self, doi: str, top: int | None = None) -> list[tuple[str, int]]:
+        """Papers cited together with ``doi``, most frequently co-cited first."""
+        node_id = self.node_id(doi)
+        counts = Counter(
+            other
+            for citer in self.__in_neighbours(node_id)
+            for other in self.__out_neighbours(citer)
+            if other != node_id
+        )
+        return [(self.__dois[other], count) for other, count in counts.most_common(top)]
+
+    def save(self, path: str | PathLike) -> None:
+        header = json.dumps(
+            {
+                "byteorder": sys.byteorder,
+                "dois": self.__dois,
+                "arrays": [[arr.typecode, len(arr)] for arr in self.__arrays()],
+            }
+        ).encode("utf-8")
+        with open(path, "wb") as graph_file:
+            graph_file.write(self.__MAGIC)
+            graph_file.write(self.__HEADER_SIZE.pack(len(header)))
+            graph_file.write(header)
+            for arr in self.__arrays():
+                arr.tofile(graph_file)
+
+    @classmethod
+    def load(cls, path: str | PathLike) -> "CitationGraph":
+        with open(path, "rb") as graph_file:
+            if graph_file.read(len(cls.__MAGIC)) != cls.__MAGIC:
+                raise ValueError(f"{path} is not a citation graph file")
+            (header_size,) = cls.__HEADER_SIZE.unpack(
+                graph_file.read(cls.__HEADER_SIZE.size)
+            )
+            header = json.loads(graph_file.read(header_size).decode("utf-8"))
+            arrays = []
+            for typecode, length in header["arrays"]:
+                arr = array(typecode)
+                arr.fromfile(graph_file, length)
+                if header["byteorder"] != sys.byteorder:
+                    arr.byteswap()
+                arrays.append(arr)
+        return cls(header["dois"], *arrays)
+
+    def __arrays(self) -> tuple[array, array, array, array]:
+        return (
+            self.__out_offsets,
+            self.__out_targets,
+            self.__in_offsets,
+            self.__in_targets,
+        )
+
+    def __out_neighbours(self, node_id: int) -> array:
+        offsets = self.__out_offsets
+        return self.__out_targets[offsets[node_id] : offsets[node_id + 1]]
+
+    def __in_neighbours(self, node_id: int) -> array:
+        offsets = self.__in_offsets
+        return self.__in_targets[offsets[node_id] : offsets[node_id + 1]]
+
+    @staticmethod
+    def __to_csr(
+        node_count: int, sorted_edges: list[tuple[int, int]]
+    ) -> tuple[array, array]:
+        offsets = array("q", bytes(8 * (node_count + 1)))
+        targets = array("i", (target for _, target in sorted_edges))
+        for source, _ in sorted_edges:
+            offsets[source + 1] += 1
+        for node_id in range(node_count):
+            offsets[node_id + 1] += offsets[node_id]
+        return offsets, targets
@@ -0,0 +1,16 @@
+from meta_paper.instrumentation._base import (
+    Attributes,
+    Instrumentation,
+    NullInstrumentation,
+)
+from meta_paper.instrumentation._memory import InMemoryCollector
+from meta_paper.instrumentation._opentelemetry import OpenTelemetryInstrumentation
+
+
+__all__ = [
+    "Attributes",
+    "InMemoryCollector",
+    "Instrumentation",
+    "NullInstrumentation",
+    "OpenTelemetryInstrumentation",
+]
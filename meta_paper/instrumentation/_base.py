@@ -0,0 +1,43 @@
+from contextlib import AbstractContextManager, nullcontext
+from typing import Mapping, MutableMapping, Protocol
+
+Attributes = Mapping[str, str | int | float | bool]
+
+# Names emitted by the client and the built-in adapters:
+#   durations: client.get_one, client.get_many, client.search, client.merge,
+#              provider.call, provider.batch, http.request
+#   counters:  cache.hit, cache.miss, http.retry, http.response.bytes,
+#              client.get_many.items, provider.batch.items
+# Attributes only carry low-cardinality values such as the provider name;
+# sizes are counted instead.
+
+
+class Instrumentation(Protocol):
+    def measure(
+        self, name: str, attributes: Attributes | None = None
+    ) -> AbstractContextManager[MutableMapping[str, str | int | float | bool]]:
+        """Time the wrapped block.
+
+        The yielded mapping holds the attributes recorded with the timing, so
+        callers can add details learnt inside the block, like a status code.
+        An ``error`` attribute names the exception which ended the block.
+        """
+        ...
+
+    def add(
+        self, name: str, value: float = 1, attributes: Attributes | None = None
+    ) -> None:
+        """Increase the counter ``name`` by ``value``."""
+        ...
+
+
+class NullInstrumentation(Instrumentation):
+    def measure(
+        self, name: str, attributes: Attributes | None = None
+    ) -> AbstractContextManager[MutableMapping[str, str | int | float | bool]]:
+        return nullcontext({})
+
+    def add(
+        self, name: str, value: float = 1, attributes: Attributes | None = None
+    ) -> None:
+        pass
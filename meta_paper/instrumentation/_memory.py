@@ -0,0 +1,108 @@
+import math
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, MutableMapping
+
+from meta_paper.instrumentation._base import Attributes, Instrumentation
+
+SeriesKey = tuple[str, tuple[tuple[str, str | int | float | bool], ...]]
+
+
+class InMemoryCollector(Instrumentation):
+    """Keep timings and counters in memory and report percentiles.
+
+    Each series, a name plus its attributes, keeps its last ``max_samples``
+    timings. Queries match every series carrying the given attributes.
+    """
+
+    def __init__(
+        self,
+        max_samples: int = 10_000,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.__max_samples = max(1, max_samples)
+        self.__clock = clock
+        self.__durations: dict[SeriesKey, deque[float]] = {}
+        self.__counters: dict[SeriesKey, float] = defaultdict(float)
+
+    @contextmanager
+    def measure(
+        self, name: str, attributes: Attributes | None = None
+    ) -> Iterator[MutableMapping[str, str | int | float | bool]]:
+        recorded = dict(attributes or {})
+        started_at = self.__clock()
+        try:
+            yield recorded
+        except BaseException as exc:
+            recorded["error"] = type(exc).__name__
+            raise
+        finally:
+            key = self.__key(name, recorded)
+            samples = self.__durations.get(key)
+            if samples is None:
+                samples = self.__durations[key] = deque(maxlen=self.__max_samples)
+            samples.append(self.__clock() - started_at)
+
+    def add(
+        self, name: str, value: float = 1, attributes: Attributes | None = None
+    ) -> None:
+        self.__counters[self.__key(name, attributes or {})] += value
+
+    def durations(self, name: str, **attributes) -> list[float]:
+        return [
+            sample
+            for key, samples in self.__durations.items()
+            if self.__matches(key, name, attributes)
+            for sample in samples
+        ]
+
+    def percentile(self, name: str, q: float, **attributes) -> float | None:
+        """Nearest-rank percentile for ``0 < q <= 1``, ``None`` without samples."""
+        if not 0 < q <= 1:
+            raise ValueError("percentile must be in (0, 1]")
+        samples = sorted(self.durations(name, **attributes))
+        if not samples:
+            return None
+        return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+    def counter(self, name: str, **attributes) -> float:
+        return sum(
+            value
+            for key, value in self.__counters.items()
+            if self.__matches(key, name, attributes)
+        )
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Count and latency percentiles per timing name, totals per counter."""
+        report = {}
+        for name in sorted({name for name, _ in self.__durations}):
+            samples = self.durations(name)
+            report[name] = {
+                "count": len(samples),
+                "mean": sum(samples) / len(samples),
+                "p50": self.percentile(name, 0.5),
+                "p90": self.percentile(name, 0.9),
+                "p99": self.percentile(name, 0.99),
+                "max": max(samples),
+            }
+        for name in sorted({name for name, _ in self.__counters}):
+            report[name] = {"total": self.counter(name)}
+        return report
+
+    def clear(self) -> None:
+        self.__durations.clear()
+        self.__counters.clear()
+
+    @staticmethod
+    def __key(name: str, attributes: Attributes) -> SeriesKey:
+        return name, tuple(sorted(attributes.items()))
+
+    @staticmethod
+    def __matches(key: SeriesKey, name: str, attributes: dict) -> bool:
+        if key[0] != name:
+            return False
+        series_attributes = dict(key[1])
+        return all(
+            series_attributes.get(attr) == value for attr, value in attributes.items()
+        )
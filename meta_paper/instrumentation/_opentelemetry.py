@@ -0,0 +1,59 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, MutableMapping
+
+from meta_paper.instrumentation._base import Attributes, Instrumentation
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Export timings as OpenTelemetry histograms and spans, counters as counters.
+
+    Requires ``opentelemetry-api`` (the ``opentelemetry`` extra); without a
+    configured SDK the global meter and tracer are no-ops.
+    """
+
+    def __init__(self, meter: Any = None, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetryInstrumentation needs the 'opentelemetry' extra"
+            ) from exc
+        self.__meter = meter or metrics.get_meter("meta_paper")
+        self.__tracer = tracer or trace.get_tracer("meta_paper")
+        self.__histograms: dict[str, Any] = {}
+        self.__counters: dict[str, Any] = {}
+
+    @contextmanager
+    def measure(
+        self, name: str, attributes: Attributes | None = None
+    ) -> Iterator[MutableMapping[str, str | int | float | bool]]:
+        recorded = dict(attributes or {})
+        started_at = time.perf_counter()
+        with self.__tracer.start_as_current_span(name) as span:
+            try:
+                yield recorded
+            except BaseException as exc:
+                recorded["error"] = type(exc).__name__
+                raise
+            finally:
+                span.set_attributes(recorded)
+                self.__histogram(name).record(
+                    time.perf_counter() - started_at, attributes=recorded
+                )
+
+    def add(
+        self, name: str, value: float = 1, attributes: Attributes | None = None
+    ) -> None:
+        counter = self.__counters.get(name)
+        if counter is None:
+            counter = self.__counters[name] = self.__meter.create_counter(name)
+        counter.add(value, attributes=dict(attributes or {}))
+
+    def __histogram(self, name: str) -> Any:
+        histogram = self.__histograms.get(name)
+        if histogram is None:
+            histogram = self.__histograms[name] = self.__meter.create_histogram(
+                name, unit="s"
+            )
+        return histogram
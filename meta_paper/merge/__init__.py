@@ -0,0 +1,12 @@
+from meta_paper.merge._merger import PaperDetailsMerger
+from meta_paper.merge._policies import AnyTrue, Longest, Maximum, MergePolicy, Union
+
+
+__all__ = [
+    "AnyTrue",
+    "Longest",
+    "Maximum",
+    "MergePolicy",
+    "PaperDetailsMerger",
+    "Union",
+]
@@ -0,0 +1,52 @@
+from dataclasses import fields
+from typing import Iterable, Mapping
+
+from meta_paper.adapters import PaperDetails
+from meta_paper.merge._policies import AnyTrue, Longest, Maximum, MergePolicy, Union
+
+
+class PaperDetailsMerger:
+    """Merge details about the same paper from several providers in one pass."""
+
+    __FIELD_NAMES = tuple(field.name for field in fields(PaperDetails))
+
+    def __init__(
+        self,
+        policies: Mapping[str, MergePolicy] | None = None,
+        sort_related: bool = False,
+    ) -> None:
+        self.__policies = {
+            "doi": Longest(),
+            "title": Longest(),
+            "authors": Union(),
+            "abstract": Longest(),
+            "source": Longest(),
+            "citations": Union(sort=sort_related),
+            "references": Union(sort=sort_related),
+            "url": Longest(),
+            "year": Maximum(),
+            "has_pdf": AnyTrue(),
+            "pdf_url": Longest(),
+        }
+        for name, policy in (policies or {}).items():
+            if name not in self.__policies:
+                raise ValueError(f"unknown paper details field '{name}'")
+            self.__policies[name] = policy
+
+    def merge(self, papers: Iterable[PaperDetails]) -> PaperDetails:
+        policies = [(name, self.__policies[name]) for name in self.__FIELD_NAMES]
+        states = [policy.start() for _, policy in policies]
+        merged_any = False
+        for paper in papers:
+            merged_any = True
+            for index, (name, policy) in enumerate(policies):
+                states[index] = policy.add(states[index], getattr(paper, name))
+        if not merged_any:
+            raise ValueError("no paper details to merge")
+
+        return PaperDetails(
+            **{
+                name: policy.finish(state)
+                for (name, policy), state in zip(policies, states)
+            }
+        )
@@ -0,0 +1,71 @@
+from typing import Any, Iterable, Protocol
+
+
+class MergePolicy(Protocol):
+    """Folds the values of one ``PaperDetails`` field into a merged value."""
+
+    def start(self) -> Any:
+        pass
+
+    def add(self, state: Any, value: Any) -> Any:
+        pass
+
+    def finish(self, state: Any) -> Any:
+        pass
+
+
+class Longest(MergePolicy):
+    """Keep the longest non-empty string."""
+
+    def start(self) -> str:
+        return ""
+
+    def add(self, state: str, value: str | None) -> str:
+        return value if value and len(value) > len(state) else state
+
+    def finish(self, state: str) -> str:
+        return state
+
+
+class Union(MergePolicy):
+    """Collect unique values in first-seen order, optionally sorted."""
+
+    def __init__(self, sort: bool = False) -> None:
+        self.__sort = sort
+
+    def start(self) -> dict:
+        return {}
+
+    def add(self, state: dict, value: Iterable[Any] | None) -> dict:
+        if value:
+            state.update(dict.fromkeys(value))
+        return state
+
+    def finish(self, state: dict) -> list:
+        return sorted(state) if self.__sort else list(state)
+
+
+class AnyTrue(MergePolicy):
+    """True when at least one value is truthy."""
+
+    def start(self) -> bool:
+        return False
+
+    def add(self, state: bool, value: Any) -> bool:
+        return state or bool(value)
+
+    def finish(self, state: bool) -> bool:
+        return state
+
+
+class Maximum(MergePolicy):
+    """Keep the largest value."""
+
+    def start(self) -> Any:
+        return None
+
+    def add(self, state: Any, value: Any) -> Any:
+        return value if state is None or value > state else state
+
+    def finish(self, state: Any) -> Any:
+        return state
@@ -1,4 +1,4 @@
-from meta_paper.search._params import QueryParameters
+from meta_paper.search._params import Pagination, QueryParameters
 
 
-__all__ = ["QueryParameters"]
+__all__ = ["Pagination", "QueryParameters"]
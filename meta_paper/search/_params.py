@@ -1,18 +1,81 @@
-from typing import Any
+from typing import Any, Literal, NamedTuple
 
 import httpx
 
 
+class Pagination(NamedTuple):
+    offset: int | None = None
+    limit: int | None = None
+    max_results: int | None = None
+
+
 class QueryParameters:
+    BULK_SORT_FIELDS = frozenset({"paperId", "publicationDate", "citationCount"})
+
     def __init__(self):
         self.__title = None
+        self.__offset = None
+        self.__limit = None
+        self.__max_results = None
+        self.__sort = None
+        self.__token = None
 
     def title(self, value: str) -> "QueryParameters":
         self.__title = value
         return self
 
+    def offset(self, value: int) -> "QueryParameters":
+        if value < 0:
+            raise ValueError("offset must not be negative")
+        self.__offset = value
+        return self
+
+    def limit(self, value: int) -> "QueryParameters":
+        if value < 1:
+            raise ValueError("limit must be positive")
+        self.__limit = value
+        return self
+
+    def max_results(self, value: int) -> "QueryParameters":
+        if value < 1:
+            raise ValueError("max_results must be positive")
+        self.__max_results = value
+        return self
+
+    def sort(
+        self, field: str, order: Literal["asc", "desc"] = "asc"
+    ) -> "QueryParameters":
+        if field not in self.BULK_SORT_FIELDS:
+            raise ValueError(f"cannot sort bulk search results by '{field}'")
+        if order not in ("asc", "desc"):
+            raise ValueError(f"unknown sort order '{order}'")
+        self.__sort = f"{field}:{order}"
+        return self
+
+    def continuation_token(self, value: str) -> "QueryParameters":
+        self.__token = value
+        return self
+
+    @property
+    def pagination(self) -> Pagination:
+        return Pagination(self.__offset, self.__limit, self.__max_results)
+
     def semantic_scholar(self) -> "Any":
         result = httpx.QueryParams()
         if self.__title:
             result = result.set("query", self.__title)
+        if self.__offset is not None:
+            result = result.set("offset", self.__offset)
+        if self.__limit is not None:
+            result = result.set("limit", self.__limit)
+        return result
+
+    def semantic_scholar_bulk(self) -> "Any":
+        result = httpx.QueryParams()
+        if self.__title:
+            result = result.set("query", self.__title)
+        if self.__sort:
+            result = result.set("sort", self.__sort)
+        if self.__token:
+            result = result.set("token", self.__token)
         return result
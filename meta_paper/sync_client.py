@@ -0,0 +1,145 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import suppress
+from concurrent.futures import Future
+from typing import Any, Coroutine, TypeVar
+
+from meta_paper.adapters import PaperDetails, PaperListing
+from meta_paper.client import PaperMetadataClient
+from meta_paper.search import QueryParameters
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class SyncPaperMetadataClient:
+    """Blocking facade over a ``PaperMetadataClient``.
+
+    The wrapped client runs on one event loop owned by a background thread,
+    so connection pools, caches and rate limiters stay warm across calls.
+    Methods may be called from any number of threads, but not from inside
+    coroutines running on the facade's own loop. The client must not have
+    been used on another event loop.
+    """
+
+    def __init__(self, client: PaperMetadataClient) -> None:
+        self.__client = client
+        self.__loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(
+            target=self.__run_loop, name="SyncPaperMetadataClient", daemon=True
+        )
+        # calls submitted before close are cancelled by it, later ones fail
+        self.__lock = threading.RLock()
+        self.__closed = False
+        self.__thread.start()
+
+    @property
+    def client(self) -> PaperMetadataClient:
+        return self.__client
+
+    def __enter__(self) -> "SyncPaperMetadataClient":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def get_one(
+        self,
+        doi: str,
+        fields: Iterable[str] | None = None,
+        timeout: float | None = None,
+    ) -> PaperDetails:
+        return self.__run(self.__client.get_one(doi, fields, timeout))
+
+    def get_many(
+        self, identifiers: Iterable[str], fields: Iterable[str] | None = None
+    ) -> list[PaperDetails]:
+        return self.__run(self.__get_many(list(identifiers or []), fields))
+
+    def search(self, query: QueryParameters) -> list[PaperListing]:
+        return self.__run(self.__client.search(query))
+
+    def map(
+        self,
+        identifiers: Iterable[str],
+        fields: Iterable[str] | None = None,
+        chunk_size: int = 500,
+        timeout: float | None = None,
+        max_pending_chunks: int = 4,
+    ) -> Iterator[PaperDetails]:
+        """Yield merged paper details as ``PaperMetadataClient.iter_many`` does.
+
+        Results are pulled one at a time, so a slow consumer holds back the
+        fetching of further chunks; closing the iterator early cancels the
+        remaining work.
+        """
+        results = self.__client.iter_many(
+            identifiers, chunk_size, timeout, fields, max_pending_chunks
+        )
+        try:
+            while (item := self.__run(self.__next(results))) is not _DONE:
+                yield item
+        finally:
+            with suppress(RuntimeError):
+                self.__run(results.aclose())
+
+    def close(self) -> None:
+        """Cancel pending calls, close the wrapped client and stop the loop."""
+        with self.__lock:
+            if self.__closed:
+                return
+            shutdown = self.__submit(self.__shutdown())
+            self.__closed = True
+        try:
+            shutdown.result()
+        finally:
+            self.__loop.call_soon_threadsafe(self.__loop.stop)
+            self.__thread.join()
+            self.__loop.close()
+
+    async def __shutdown(self) -> None:
+        pending = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await self.__client.aclose()
+        await self.__loop.shutdown_asyncgens()
+
+    async def __get_many(
+        self, identifiers: list[str], fields: Iterable[str] | None
+    ) -> list[PaperDetails]:
+        return list(await self.__client.get_many(identifiers, fields))
+
+    @staticmethod
+    async def __next(results: AsyncIterator[T]) -> T | object:
+        try:
+            return await results.__anext__()
+        except StopAsyncIteration:
+            return _DONE
+
+    def __run(self, coro: Coroutine[Any, Any, T]) -> T:
+        future = self.__submit(coro)
+        try:
+            return future.result()
+        except BaseException:
+            # e.g. KeyboardInterrupt while blocked; do not leave the call running
+            future.cancel()
+            raise
+
+    def __submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        if threading.current_thread() is self.__thread:
+            coro.close()
+            raise RuntimeError("blocking calls would deadlock the client's own loop")
+        with self.__lock:
+            if self.__closed:
+                coro.close()
+                raise RuntimeError("client is closed")
+            return asyncio.run_coroutine_threadsafe(coro, self.__loop)
+
+    def __run_loop(self) -> None:
+        asyncio.set_event_loop(self.__loop)
+        self.__loop.run_forever()
@@ -0,0 +1,23 @@
+import json
+
+import httpx
+import pytest
+
+from meta_paper.adapters import _json
+
+
+def test_backend_is_known():
+    assert _json.JSON_BACKEND in {"orjson", "msgspec", "json"}
+
+
+@pytest.mark.parametrize(
+    "data", [b'{"a": [1, null, "\\u00fc"]}', '{"a": [1, null, "ü"]}']
+)
+def test_loads_matches_stdlib(data):
+    assert _json.loads(data) == json.loads(data)
+
+
+def test_response_json_decodes_body():
+    response = httpx.Response(200, json={"data": [{"title": "t"}]})
+
+    assert _json.response_json(response) == {"data": [{"title": "t"}]}
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from meta_paper.adapters._json_stream import JSONArrayScanner, iter_json_array
+
+DOCUMENT = [
+    None,
+    {"a": [1, 2, {"b": 'x]"y'}]},
+    12345,
+    "str, with ] chars",
+    [],
+    True,
+    1.5e10,
+    {"ü": "日本"},
+]
+
+
+async def chunked(raw: bytes, size: int):
+    for i in range(0, len(raw), size):
+        yield raw[i : i + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16, 1024])
+async def test_iter_json_array_decodes_elements_across_chunk_boundaries(chunk_size):
+    raw = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode("utf-8")
+
+    actual = [value async for value in iter_json_array(chunked(raw, chunk_size))]
+
+    assert actual == DOCUMENT
+
+
+@pytest.mark.asyncio
+async def test_iter_json_array_handles_empty_array():
+    actual = [value async for value in iter_json_array(chunked(b" [ ] ", 1))]
+
+    assert actual == []
+
+
+def test_scanner_yields_elements_before_document_is_complete():
+    sut = JSONArrayScanner()
+
+    assert sut.feed('[{"a": 1}, {"b"') == [{"a": 1}]
+    assert sut.feed(": 2}, 3") == [{"b": 2}]
+    assert sut.feed("]", final=True) == [3]
+
+
+@pytest.mark.parametrize("document", ['{"a": 1}', "[1 2]", "[1,", "[1] 2", '[{"a": 1]'])
+def test_scanner_rejects_invalid_documents(document):
+    sut = JSONArrayScanner()
+
+    with pytest.raises(ValueError):
+        sut.feed(document, final=True)
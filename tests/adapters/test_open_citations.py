@@ -1,3 +1,4 @@
+import asyncio
 from http import HTTPStatus
 from unittest.mock import AsyncMock
 
@@ -6,6 +7,8 @@ import pytest
 from httpx import Response
 
 from meta_paper.adapters import OpenCitationsAdapter
+from meta_paper.concurrency import TokenBucket
+from meta_paper.instrumentation import InMemoryCollector
 
 
 @pytest.fixture
@@ -79,17 +82,19 @@ async def test_details_makes_expected_call_to_references_api(
     await sut.get_one(doi)
 
     assert len(request_handler.call_args_list) == 3
-    refs_request = request_handler.call_args_list[0].args[0]
-    assert refs_request.method == "GET"
-    assert refs_request.url.path == "/index/api/v2/references/doi:10.1234/5678"
-    assert refs_request.headers.get("Authorization") == expected_auth
+    requests = {
+        call.args[0].url.path: call.args[0] for call in request_handler.call_args_list
+    }
 
-    refs_request = request_handler.call_args_list[1].args[0]
+    refs_request = requests["/index/api/v2/references/doi:10.1234/5678"]
     assert refs_request.method == "GET"
-    assert refs_request.url.path == "/index/api/v2/citations/doi:10.1234/5678"
     assert refs_request.headers.get("Authorization") == expected_auth
 
-    meta_request = request_handler.call_args_list[2].args[0]
+    citations_request = requests["/index/api/v2/citations/doi:10.1234/5678"]
+    assert citations_request.method == "GET"
+    assert citations_request.headers.get("Authorization") == expected_auth
+
+    meta_request = requests["/oc/meta/api/v1/metadata/doi:10.1234/5678"]
     assert (
         str(meta_request.url)
         == "https://w3id.org/oc/meta/api/v1/metadata/doi:10.1234/5678"
@@ -112,7 +117,7 @@ async def test_details_raise_error_on_refs_error_re(
 
     assert err_wrapper.value is not None
     assert str(status_code) in str(err_wrapper.value)
-    assert len(request_handler.call_args_list) == 1
+    assert len(request_handler.call_args_list) == 3
 
 
 @pytest.mark.asyncio
@@ -136,3 +141,304 @@ async def test_details_raise_error_on_metadata_endpoint_error(
 async def test_search_returns_empty_search_results_list(sut, query_parameters):
     results = await sut.search(query_parameters)
     assert len(results) == 0
+
+
+@pytest.mark.asyncio
+async def test_details_fetches_related_and_metadata_concurrently(
+    request_handler_side_effect,
+):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return request_handler_side_effect(request)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=_handler))
+    sut = OpenCitationsAdapter(http_client)
+
+    result = await sut.get_one("10.1234/5678")
+
+    assert max_in_flight == 3
+    assert result.references == ["doi:10.1234/5678"]
+    assert result.citations == ["doi:10.1234/5678"]
+    assert result.title == "abc def"
+
+
+def oc_many_handler(known_dois, failing_related=()):
+    def __handler(request):
+        path = request.url.path
+        if path.startswith("/oc/meta/api/v1/metadata/"):
+            requested = path.removeprefix("/oc/meta/api/v1/metadata/").split("__")
+            return Response(
+                200,
+                json=[
+                    {
+                        "id": f"{doi} omid:br/0601",
+                        "title": f"title {doi}",
+                        "authors": "name surname",
+                        "pub_date": "2020-01-01",
+                    }
+                    for doi in requested
+                    if doi in known_dois
+                ],
+            )
+        relation_type, doi = path.removeprefix("/index/api/v2/").split("/", 1)
+        if doi in failing_related:
+            return Response(404)
+        attr = "cited" if relation_type == "references" else "citing"
+        return Response(200, json=[{attr: "doi:10.9999/1"}])
+
+    return __handler
+
+
+@pytest.mark.asyncio
+async def test_get_many_batches_metadata_lookups():
+    dois = [f"doi:10.1234/{i}" for i in range(25)]
+    handler = AsyncMock(side_effect=oc_many_handler(set(dois)))
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=handler))
+    # the default limiter would pace these 52 requests over many seconds
+    sut = OpenCitationsAdapter(http_client, rate_limiter=TokenBucket(1000.0))
+
+    result = list(await sut.get_many(dois))
+
+    meta_paths = [
+        call.args[0].url.path
+        for call in handler.call_args_list
+        if call.args[0].url.path.startswith("/oc/meta")
+    ]
+    assert len(meta_paths) == 2
+    assert meta_paths[0].count("__") == OpenCitationsAdapter.META_BATCH_SIZE - 1
+    assert len(handler.call_args_list) == 2 + 2 * len(dois)
+    assert [paper.doi for paper in result] == dois
+    assert result[0].title == "title doi:10.1234/0"
+    assert result[0].year == 2020
+    assert result[0].references == ["doi:10.9999/1"]
+    assert result[0].citations == ["doi:10.9999/1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("identifiers", [None, [], [None], ["not a doi"]])
+async def test_get_many_does_not_call_api_without_valid_identifiers(
+    sut, request_handler, identifiers
+):
+    result = await sut.get_many(identifiers)
+
+    assert list(result) == []
+    assert len(request_handler.call_args_list) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_many_skips_unknown_and_failing_dois():
+    handler = AsyncMock(
+        side_effect=oc_many_handler(
+            {"doi:10.1234/1", "doi:10.1234/2"}, failing_related={"doi:10.1234/2"}
+        )
+    )
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=handler))
+    sut = OpenCitationsAdapter(http_client)
+
+    result = list(await sut.get_many(["10.1234/1", "10.1234/2", "10.1234/3"]))
+
+    assert [paper.doi for paper in result] == ["doi:10.1234/1"]
+
+
+@pytest.mark.asyncio
+async def test_get_many_fans_out_through_a_bounded_number_of_tasks():
+    dois = [f"doi:10.1234/{i}" for i in range(200)]
+    known = oc_many_handler(set(dois))
+    max_tasks = 0
+
+    def handler(request):
+        nonlocal max_tasks
+        max_tasks = max(max_tasks, len(asyncio.all_tasks()))
+        return known(request)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=handler))
+    sut = OpenCitationsAdapter(
+        http_client, max_concurrency=4, rate_limiter=TokenBucket(1000.0)
+    )
+
+    result = list(await sut.get_many(dois))
+
+    assert [paper.doi for paper in result] == dois
+    assert max_tasks <= 20
+
+
+@pytest.mark.asyncio
+async def test_get_many_raises_when_every_metadata_batch_fails():
+    handler = AsyncMock(return_value=Response(503))
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=handler))
+    sut = OpenCitationsAdapter(http_client)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await sut.get_many(["10.1234/1", "10.1234/2"])
+
+
+@pytest.mark.asyncio
+async def test_get_many_raises_when_every_related_lookup_fails():
+    handler = AsyncMock(
+        side_effect=oc_many_handler(
+            {"doi:10.1234/1", "doi:10.1234/2"},
+            failing_related={"doi:10.1234/1", "doi:10.1234/2"},
+        )
+    )
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=handler))
+    sut = OpenCitationsAdapter(http_client)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await sut.get_many(["10.1234/1", "10.1234/2"])
+
+
+@pytest.mark.asyncio
+async def test_get_many_retries_queued_batches_within_budget(monkeypatch):
+    # a shortened budget, which every batch outlasts while queued for a token
+    retrying = OpenCitationsAdapter._OpenCitationsAdapter__get_metadata_records.retry
+    monkeypatch.setattr(retrying.stop, "max_delay", 0.5)
+    dois = [f"doi:10.1234/{i}" for i in range(3 * OpenCitationsAdapter.META_BATCH_SIZE)]
+    metadata_requests = 0
+    known = oc_many_handler(set(dois))
+
+    def handler(request):
+        nonlocal metadata_requests
+        metadata_requests += 1
+        if metadata_requests == 3:
+            return Response(429)
+        return known(request)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=handler))
+    sut = OpenCitationsAdapter(http_client, rate_limiter=TokenBucket(2, 1))
+
+    result = list(await sut.get_many(dois, fields=["title"]))
+
+    assert metadata_requests == 4
+    assert len(result) == len(dois)
+
+
+def test_default_rate_limit_bursts_at_most_one_second_of_requests():
+    rate, burst = OpenCitationsAdapter.RATE_LIMIT
+
+    assert rate * 60 <= 180
+    assert burst <= rate
+
+
+@pytest.mark.asyncio
+async def test_requests_acquire_rate_limiter_tokens(http_client):
+    class RecordingRateLimiter:
+        acquired = 0
+
+        async def acquire(self, tokens=1):
+            self.acquired += tokens
+
+    rate_limiter = RecordingRateLimiter()
+    sut = OpenCitationsAdapter(http_client, rate_limiter=rate_limiter)
+
+    await sut.get_one("10.1234/5678")
+
+    assert rate_limiter.acquired == 3
+
+
+@pytest.mark.asyncio
+async def test_details_coalesces_concurrent_lookups(sut, request_handler):
+    results = await asyncio.gather(
+        sut.get_one("10.1234/5678"), sut.get_one("doi:10.1234/5678")
+    )
+
+    assert len(request_handler.call_args_list) == 3
+    assert results[0] == results[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fields,expected_paths",
+    [
+        (["title"], {"/oc/meta/api/v1/metadata/doi:10.1234/5678"}),
+        (
+            ["title", "citations"],
+            {
+                "/oc/meta/api/v1/metadata/doi:10.1234/5678",
+                "/index/api/v2/citations/doi:10.1234/5678",
+            },
+        ),
+    ],
+)
+async def test_details_skips_unselected_related_calls(
+    sut, request_handler, fields, expected_paths
+):
+    result = await sut.get_one("10.1234/5678", fields=fields)
+
+    paths = {call.args[0].url.path for call in request_handler.call_args_list}
+    assert paths == expected_paths
+    assert result.title == "abc def"
+    assert result.references == []
+
+
+@pytest.mark.asyncio
+async def test_get_many_skips_unselected_related_calls():
+    handler = AsyncMock(side_effect=oc_many_handler({"doi:10.1234/1"}))
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=handler))
+    sut = OpenCitationsAdapter(http_client)
+
+    result = list(await sut.get_many(["10.1234/1"], fields=["title", "year"]))
+
+    assert len(handler.call_args_list) == 1
+    assert result[0].title == "title doi:10.1234/1"
+    assert result[0].citations == []
+    assert result[0].authors == []
+    assert result[0].url == ""
+
+
+@pytest.mark.asyncio
+async def test_get_many_skips_metadata_calls_without_metadata_fields():
+    handler = AsyncMock(side_effect=oc_many_handler(set()))
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=handler))
+    sut = OpenCitationsAdapter(http_client)
+
+    result = list(await sut.get_many(["10.1234/1"], fields=["citations"]))
+
+    paths = [call.args[0].url.path for call in handler.call_args_list]
+    assert paths == ["/index/api/v2/citations/doi:10.1234/1"]
+    assert [paper.doi for paper in result] == ["doi:10.1234/1"]
+    assert result[0].citations == ["doi:10.9999/1"]
+    assert result[0].title == ""
+
+
+@pytest.mark.asyncio
+async def test_details_skips_metadata_call_without_metadata_fields(
+    sut, request_handler
+):
+    result = await sut.get_one("10.1234/5678", fields=["citations"])
+
+    paths = {call.args[0].url.path for call in request_handler.call_args_list}
+    assert paths == {"/index/api/v2/citations/doi:10.1234/5678"}
+    assert result.citations == ["doi:10.1234/5678"]
+    assert result.title == ""
+    assert result.authors == []
+
+
+@pytest.mark.asyncio
+async def test_details_reports_requests_and_retries(request_handler_side_effect):
+    responses = iter([Response(429)])
+    bodies = []
+
+    def _handler(request):
+        response = request_handler_side_effect(request)
+        if "/references/" in request.url.path:
+            response = next(responses, None) or response
+        bodies.append(response.content)
+        return Response(response.status_code, stream=httpx.ByteStream(response.content))
+
+    collector = InMemoryCollector()
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=_handler))
+    sut = OpenCitationsAdapter(http_client, instrumentation=collector)
+
+    await sut.get_one("10.1234/5678")
+
+    assert collector.counter("http.retry", provider="OpenCitationsAdapter") == 1
+    assert len(collector.durations("http.request", status=429)) == 1
+    assert len(collector.durations("http.request", status=200)) >= 3
+    assert collector.counter("http.response.bytes") == sum(map(len, bodies))
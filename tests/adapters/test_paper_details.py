@@ -0,0 +1,94 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from meta_paper.adapters import (
+    PAPER_DETAIL_FIELDS,
+    FrozenPaperDetails,
+    FrozenPaperListing,
+    PaperDetails,
+    PaperListing,
+    select_fields,
+)
+
+
+def new_details(doi="10.1234/5678", citations=None, references=None):
+    return PaperDetails(
+        doi,
+        "title",
+        ["author"],
+        "abstract",
+        "venue",
+        citations if citations is not None else ["10.1/a"],
+        references if references is not None else ["10.1/b"],
+        "url",
+        2020,
+    )
+
+
+@pytest.mark.parametrize("cls", [PaperDetails, PaperListing])
+def test_instances_have_no_dict(cls):
+    instance = new_details() if cls is PaperDetails else PaperListing("d", "t", [])
+
+    assert not hasattr(instance, "__dict__")
+
+
+def test_related_dois_are_interned_across_instances():
+    first = new_details(citations=["".join(["10.1/", "abc"])])
+    second = new_details(references=["".join(["10.1/", "abc"])])
+
+    assert first.citations[0] is second.references[0]
+
+
+def test_paper_doi_is_interned():
+    first = PaperListing("".join(["10.1/", "x"]), "t", [])
+    second = new_details(doi="".join(["10.1/", "x"]))
+
+    assert first.doi is second.doi
+
+
+def test_freeze_returns_immutable_copy():
+    paper = new_details()
+
+    frozen = paper.freeze()
+
+    assert isinstance(frozen, FrozenPaperDetails)
+    assert frozen.citations == tuple(paper.citations)
+    assert frozen.authors == ("author",)
+    assert hash(frozen) == hash(paper)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.title = "other"
+
+
+def test_freeze_listing_returns_immutable_copy():
+    frozen = PaperListing("10.1/x", "t", ["a"]).freeze()
+
+    assert frozen == FrozenPaperListing("10.1/x", "t", ("a",))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.doi = "other"
+
+
+@pytest.mark.parametrize("paper", [new_details(), new_details().freeze()])
+def test_papers_can_be_pickled(paper):
+    assert pickle.loads(pickle.dumps(paper)) == paper
+
+
+@pytest.mark.parametrize(
+    "requested,expected",
+    [
+        (None, set(PAPER_DETAIL_FIELDS)),
+        ([], {"doi"}),
+        ("title", {"doi", "title"}),
+        (["title", "citations"], {"doi", "title", "citations"}),
+    ],
+)
+def test_select_fields(requested, expected):
+    assert select_fields(requested) == expected
+
+
+def test_select_fields_rejects_unknown_fields():
+    with pytest.raises(ValueError) as err_wrapper:
+        select_fields(["title", "bogus"])
+
+    assert "bogus" in str(err_wrapper.value)
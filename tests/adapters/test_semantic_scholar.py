@@ -1,4 +1,7 @@
+import asyncio
+import gzip
 import json
+import sys
 from http import HTTPStatus
 from unittest.mock import AsyncMock
 
@@ -7,10 +10,11 @@ import pytest
 from httpx import HTTPStatusError
 
 from meta_paper.adapters._semantic_scholar import SemanticScholarAdapter
+from meta_paper.instrumentation import InMemoryCollector
 from meta_paper.search import QueryParameters
 
 
-EXPECTED_PAPER_DETAIL_FIELDS = "externalIds,title,authors,publicationVenue,citations.externalIds,references.externalIds,abstract,isOpenAccess,openAccessPdf,url,year"
+EXPECTED_PAPER_DETAIL_FIELDS = "externalIds,title,authors,publicationVenue,citations.externalIds,citationCount,references.externalIds,referenceCount,abstract,isOpenAccess,openAccessPdf,url,year"
 
 
 def new_detail(remove=None, **kwargs):
@@ -504,3 +508,520 @@ async def test_get_many_handles_none_returns(sut, request_handler):
 
     assert len(result) == 1
     assert result[0].doi == "DOI:789/123"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [1, 2, 3])
+async def test_get_many_dispatches_batches_concurrently_in_order(max_concurrency):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _handler(req):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        ids = json.loads(req.content)["ids"]
+        # later batches answer first
+        await asyncio.sleep(0.01 * (10 - int(ids[0].split("/")[1]) // 500))
+        in_flight -= 1
+        return httpx.Response(
+            200, json=[new_detail(externalIds={"DOI": doi[4:]}) for doi in ids]
+        )
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=_handler))
+    sut = SemanticScholarAdapter(http_client, max_concurrency=max_concurrency)
+    dois = [f"10.1234/{i}" for i in range(1500)]
+
+    result = list(await sut.get_many(dois))
+
+    assert max_in_flight == max_concurrency
+    assert [paper.doi for paper in result] == [f"DOI:{doi}" for doi in dois]
+
+
+@pytest.mark.asyncio
+async def test_get_many_cancels_remaining_batches_when_one_fails():
+    requests = 0
+
+    async def _handler(req):
+        nonlocal requests
+        requests += 1
+        ids = json.loads(req.content)["ids"]
+        if ids[0] == "DOI:10.1234/0":
+            return httpx.Response(400)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[])
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler=_handler))
+    sut = SemanticScholarAdapter(http_client, max_concurrency=1)
+    dois = [f"10.1234/{i}" for i in range(2000)]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await sut.get_many(dois)
+    sent = requests
+    await asyncio.sleep(0.2)
+
+    assert requests == sent < 4
+
+
+class RecordingRateLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    async def acquire(self, tokens=1):
+        self.acquired += tokens
+
+
+@pytest.mark.parametrize(
+    "auth_token,expected_rate", [(None, 10), ("abc", 1)], indirect=["auth_token"]
+)
+def test_init_configures_rate_limit_from_api_key(sut, expected_rate):
+    assert sut.rate_limiter.rate == expected_rate
+
+
+@pytest.mark.asyncio
+async def test_requests_acquire_rate_limiter_tokens(http_client):
+    rate_limiter = RecordingRateLimiter()
+    sut = SemanticScholarAdapter(http_client, rate_limiter=rate_limiter)
+
+    await sut.get_one("123/456")
+    await sut.get_many(["123/456"])
+    await sut.search(QueryParameters())
+
+    assert rate_limiter.acquired == 3
+
+
+@pytest.mark.asyncio
+async def test_details_coalesces_concurrent_lookups(sut, request_handler):
+    results = await asyncio.gather(
+        sut.get_one("123/456"), sut.get_one("DOI:123/456"), sut.get_one("doi:123/456")
+    )
+
+    assert len(request_handler.call_args_list) == 1
+    assert results[0] == results[1] == results[2]
+
+
+def search_page_handler(total_hits, include_total=True, delays=None):
+    async def _handler(req):
+        offset = int(req.url.params["offset"])
+        limit = int(req.url.params["limit"])
+        await asyncio.sleep((delays or {}).get(offset, 0))
+        end = min(offset + limit, total_hits)
+        page = {
+            "offset": offset,
+            "data": [
+                {
+                    "title": f"title {i}",
+                    "authors": [{"name": "author"}],
+                    "externalIds": {"DOI": f"10.1/{i}"},
+                }
+                for i in range(offset, end)
+            ],
+        }
+        if include_total:
+            page["total"] = total_hits
+        if end < total_hits:
+            page["next"] = end
+        return httpx.Response(200, json=page)
+
+    return AsyncMock(side_effect=_handler)
+
+
+def new_search_adapter(handler):
+    return SemanticScholarAdapter(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler=handler)),
+        rate_limiter=RecordingRateLimiter(),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("include_total", [True, False])
+async def test_iter_search_pages_through_results_in_order(include_total):
+    handler = search_page_handler(250, include_total, delays={0: 0.02, 100: 0.01})
+    sut = new_search_adapter(handler)
+
+    results = [listing.doi async for listing in sut.iter_search(QueryParameters())]
+
+    assert results == [f"10.1/{i}" for i in range(250)]
+    offsets = sorted(
+        int(call.args[0].url.params["offset"]) for call in handler.call_args_list
+    )
+    assert offsets == [0, 100, 200]
+
+
+@pytest.mark.asyncio
+async def test_iter_search_stops_at_max_results():
+    handler = search_page_handler(5000)
+    sut = new_search_adapter(handler)
+
+    results = await sut.search(QueryParameters().offset(50).limit(20).max_results(45))
+
+    assert [listing.doi for listing in results] == [f"10.1/{i}" for i in range(50, 95)]
+    limits = sorted(
+        (int(call.args[0].url.params["offset"]), int(call.args[0].url.params["limit"]))
+        for call in handler.call_args_list
+    )
+    assert limits == [(50, 20), (70, 20), (90, 5)]
+
+
+@pytest.mark.asyncio
+async def test_iter_search_stops_at_relevance_search_cap():
+    handler = search_page_handler(5000)
+    sut = new_search_adapter(handler)
+
+    results = await sut.search(QueryParameters())
+
+    assert len(results) == 1000
+    assert len(handler.call_args_list) == 10
+
+
+def bulk_search_handler(pages):
+    def _handler(req):
+        page_index = int(req.url.params.get("token", "0"))
+        page = {
+            "data": [
+                {
+                    "title": f"title {doi}",
+                    "authors": [{"name": "author"}],
+                    "externalIds": {"DOI": doi},
+                }
+                for doi in pages[page_index]
+            ]
+        }
+        if page_index + 1 < len(pages):
+            page["token"] = str(page_index + 1)
+        return httpx.Response(200, json=page)
+
+    return AsyncMock(side_effect=_handler)
+
+
+@pytest.mark.asyncio
+async def test_iter_bulk_search_follows_continuation_tokens():
+    handler = bulk_search_handler([["10.1/1", "10.1/2"], ["10.1/3"], ["10.1/4"]])
+    sut = new_search_adapter(handler)
+    query = QueryParameters().title("abc").sort("publicationDate", "desc")
+
+    results = [listing.doi async for listing in sut.iter_bulk_search(query)]
+
+    assert results == ["10.1/1", "10.1/2", "10.1/3", "10.1/4"]
+    requests = [call.args[0] for call in handler.call_args_list]
+    assert [req.url.path for req in requests] == ["/graph/v1/paper/search/bulk"] * 3
+    assert [req.url.params.get("token") for req in requests] == [None, "1", "2"]
+    assert all(req.url.params["sort"] == "publicationDate:desc" for req in requests)
+    assert all(req.url.params["query"] == "abc" for req in requests)
+
+
+@pytest.mark.asyncio
+async def test_iter_bulk_search_stops_at_max_results():
+    handler = bulk_search_handler([["10.1/1", "10.1/2"], ["10.1/3", "10.1/4"], []])
+    sut = new_search_adapter(handler)
+
+    results = [
+        listing.doi
+        async for listing in sut.iter_bulk_search(QueryParameters().max_results(3))
+    ]
+
+    assert results == ["10.1/1", "10.1/2", "10.1/3"]
+    assert len(handler.call_args_list) == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_bulk_search_resumes_from_continuation_token():
+    handler = bulk_search_handler([["10.1/1"], ["10.1/2"]])
+    sut = new_search_adapter(handler)
+
+    results = [
+        listing.doi
+        async for listing in sut.iter_bulk_search(
+            QueryParameters().continuation_token("1")
+        )
+    ]
+
+    assert results == ["10.1/2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fields,expected_param",
+    [
+        (["title", "year"], "externalIds,title,year"),
+        (["citations"], "externalIds,citations.externalIds,citationCount"),
+        ("doi", "externalIds"),
+    ],
+)
+async def test_details_requests_only_selected_fields(
+    sut, request_handler, fields, expected_param
+):
+    await sut.get_one("123/456", fields=fields)
+    await sut.get_many(["123/456"], fields=fields)
+
+    for call in request_handler.call_args_list:
+        assert call.args[0].url.params.get("fields") == expected_param
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "details_response",
+    [new_detail(remove=["title", "authors"])],
+    indirect=["details_response"],
+)
+async def test_details_does_not_require_unselected_fields(sut):
+    result = await sut.get_one("123/456", fields=["year", "references"])
+
+    assert result.doi == "DOI:234/567"
+    assert result.title == ""
+    assert result.authors == []
+    assert result.references == ["DOI:789/123"]
+
+
+@pytest.mark.asyncio
+async def test_details_rejects_unknown_fields(sut, request_handler):
+    with pytest.raises(ValueError):
+        await sut.get_one("123/456", fields=["title", "unknown"])
+
+    assert len(request_handler.call_args_list) == 0
+
+
+def truncated_detail(doi, citation_count, reference_count=1):
+    return new_detail(
+        paperId=f"id-{doi}",
+        externalIds={"DOI": doi},
+        citations=[{"externalIds": {"DOI": f"10.2/{i}"}} for i in range(1000)],
+        citationCount=citation_count,
+        references=[{"externalIds": {"DOI": "10.3/0"}}],
+        referenceCount=reference_count,
+    )
+
+
+def related_pages_handler(detail):
+    def _handler(req):
+        path = req.url.path
+        if req.method == "POST":
+            return httpx.Response(200, json=[detail])
+        if path.endswith("/citations"):
+            offset = int(req.url.params["offset"])
+            limit = int(req.url.params["limit"])
+            end = min(offset + limit, detail["citationCount"])
+            return httpx.Response(
+                200,
+                json={
+                    "offset": offset,
+                    "data": [
+                        {"citingPaper": {"externalIds": {"DOI": f"10.2/{i}"}}}
+                        for i in range(offset, end)
+                    ],
+                },
+            )
+        return httpx.Response(200, json=detail)
+
+    return AsyncMock(side_effect=_handler)
+
+
+@pytest.mark.asyncio
+async def test_details_pages_truncated_citations():
+    handler = related_pages_handler(truncated_detail("10.1/1", 2500))
+    sut = new_search_adapter(handler)
+
+    result = await sut.get_one("10.1/1")
+
+    assert result.citations == [f"DOI:10.2/{i}" for i in range(2500)]
+    assert result.references == ["DOI:10.3/0"]
+    page_requests = [
+        call.args[0]
+        for call in handler.call_args_list
+        if call.args[0].url.path.endswith("/citations")
+    ]
+    assert {req.url.path for req in page_requests} == {
+        "/graph/v1/paper/id-10.1/1/citations"
+    }
+    assert sorted(int(req.url.params["offset"]) for req in page_requests) == [
+        0,
+        1000,
+        2000,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_details_stops_paging_citations_after_a_failed_page():
+    pages = related_pages_handler(truncated_detail("10.1/1", 6000))
+    page_requests = 0
+
+    async def _handler(req):
+        nonlocal page_requests
+        if not req.url.path.endswith("/citations"):
+            return await pages(req)
+        page_requests += 1
+        if req.url.params["offset"] == "0":
+            return httpx.Response(400)
+        await asyncio.sleep(0.05)
+        return await pages(req)
+
+    sut = SemanticScholarAdapter(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler=_handler)),
+        max_concurrency=1,
+        rate_limiter=RecordingRateLimiter(),
+    )
+
+    result = await sut.get_one("10.1/1")
+    sent = page_requests
+    await asyncio.sleep(0.3)
+
+    assert len(result.citations) == 1000
+    assert page_requests == sent < 6
+
+
+@pytest.mark.asyncio
+async def test_details_interns_paged_citations():
+    handler = related_pages_handler(truncated_detail("10.1/1", 1500))
+    sut = new_search_adapter(handler)
+
+    interned = [sys.intern("".join(["DOI:10.2/", str(i)])) for i in range(1500)]
+
+    result = await sut.get_one("10.1/1")
+
+    assert all(doi is known for doi, known in zip(result.citations, interned))
+
+
+@pytest.mark.asyncio
+async def test_get_many_pages_truncated_citations():
+    handler = related_pages_handler(truncated_detail("10.1/1", 1500))
+    sut = new_search_adapter(handler)
+
+    result = list(await sut.get_many(["10.1/1"]))
+
+    assert len(result[0].citations) == 1500
+    assert len(handler.call_args_list) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("citation_count", [1000, 999])
+async def test_details_does_not_page_complete_lists(citation_count):
+    handler = related_pages_handler(truncated_detail("10.1/1", citation_count))
+    sut = new_search_adapter(handler)
+
+    result = await sut.get_one("10.1/1")
+
+    assert len(result.citations) == 1000
+    assert len(handler.call_args_list) == 1
+
+
+@pytest.mark.asyncio
+async def test_details_does_not_page_when_disabled():
+    handler = related_pages_handler(truncated_detail("10.1/1", 2500))
+    sut = SemanticScholarAdapter(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler=handler)),
+        page_related=False,
+    )
+
+    result = await sut.get_one("10.1/1")
+
+    assert len(result.citations) == 1000
+    assert len(handler.call_args_list) == 1
+    assert "citationCount" not in handler.call_args_list[0].args[0].url.params["fields"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status_code",
+    [code for code in HTTPStatus if code >= 400 and code not in {429, 504}],
+)
+async def test_get_many_raises_exception_on_endpoint_error_response(
+    sut, batch_response, status_code
+):
+    batch_response.status_code = status_code
+
+    with pytest.raises(HTTPStatusError) as exc_wrapper:
+        await sut.get_many(["123/456"])
+
+    assert str(status_code) in str(exc_wrapper.value)
+
+
+@pytest.mark.asyncio
+async def test_get_many_streams_batch_response():
+    details = [new_detail(externalIds={"DOI": f"10.1/{i}"}) for i in range(50)]
+    body = json.dumps(details).encode("utf-8")
+
+    class ChunkedStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            for i in range(0, len(body), 97):
+                yield body[i : i + 97]
+
+    def _handler(req):
+        return httpx.Response(200, stream=ChunkedStream())
+
+    sut = SemanticScholarAdapter(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler=_handler))
+    )
+
+    result = list(await sut.get_many([f"10.1/{i}" for i in range(50)]))
+
+    assert [paper.doi for paper in result] == [f"DOI:10.1/{i}" for i in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_get_many_streams_batches_by_default(http_client, monkeypatch):
+    def whole_body_loads(data):
+        raise AssertionError("batch body decoded at once")
+
+    monkeypatch.setattr("meta_paper.adapters._semantic_scholar.loads", whole_body_loads)
+    sut = SemanticScholarAdapter(http_client)
+
+    result = list(await sut.get_many(["234/567"]))
+
+    assert [paper.doi for paper in result] == ["DOI:234/567"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream_batches", [True, False])
+async def test_get_many_decodes_batches_with_either_strategy(
+    http_client, stream_batches
+):
+    sut = SemanticScholarAdapter(http_client, stream_batches=stream_batches)
+
+    result = list(await sut.get_many(["234/567"]))
+
+    assert [paper.doi for paper in result] == ["DOI:234/567"]
+    assert result[0].references == ["DOI:789/123"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream_batches", [True, False])
+async def test_get_many_reports_batches_and_transferred_bytes(stream_batches):
+    body = json.dumps([new_detail()]).encode("utf-8")
+
+    def _handler(req):
+        return httpx.Response(200, stream=httpx.ByteStream(body))
+
+    collector = InMemoryCollector()
+    sut = SemanticScholarAdapter(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler=_handler)),
+        stream_batches=stream_batches,
+        instrumentation=collector,
+    )
+
+    await sut.get_many(["234/567"])
+
+    assert len(collector.durations("provider.batch")) == 1
+    assert collector.counter("provider.batch.items") == 1
+    assert len(collector.durations("http.request", method="POST", status=200)) == 1
+    assert collector.counter("http.response.bytes") == len(body)
+
+
+@pytest.mark.asyncio
+async def test_get_one_reports_transferred_bytes_before_decompression():
+    body = gzip.compress(json.dumps(new_detail()).encode("utf-8"))
+
+    def _handler(req):
+        return httpx.Response(
+            200, headers={"content-encoding": "gzip"}, stream=httpx.ByteStream(body)
+        )
+
+    collector = InMemoryCollector()
+    sut = SemanticScholarAdapter(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler=_handler)),
+        page_related=False,
+        instrumentation=collector,
+    )
+
+    await sut.get_one("234/567")
+
+    assert collector.counter("http.response.bytes") == len(body)
@@ -0,0 +1,128 @@
+import asyncio
+import functools
+import time
+
+import pytest
+
+from meta_paper.adapters import PaperDetails, PaperMetadataAdapter
+from meta_paper.bulk import BulkResolver
+from meta_paper.client import PaperMetadataClient
+from meta_paper.search import QueryParameters
+
+
+class ShardProvider(PaperMetadataAdapter):
+    def __init__(self, rate_limiter=None, slow_doi=None):
+        self.__rate_limiter = rate_limiter
+        self.__slow_doi = slow_doi
+
+    async def search(self, query: QueryParameters):
+        return []
+
+    async def get_one(self, doi: str) -> PaperDetails:
+        raise NotImplementedError
+
+    async def get_many(self, identifiers, fields=None):
+        identifiers = list(identifiers)
+        if self.__rate_limiter is not None:
+            await self.__rate_limiter.acquire()
+        if self.__slow_doi in identifiers:
+            await asyncio.sleep(0.3)
+        return [
+            PaperDetails(f"DOI:{doi}", "t", ["a"], "", "", [], [], "", 2025)
+            for doi in identifiers
+            if "missing" not in doi
+        ]
+
+
+def shard_client_factory(rate_limiters, slow_doi=None):
+    return PaperMetadataClient().use_custom_provider(
+        ShardProvider(rate_limiters.get("stub"), slow_doi)
+    )
+
+
+DOIS = [f"10.1/{i}" for i in range(10)]
+
+
+def test_resolve_yields_merged_details_in_input_order():
+    sut = BulkResolver(
+        functools.partial(shard_client_factory, slow_doi="10.1/0"),
+        rate_limits={},
+        processes=2,
+        shard_size=2,
+    )
+
+    results = list(sut.resolve(DOIS))
+
+    assert [paper.doi for paper in results] == [f"DOI:{doi}" for doi in DOIS]
+
+
+def test_resolve_unordered_yields_shards_as_they_finish():
+    sut = BulkResolver(
+        functools.partial(shard_client_factory, slow_doi="10.1/0"),
+        rate_limits={},
+        processes=2,
+        shard_size=2,
+    )
+
+    results = [paper.doi for paper in sut.resolve(DOIS, ordered=False)]
+
+    assert sorted(results) == sorted(f"DOI:{doi}" for doi in DOIS)
+    assert results[-2:] == ["DOI:10.1/0", "DOI:10.1/1"]
+
+
+def test_resolve_buffers_no_more_than_the_pending_window_behind_a_slow_shard():
+    read = 0
+
+    def identifiers():
+        nonlocal read
+        for i in range(50):
+            read += 1
+            yield f"10.1/{i}"
+
+    sut = BulkResolver(
+        functools.partial(shard_client_factory, slow_doi="10.1/0"),
+        rate_limits={},
+        processes=2,
+        shard_size=1,
+        max_pending_shards=3,
+    )
+
+    results = sut.resolve(identifiers())
+    first = next(results)
+    read_before_first = read
+    rest = list(results)
+
+    assert first.doi == "DOI:10.1/0"
+    assert read_before_first <= 3
+    assert len(rest) == 49
+
+
+def test_resolve_skips_unknown_dois():
+    sut = BulkResolver(shard_client_factory, rate_limits={}, processes=1)
+
+    results = list(sut.resolve(["10.1/1", "10.1/missing", "", "10.1/2"]))
+
+    assert [paper.doi for paper in results] == ["DOI:10.1/1", "DOI:10.1/2"]
+
+
+def test_resolve_shares_rate_limit_across_processes():
+    sut = BulkResolver(
+        shard_client_factory,
+        rate_limits={"stub": (20.0, 1.0)},
+        processes=4,
+        shard_size=1,
+    )
+
+    started = time.monotonic()
+    results = list(sut.resolve(DOIS))
+
+    assert len(results) == len(DOIS)
+    # one token up front, then 20 per second for the remaining 9 shards
+    assert time.monotonic() - started >= 0.4
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_resolve_handles_empty_input(ordered):
+    sut = BulkResolver(shard_client_factory, rate_limits={}, processes=1)
+
+    assert list(sut.resolve([], ordered=ordered)) == []
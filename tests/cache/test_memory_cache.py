@@ -0,0 +1,83 @@
+import pytest
+
+from meta_paper.cache import InMemoryCache, doi_key, search_key
+from meta_paper.search import QueryParameters
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def sut(clock):
+    return InMemoryCache(max_size=2, ttl=10, clock=clock)
+
+
+@pytest.mark.parametrize(
+    "doi", ["10.1234/ABC", "doi:10.1234/abc", "DOI:10.1234/abc", " dOi:10.1234/Abc "]
+)
+def test_doi_key_normalizes_doi(doi):
+    assert doi_key(doi) == "doi:10.1234/abc"
+
+
+def test_search_key_depends_on_query():
+    assert search_key(QueryParameters().title("a")) == search_key(
+        QueryParameters().title("a")
+    )
+    assert search_key(QueryParameters().title("a")) != search_key(
+        QueryParameters().title("b")
+    )
+
+
+def test_get_returns_none_on_miss(sut):
+    assert sut.get("provider", "key") is None
+
+
+def test_get_returns_stored_value(sut):
+    sut.set("provider", "key", "value")
+
+    assert sut.get("provider", "key") == "value"
+    assert sut.get("other provider", "key") is None
+
+
+def test_entries_expire_after_ttl(sut, clock):
+    sut.set("provider", "key", "value")
+    clock.now = 9.9
+    assert sut.get("provider", "key") == "value"
+
+    clock.now = 10
+    assert sut.get("provider", "key") is None
+    assert len(sut) == 0
+
+
+def test_per_entry_ttl_overrides_default(sut, clock):
+    sut.set("provider", "key", "value", ttl=100)
+    clock.now = 50
+
+    assert sut.get("provider", "key") == "value"
+
+
+def test_evicts_least_recently_used_entry(sut):
+    sut.set("provider", "a", 1)
+    sut.set("provider", "b", 2)
+    sut.get("provider", "a")
+    sut.set("provider", "c", 3)
+
+    assert sut.get("provider", "a") == 1
+    assert sut.get("provider", "b") is None
+    assert sut.get("provider", "c") == 3
+
+
+def test_get_many_returns_only_hits(sut):
+    sut.set_many("provider", {"a": 1, "b": 2})
+
+    assert sut.get_many("provider", ["a", "b", "c"]) == {"a": 1, "b": 2}
@@ -0,0 +1,96 @@
+import sqlite3
+
+import pytest
+
+from meta_paper.adapters import PaperDetails, PaperListing
+from meta_paper.cache import SQLiteCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "cache.sqlite3"
+
+
+@pytest.fixture
+def sut(db_path, clock):
+    cache = SQLiteCache(db_path, ttl=60, clock=clock)
+    yield cache
+    cache.close()
+
+
+def new_paper(doi):
+    return PaperDetails(
+        doi, "title", ["author"], "abstract", "venue", ["c"], ["r"], "url", 2020
+    )
+
+
+def test_uses_wal_journal_mode(sut, db_path):
+    with sqlite3.connect(db_path) as db:
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_round_trips_paper_details(sut):
+    sut.set("provider", "doi:10.1/a", new_paper("10.1/a"))
+
+    assert sut.get("provider", "doi:10.1/a") == new_paper("10.1/a")
+    assert sut.get("other", "doi:10.1/a") is None
+
+
+def test_round_trips_search_listings(sut):
+    listings = [PaperListing("10.1/a", "title", ["author"])]
+    sut.set("provider", "search:query=a", listings)
+
+    assert sut.get("provider", "search:query=a") == listings
+
+
+def test_get_many_returns_only_hits(sut):
+    sut.set_many("provider", {"a": new_paper("a"), "b": new_paper("b")})
+
+    actual = sut.get_many("provider", ["a", "b", "c"])
+
+    assert actual == {"a": new_paper("a"), "b": new_paper("b")}
+
+
+def test_get_many_handles_more_keys_than_query_variables(sut):
+    papers = {str(i): new_paper(str(i)) for i in range(2000)}
+    sut.set_many("provider", papers)
+
+    assert sut.get_many("provider", papers) == papers
+
+
+def test_entries_older_than_ttl_are_ignored(sut, clock):
+    sut.set("provider", "a", new_paper("a"))
+    assert sut.fetched_at("provider", "a") == 1000.0
+
+    clock.now += 60
+    assert sut.get("provider", "a") is None
+
+
+def test_entries_survive_reopening(db_path, clock):
+    first = SQLiteCache(db_path, clock=clock)
+    first.set("provider", "a", new_paper("a"))
+    first.close()
+
+    second = SQLiteCache(db_path, clock=clock)
+    try:
+        assert second.get("provider", "a") == new_paper("a")
+    finally:
+        second.close()
+
+
+def test_rejects_unsupported_values(sut):
+    with pytest.raises(TypeError):
+        sut.set("provider", "a", object())
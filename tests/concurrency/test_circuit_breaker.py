@@ -0,0 +1,116 @@
+import pytest
+
+from meta_paper.concurrency import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def new_breaker(clock, **kwargs):
+    options = dict(window=4, min_calls=4, reset_timeout=10.0, clock=clock)
+    options.update(kwargs)
+    return CircuitBreaker(**options)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"failure_rate": 0}, {"slow_call_rate": 1.5}, {"window": 0}],
+)
+def test_init_rejects_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)
+
+
+def test_stays_closed_until_min_calls_are_recorded(clock):
+    sut = new_breaker(clock)
+    for _ in range(3):
+        sut.record_failure(0.1)
+
+    assert sut.state == "closed"
+    assert sut.allow()
+
+
+def test_opens_when_failure_rate_is_reached(clock):
+    sut = new_breaker(clock, failure_rate=0.5)
+    for failed in (True, False, True, False):
+        (sut.record_failure if failed else sut.record_success)(0.1)
+
+    assert sut.state == "open"
+    assert not sut.allow()
+
+
+def test_opens_when_slow_call_rate_is_reached(clock):
+    sut = new_breaker(clock, slow_call_rate=0.75, slow_call_duration=1.0)
+    for seconds in (2.0, 2.0, 0.1, 2.0):
+        sut.record_success(seconds)
+
+    assert sut.state == "open"
+
+
+def test_abandoned_slow_calls_count_as_slow(clock):
+    sut = new_breaker(clock, slow_call_rate=1.0, slow_call_duration=1.0)
+    for _ in range(4):
+        sut.abandon(5.0)
+
+    assert sut.state == "open"
+
+
+def test_half_open_allows_limited_probes_after_reset_timeout(clock):
+    sut = new_breaker(clock, half_open_calls=1)
+    for _ in range(4):
+        sut.record_failure(0.1)
+
+    clock.now = 10.0
+
+    assert sut.state == "half_open"
+    assert sut.allow()
+    assert not sut.allow()
+
+
+def test_successful_probe_closes_circuit(clock):
+    sut = new_breaker(clock)
+    for _ in range(4):
+        sut.record_failure(0.1)
+    clock.now = 10.0
+    sut.allow()
+
+    sut.record_success(0.1)
+
+    assert sut.state == "closed"
+
+
+def test_failed_probe_reopens_circuit(clock):
+    sut = new_breaker(clock)
+    for _ in range(4):
+        sut.record_failure(0.1)
+    clock.now = 10.0
+    sut.allow()
+
+    sut.record_failure(0.1)
+
+    assert sut.state == "open"
+    clock.now = 15.0
+    assert not sut.allow()
+
+
+def test_abandoned_probe_is_given_back(clock):
+    sut = new_breaker(clock)
+    for _ in range(4):
+        sut.record_failure(0.1)
+    clock.now = 10.0
+    sut.allow()
+
+    sut.abandon(0.1)
+
+    assert sut.state == "half_open"
+    assert sut.allow()
@@ -0,0 +1,36 @@
+import pytest
+
+from meta_paper.concurrency import LatencyTracker
+
+
+def test_percentile_is_none_until_enough_samples():
+    sut = LatencyTracker(min_samples=3)
+    sut.record(0.1)
+    sut.record(0.2)
+
+    assert sut.percentile(0.5) is None
+
+
+def test_percentile_uses_nearest_rank():
+    sut = LatencyTracker(min_samples=1)
+    for ms in range(1, 101):
+        sut.record(ms / 1000)
+
+    assert sut.percentile(0.5) == 0.05
+    assert sut.percentile(0.95) == 0.095
+    assert sut.percentile(1) == 0.1
+
+
+def test_window_keeps_most_recent_samples():
+    sut = LatencyTracker(window=2, min_samples=1)
+    for seconds in (5.0, 0.1, 0.2):
+        sut.record(seconds)
+
+    assert len(sut) == 2
+    assert sut.percentile(1) == 0.2
+
+
+@pytest.mark.parametrize("q", [0, -0.1, 1.5])
+def test_percentile_rejects_out_of_range(q):
+    with pytest.raises(ValueError):
+        LatencyTracker().percentile(q)
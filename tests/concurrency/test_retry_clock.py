@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from tenacity import AsyncRetrying, RetryError, retry_if_exception_type, wait_none
+
+from meta_paper.concurrency import (
+    record_send,
+    start_retry_clock,
+    stop_after_sent_delay,
+)
+
+
+def new_retrying(max_delay):
+    return AsyncRetrying(
+        retry=retry_if_exception_type(RuntimeError),
+        stop=stop_after_sent_delay(max_delay),
+        before=start_retry_clock,
+        wait=wait_none(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_time_queued_before_the_first_send_does_not_count():
+    attempts = 0
+    async for attempt in new_retrying(0.1):
+        with attempt:
+            attempts += 1
+            if attempts == 1:
+                await asyncio.sleep(0.2)
+            record_send()
+            if attempts < 3:
+                raise RuntimeError("rate limited")
+
+    assert attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_stops_once_the_budget_after_the_first_send_is_spent():
+    attempts = 0
+    with pytest.raises(RetryError):
+        async for attempt in new_retrying(0.1):
+            with attempt:
+                attempts += 1
+                record_send()
+                await asyncio.sleep(0.06)
+                raise RuntimeError("rate limited")
+
+    assert attempts == 2
@@ -0,0 +1,54 @@
+import asyncio
+import multiprocessing
+import pickle
+import time
+
+import pytest
+
+from meta_paper.concurrency import SharedTokenBucket
+
+
+def _drain(bucket: SharedTokenBucket, tokens: int) -> None:
+    async def _acquire_all():
+        for _ in range(tokens):
+            await bucket.acquire()
+
+    asyncio.run(_acquire_all())
+
+
+@pytest.mark.parametrize("rate,capacity", [(0, 1), (-1, 1), (1, 0.5)])
+def test_init_rejects_invalid_limits(rate, capacity):
+    with pytest.raises(ValueError):
+        SharedTokenBucket(rate, capacity)
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill_once_bucket_is_empty():
+    sut = SharedTokenBucket(rate=50, capacity=1)
+
+    started = time.monotonic()
+    await asyncio.gather(*(sut.acquire() for _ in range(6)))
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_budget_is_shared_between_processes():
+    context = multiprocessing.get_context()
+    sut = SharedTokenBucket(rate=20, capacity=1, context=context)
+    workers = [context.Process(target=_drain, args=(sut, 5)) for _ in range(2)]
+
+    started = time.monotonic()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    # 10 tokens at 20/s with a burst of one take at least 0.45 s
+    assert time.monotonic() - started >= 0.4
+    assert sut.tokens < 1
+
+
+def test_pickling_outside_process_spawning_is_rejected():
+    with pytest.raises(RuntimeError):
+        pickle.dumps(SharedTokenBucket(rate=1))
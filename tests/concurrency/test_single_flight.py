@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from meta_paper.concurrency import SingleFlight
+
+
+@pytest.fixture
+def sut():
+    return SingleFlight()
+
+
+def counting_call(result="value", delay=0.05, error=None):
+    calls = []
+
+    async def _call():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result
+
+    return _call, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_with_same_key_share_one_call(sut):
+    call, calls = counting_call()
+
+    results = await asyncio.gather(*(sut.do("key", call) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert len(sut) == 0
+
+
+@pytest.mark.asyncio
+async def test_calls_with_different_keys_are_not_shared(sut):
+    call, calls = counting_call()
+
+    await asyncio.gather(sut.do("a", call), sut.do("b", call))
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_shared(sut):
+    call, calls = counting_call(delay=0)
+
+    await sut.do("key", call)
+    await sut.do("key", call)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_propagated_to_every_caller(sut):
+    call, calls = counting_call(error=ValueError("test error"))
+
+    results = await asyncio.gather(
+        *(sut.do("key", call) for _ in range(3)), return_exceptions=True
+    )
+
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_caller_does_not_cancel_shared_call(sut):
+    call, _ = counting_call()
+    first = asyncio.ensure_future(sut.do("key", call))
+    second = asyncio.ensure_future(sut.do("key", call))
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert await second == "value"
+
+
+@pytest.mark.asyncio
+async def test_cancelling_every_caller_cancels_shared_call(sut):
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def _call():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.ensure_future(sut.do("key", _call))
+    await started.wait()
+    caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+    assert len(sut) == 0
+
+
+@pytest.mark.asyncio
+async def test_caller_arriving_while_shared_call_is_cancelled_starts_new_call(sut):
+    call, calls = counting_call()
+    first = asyncio.ensure_future(sut.do("key", call))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    second = asyncio.ensure_future(sut.do("key", call))
+
+    assert await second == "value"
+    assert first.cancelled()
+    assert len(calls) == 2
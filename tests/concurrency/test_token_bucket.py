@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+import pytest
+
+from meta_paper.concurrency import TokenBucket
+
+
+@pytest.mark.parametrize("rate,capacity", [(0, 1), (-1, 1), (1, 0.5)])
+def test_init_rejects_invalid_limits(rate, capacity):
+    with pytest.raises(ValueError):
+        TokenBucket(rate, capacity)
+
+
+def test_capacity_defaults_to_rate():
+    sut = TokenBucket(5)
+
+    assert sut.capacity == 5
+    assert sut.tokens == 5
+
+
+@pytest.mark.asyncio
+async def test_acquire_does_not_wait_while_burst_is_available():
+    sut = TokenBucket(rate=1, capacity=5)
+
+    started = time.monotonic()
+    for _ in range(5):
+        await sut.acquire()
+
+    assert time.monotonic() - started < 0.1
+    assert sut.tokens < 1
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill_once_bucket_is_empty():
+    sut = TokenBucket(rate=50, capacity=1)
+
+    started = time.monotonic()
+    await asyncio.gather(*(sut.acquire() for _ in range(6)))
+
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_acquire_rejects_more_tokens_than_capacity():
+    sut = TokenBucket(rate=1, capacity=2)
+
+    with pytest.raises(ValueError):
+        await sut.acquire(3)
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from meta_paper.adapters import PaperDetails
+from meta_paper.client import PaperMetadataClient
+from meta_paper.graph import CitationCrawler
+
+# (citations, references): 1 cites 2 and 3, 2 cites 4, 3 cites 4 and 5, 6 cites 5
+GRAPH = {
+    "10.1/1": ([], ["10.1/2", "10.1/3"]),
+    "10.1/2": (["10.1/1"], ["10.1/4"]),
+    "10.1/3": (["10.1/1"], ["10.1/4", "10.1/5"]),
+    "10.1/4": (["10.1/2", "10.1/3"], []),
+    "10.1/5": (["10.1/3", "10.1/6"], []),
+    "10.1/6": ([], ["10.1/5"]),
+}
+
+
+class GraphProvider:
+    def __init__(self):
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search(self, query):
+        return []
+
+    async def get_one(self, doi):
+        raise NotImplementedError
+
+    async def get_many(self, identifiers):
+        identifiers = list(identifiers)
+        self.requested.append(identifiers)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return [
+            PaperDetails(doi, "t", ["a"], "", "", *GRAPH[doi], "", 2020)
+            for doi in identifiers
+            if doi in GRAPH
+        ]
+
+
+@pytest.fixture
+def provider():
+    return GraphProvider()
+
+
+@pytest.fixture
+def client(provider):
+    return PaperMetadataClient().use_custom_provider(provider)
+
+
+@pytest.mark.asyncio
+async def test_crawl_visits_levels_breadth_first(client):
+    sut = CitationCrawler(client, max_depth=2, direction="references")
+
+    results = [(r.depth, r.paper.doi) async for r in sut.crawl(["10.1/1"])]
+
+    assert results[0] == (0, "10.1/1")
+    assert sorted(results[1:3]) == [(1, "10.1/2"), (1, "10.1/3")]
+    assert sorted(results[3:]) == [(2, "10.1/4"), (2, "10.1/5")]
+
+
+@pytest.mark.asyncio
+async def test_crawl_does_not_refetch_visited_papers(client, provider):
+    sut = CitationCrawler(client, max_depth=5)
+
+    results = await sut.crawl_all(["10.1/1"])
+
+    requested = [doi for batch in provider.requested for doi in batch]
+    assert sorted(requested) == sorted(GRAPH)
+    assert set(results) == set(GRAPH)
+
+
+@pytest.mark.asyncio
+async def test_crawl_respects_node_budget(client, provider):
+    sut = CitationCrawler(client, max_depth=5, max_nodes=3)
+
+    results = await sut.crawl_all(["10.1/1"])
+
+    assert len(results) == 3
+    assert sum(map(len, provider.requested)) == 3
+
+
+@pytest.mark.asyncio
+async def test_crawl_follows_citations_only(client):
+    sut = CitationCrawler(client, max_depth=5, direction="citations")
+
+    results = await sut.crawl_all(["10.1/5"])
+
+    assert set(results) == {"10.1/5", "10.1/3", "10.1/6", "10.1/1"}
+
+
+@pytest.mark.asyncio
+async def test_crawl_bounds_batches_in_flight(client, provider):
+    sut = CitationCrawler(client, max_depth=0, batch_size=1, workers=2)
+
+    results = await sut.crawl_all(list(GRAPH))
+
+    assert len(results) == len(GRAPH)
+    assert len(provider.requested) == len(GRAPH)
+    assert provider.max_in_flight == 2
+
+
+def test_init_rejects_unknown_direction(client):
+    with pytest.raises(ValueError):
+        CitationCrawler(client, direction="sideways")
@@ -0,0 +1,84 @@
+import pytest
+
+from meta_paper.adapters import PaperDetails
+from meta_paper.graph import CitationGraph
+
+
+def new_paper(doi, citations=(), references=()):
+    return PaperDetails(
+        doi, "t", ["a"], "", "", list(citations), list(references), "", 2020
+    )
+
+
+@pytest.fixture
+def sut():
+    return CitationGraph.from_papers(
+        [
+            new_paper("DOI:10.1/a", references=["10.1/x", "10.1/y"]),
+            new_paper("doi:10.1/b", references=["10.1/x", "10.1/y", "10.1/z"]),
+            new_paper("10.1/x", citations=["10.1/a", "10.1/c"]),
+        ]
+    )
+
+
+def test_nodes_are_keyed_on_normalized_dois(sut):
+    assert len(sut) == 6
+    assert "10.1/A" in sut
+    assert "doi:10.1/b" in sut
+    assert sut.doi(sut.node_id("DOI:10.1/X")) == "10.1/x"
+
+
+def test_edges_from_both_directions_are_deduplicated(sut):
+    assert sut.edge_count == 6
+
+
+def test_references_and_citations(sut):
+    assert sut.references("10.1/b") == ["10.1/x", "10.1/y", "10.1/z"]
+    assert sorted(sut.citations("10.1/x")) == ["10.1/a", "10.1/b", "10.1/c"]
+    assert sut.citations("10.1/a") == []
+
+
+def test_degrees(sut):
+    assert sut.out_degree("10.1/a") == 2
+    assert sut.in_degree("10.1/x") == 3
+    assert sut.in_degree("10.1/z") == 1
+    assert sut.out_degree("10.1/z") == 0
+
+
+def test_co_citation_and_coupling(sut):
+    assert sut.co_citation_count("10.1/x", "10.1/y") == 2
+    assert sut.co_citation_count("10.1/x", "10.1/z") == 1
+    assert sut.bibliographic_coupling("10.1/a", "10.1/b") == 2
+    assert sut.co_cited_with("10.1/x", top=1) == [("10.1/y", 2)]
+
+
+def test_unknown_doi_raises_key_error(sut):
+    with pytest.raises(KeyError):
+        sut.references("10.1/unknown")
+
+
+def test_csr_arrays_are_consistent(sut):
+    offsets, targets = sut.out_csr
+
+    assert len(offsets) == len(sut) + 1
+    assert offsets[-1] == len(targets) == sut.edge_count
+
+
+def test_save_and_load_round_trip(sut, tmp_path):
+    path = tmp_path / "graph.bin"
+    sut.save(path)
+
+    loaded = CitationGraph.load(path)
+
+    assert loaded.dois == sut.dois
+    assert loaded.out_csr == sut.out_csr
+    assert loaded.in_csr == sut.in_csr
+    assert sorted(loaded.citations("10.1/x")) == ["10.1/a", "10.1/b", "10.1/c"]
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "graph.bin"
+    path.write_bytes(b"not a graph")
+
+    with pytest.raises(ValueError):
+        CitationGraph.load(path)
@@ -0,0 +1,77 @@
+import pytest
+
+from meta_paper.instrumentation import InMemoryCollector
+
+
+class FakeClock:
+    def __init__(self, *readings):
+        self.__readings = iter(readings)
+
+    def __call__(self):
+        return next(self.__readings)
+
+
+def test_measure_records_duration_with_attributes():
+    sut = InMemoryCollector(clock=FakeClock(1.0, 1.25))
+
+    with sut.measure("http.request", {"provider": "p"}) as attributes:
+        attributes["status"] = 200
+
+    assert sut.durations("http.request", provider="p", status=200) == [0.25]
+    assert sut.durations("http.request", status=500) == []
+
+
+def test_measure_records_error_attribute():
+    sut = InMemoryCollector(clock=FakeClock(0.0, 1.0))
+
+    with pytest.raises(KeyError):
+        with sut.measure("provider.call"):
+            raise KeyError("missing")
+
+    assert sut.durations("provider.call", error="KeyError") == [1.0]
+
+
+def test_percentile_spans_matching_series():
+    sut = InMemoryCollector(
+        clock=FakeClock(*(t for ms in range(1, 101) for t in (0, ms / 1000)))
+    )
+    for i in range(100):
+        with sut.measure("http.request", {"provider": "a" if i % 2 else "b"}):
+            pass
+
+    assert sut.percentile("http.request", 0.5) == 0.05
+    assert sut.percentile("http.request", 0.99) == 0.099
+    assert sut.percentile("http.request", 1, provider="a") == 0.1
+    assert sut.percentile("missing", 0.5) is None
+
+
+def test_counters_sum_matching_series():
+    sut = InMemoryCollector()
+    sut.add("cache.hit", 2, {"provider": "a"})
+    sut.add("cache.hit", attributes={"provider": "b"})
+
+    assert sut.counter("cache.hit") == 3
+    assert sut.counter("cache.hit", provider="a") == 2
+    assert sut.counter("cache.miss") == 0
+
+
+def test_summary_reports_timings_and_counters():
+    sut = InMemoryCollector(clock=FakeClock(0.0, 0.5))
+    with sut.measure("client.merge"):
+        pass
+    sut.add("cache.miss", 4)
+
+    summary = sut.summary()
+
+    assert summary["client.merge"]["count"] == 1
+    assert summary["client.merge"]["p99"] == 0.5
+    assert summary["cache.miss"] == {"total": 4}
+
+
+def test_series_keep_most_recent_samples():
+    sut = InMemoryCollector(max_samples=2, clock=FakeClock(0, 1, 0, 2, 0, 3))
+    for _ in range(3):
+        with sut.measure("client.get_one"):
+            pass
+
+    assert sut.durations("client.get_one") == [2, 3]
@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("opentelemetry")
+
+from meta_paper.instrumentation import OpenTelemetryInstrumentation
+
+
+class RecordingInstrument:
+    def __init__(self):
+        self.calls = []
+
+    def record(self, value, attributes=None):
+        self.calls.append((value, attributes))
+
+    def add(self, value, attributes=None):
+        self.calls.append((value, attributes))
+
+
+class RecordingMeter:
+    def __init__(self):
+        self.instruments = {}
+
+    def create_histogram(self, name, unit=""):
+        return self.instruments.setdefault(name, RecordingInstrument())
+
+    def create_counter(self, name):
+        return self.instruments.setdefault(name, RecordingInstrument())
+
+
+def test_measure_records_histogram_with_attributes():
+    meter = RecordingMeter()
+    sut = OpenTelemetryInstrumentation(meter=meter)
+
+    with sut.measure("http.request", {"provider": "p"}) as attributes:
+        attributes["status"] = 200
+
+    ((seconds, recorded),) = meter.instruments["http.request"].calls
+    assert seconds >= 0
+    assert recorded == {"provider": "p", "status": 200}
+
+
+def test_add_increments_counter():
+    meter = RecordingMeter()
+    sut = OpenTelemetryInstrumentation(meter=meter)
+
+    sut.add("cache.hit", 3, {"provider": "p"})
+
+    assert meter.instruments["cache.hit"].calls == [(3, {"provider": "p"})]
@@ -0,0 +1,95 @@
+import pytest
+
+from meta_paper.adapters import PaperDetails
+from meta_paper.merge import Longest, PaperDetailsMerger, Union
+
+
+def new_details(**kwargs):
+    values = dict(
+        doi="10.1/a",
+        title="t",
+        authors=["a"],
+        abstract="",
+        source="",
+        citations=[],
+        references=[],
+        url="",
+        year=2020,
+    )
+    values.update(kwargs)
+    return PaperDetails(**values)
+
+
+@pytest.fixture
+def sut():
+    return PaperDetailsMerger()
+
+
+def test_merge_rejects_empty_input(sut):
+    with pytest.raises(ValueError):
+        sut.merge([])
+
+
+def test_merge_keeps_longest_strings(sut):
+    actual = sut.merge(
+        [
+            new_details(title="short", abstract="longer abstract", pdf_url=None),
+            new_details(title="longer title", abstract="abstract", pdf_url="pdf"),
+        ]
+    )
+
+    assert actual.title == "longer title"
+    assert actual.abstract == "longer abstract"
+    assert actual.pdf_url == "pdf"
+
+
+def test_merge_unions_related_papers_in_first_seen_order(sut):
+    actual = sut.merge(
+        [
+            new_details(citations=["c", "a"], references=["r2"], authors=["x"]),
+            new_details(citations=["a", "b"], references=["r1", "r2"], authors=["x"]),
+        ]
+    )
+
+    assert actual.citations == ["c", "a", "b"]
+    assert actual.references == ["r2", "r1"]
+    assert actual.authors == ["x"]
+
+
+def test_merge_sorts_related_papers_on_request():
+    sut = PaperDetailsMerger(sort_related=True)
+
+    actual = sut.merge(
+        [new_details(citations=["c", "a"]), new_details(citations=["b"])]
+    )
+
+    assert actual.citations == ["a", "b", "c"]
+
+
+def test_merge_combines_year_and_pdf_flags(sut):
+    actual = sut.merge(
+        [new_details(year=2019, has_pdf=False), new_details(year=2021, has_pdf=True)]
+    )
+
+    assert actual.year == 2021
+    assert actual.has_pdf
+
+
+def test_merge_uses_custom_field_policies():
+    class First(Longest):
+        def add(self, state, value):
+            return state or value
+
+    sut = PaperDetailsMerger({"title": First(), "authors": Union(sort=True)})
+
+    actual = sut.merge(
+        [new_details(title="a", authors=["z"]), new_details(title="bb", authors=["y"])]
+    )
+
+    assert actual.title == "a"
+    assert actual.authors == ["y", "z"]
+
+
+def test_init_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        PaperDetailsMerger({"unknown": Longest()})
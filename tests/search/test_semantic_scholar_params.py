@@ -1,4 +1,5 @@
 import httpx
+import pytest
 
 from meta_paper.search import QueryParameters
 
@@ -19,3 +20,57 @@ def test_empty_params():
 
     assert isinstance(actual, httpx.QueryParams)
     assert "query" not in actual
+
+
+def test_pagination_defaults():
+    sut = QueryParameters()
+
+    assert sut.pagination == (None, None, None)
+
+
+def test_pagination_params():
+    sut = QueryParameters().offset(10).limit(20).max_results(30)
+
+    actual = sut.semantic_scholar()
+
+    assert sut.pagination == (10, 20, 30)
+    assert actual.get("offset") == "10"
+    assert actual.get("limit") == "20"
+    assert "max_results" not in actual
+
+
+@pytest.mark.parametrize(
+    "setter,value", [("offset", -1), ("limit", 0), ("max_results", 0)]
+)
+def test_pagination_rejects_invalid_values(setter, value):
+    with pytest.raises(ValueError):
+        getattr(QueryParameters(), setter)(value)
+
+
+def test_bulk_params():
+    sut = (
+        QueryParameters()
+        .title("abc")
+        .sort("citationCount", "desc")
+        .continuation_token("tok")
+        .offset(10)
+    )
+
+    actual = sut.semantic_scholar_bulk()
+
+    assert actual.get("query") == "abc"
+    assert actual.get("sort") == "citationCount:desc"
+    assert actual.get("token") == "tok"
+    assert "offset" not in actual
+
+
+def test_empty_bulk_params():
+    actual = QueryParameters().semantic_scholar_bulk()
+
+    assert len(actual) == 0
+
+
+@pytest.mark.parametrize("field,order", [("title", "asc"), ("paperId", "up")])
+def test_sort_rejects_unsupported_values(field, order):
+    with pytest.raises(ValueError):
+        QueryParameters().sort(field, order)
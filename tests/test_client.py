@@ -1,11 +1,18 @@
 import asyncio
+import logging
+import threading
+import time
 from unittest.mock import AsyncMock
 
 import httpx
 import pytest
 
 from meta_paper.adapters import PaperMetadataAdapter, PaperListing, PaperDetails
+from meta_paper.adapters import _semantic_scholar
+from meta_paper.cache import InMemoryCache, SQLiteCache
 from meta_paper.client import PaperMetadataClient
+from meta_paper.concurrency import CircuitBreaker
+from meta_paper.instrumentation import InMemoryCollector
 from meta_paper.search import QueryParameters
 
 
@@ -21,6 +28,7 @@ class StubProvider(PaperMetadataAdapter):
             ["10.1234/5678"],
             ["doi:10.1234/5678"],
             "https://example.org",
+            2025,
         )
 
     async def search(self, query: QueryParameters) -> list[PaperListing]:
@@ -88,6 +96,69 @@ def test_use_semantic_scholar_adds_expected_provider_type():
     assert sut.providers[0].__class__.__name__ == "SemanticScholarAdapter"
 
 
+@pytest.mark.asyncio
+async def test_use_semantic_scholar_can_decode_whole_batches(monkeypatch):
+    decoded = []
+
+    def loads(data):
+        decoded.append(data)
+        return []
+
+    monkeypatch.setattr(_semantic_scholar, "loads", loads)
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, json=[]))
+    )
+    sut = PaperMetadataClient(http_client).use_semantic_scholar(stream_batches=False)
+
+    await sut.get_many(["10.1234/5678"])
+
+    assert decoded == [b"[]"]
+
+
+def test_client_builds_pool_with_default_limits():
+    sut = PaperMetadataClient()
+
+    assert sut.limits == PaperMetadataClient.DEFAULT_LIMITS
+
+
+def test_client_rejects_pool_settings_for_supplied_http_client(http_client):
+    with pytest.raises(ValueError):
+        PaperMetadataClient(http_client, limits=httpx.Limits(max_connections=4))
+
+
+def test_client_warns_when_providers_oversubscribe_pool(caplog):
+    sut = PaperMetadataClient(
+        logger=logging.getLogger("test"), limits=httpx.Limits(max_connections=8)
+    )
+
+    with caplog.at_level(logging.WARNING):
+        sut.use_semantic_scholar(max_concurrency=4).use_open_citations()
+
+    assert "starve" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_use_open_citations_caps_concurrent_connections():
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if "/meta/" in request.url.path:
+            return httpx.Response(200, json=[{"title": "a title"}])
+        return httpx.Response(200, json=[])
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sut = PaperMetadataClient(http_client).use_open_citations(max_concurrency=1)
+
+    await sut.get_one("10.1234/5678")
+
+    assert peak == 1
+
+
 @pytest.mark.asyncio
 async def test_search_calls_registered_providers(
     metadata_client, query_parameters, request_handler, default_title
@@ -329,3 +400,511 @@ async def test_get_one_returns_data_from_successful_provider(http_client):
     assert actual.authors == ["a"]
     assert actual.abstract == "a"
     assert actual.references == ["10.1234/5678"]
+
+
+class CountingProvider(StubProvider):
+    def __init__(self, details=None):
+        super().__init__(
+            details=details
+            or PaperDetails("10.1234/5678", "t", ["a"], "", "", [], [], "", 2025)
+        )
+        self.get_one_calls = []
+        self.get_many_calls = []
+
+    async def get_one(self, doi: str) -> PaperDetails:
+        self.get_one_calls.append(doi)
+        return self._details
+
+    async def get_many(self, identifiers):
+        self.get_many_calls.append(list(identifiers))
+        return [
+            PaperDetails(doi, "t", ["a"], "", "", [], [], "", 2025)
+            for doi in identifiers
+        ]
+
+
+@pytest.mark.asyncio
+async def test_get_one_serves_repeated_lookups_from_cache(http_client):
+    provider = CountingProvider()
+    sut = PaperMetadataClient(http_client, cache=InMemoryCache()).use_custom_provider(
+        provider
+    )
+
+    first = await sut.get_one("10.1234/5678")
+    second = await sut.get_one("DOI:10.1234/5678")
+
+    assert provider.get_one_calls == ["10.1234/5678"]
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_cache_keeps_providers_of_the_same_class_apart(http_client):
+    first, second = CountingProvider(), CountingProvider()
+    cache = InMemoryCache()
+    sut = (
+        PaperMetadataClient(http_client, cache=cache)
+        .use_custom_provider(first)
+        .use_custom_provider(second)
+    )
+
+    await sut.get_one("10.1234/5678")
+    await sut.get_many(["10.1234/1"])
+
+    assert first.get_one_calls == second.get_one_calls == ["10.1234/5678"]
+    assert first.get_many_calls == second.get_many_calls == [["10.1234/1"]]
+    assert cache.get("CountingProvider", "doi:10.1234/5678") is not None
+    assert cache.get("CountingProvider#1", "doi:10.1234/5678") is not None
+
+
+@pytest.mark.asyncio
+async def test_get_many_only_requests_cache_misses(http_client):
+    provider = CountingProvider()
+    sut = PaperMetadataClient(http_client, cache=InMemoryCache()).use_custom_provider(
+        provider
+    )
+
+    await sut.get_many(["10.1234/1", "10.1234/2"])
+    result = list(await sut.get_many(["doi:10.1234/2", "10.1234/3"]))
+
+    assert provider.get_many_calls == [["10.1234/1", "10.1234/2"], ["10.1234/3"]]
+    assert sorted(paper.doi for paper in result) == ["10.1234/2", "10.1234/3"]
+
+
+@pytest.mark.asyncio
+async def test_client_calls_blocking_caches_off_the_event_loop(http_client, tmp_path):
+    threads = []
+
+    class RecordingCache(SQLiteCache):
+        def get_many(self, provider, keys):
+            threads.append(threading.get_ident())
+            return super().get_many(provider, keys)
+
+        def set_many(self, provider, items):
+            threads.append(threading.get_ident())
+            super().set_many(provider, items)
+
+    cache = RecordingCache(tmp_path / "cache.sqlite3")
+    sut = PaperMetadataClient(http_client, cache=cache).use_custom_provider(
+        CountingProvider()
+    )
+
+    await sut.get_one("10.1234/5678")
+    result = list(await sut.get_many(["10.1234/5678", "10.1234/1"]))
+
+    assert sorted(paper.doi for paper in result) == ["10.1234/1", "10.1234/5678"]
+    assert threads and threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_search_serves_repeated_queries_from_cache(
+    query_parameters, request_handler, http_client
+):
+    sut = PaperMetadataClient(http_client, cache=InMemoryCache()).use_semantic_scholar()
+
+    await sut.search(query_parameters)
+    results = await sut.search(QueryParameters().title("test title"))
+
+    assert len(request_handler.call_args_list) == 1
+    assert len(results) == 1
+
+
+class SlowLookupProvider(CountingProvider):
+    def __init__(self, delays):
+        super().__init__()
+        self._delays = list(delays)
+
+    async def get_one(self, doi: str) -> PaperDetails:
+        await asyncio.sleep(self._delays.pop(0) if self._delays else 0)
+        return await super().get_one(doi)
+
+
+@pytest.mark.asyncio
+async def test_get_one_merges_partial_results_at_deadline(http_client):
+    slow = SlowLookupProvider([5])
+    sut = (
+        PaperMetadataClient(http_client)
+        .use_custom_provider(slow)
+        .use_custom_provider(
+            CountingProvider(
+                PaperDetails("10.1234/5678", "fast", ["a"], "", "", [], [], "", 2025)
+            )
+        )
+    )
+
+    started = time.monotonic()
+    actual = await sut.get_one("10.1234/5678", timeout=0.1)
+
+    assert time.monotonic() - started < 1
+    assert actual.title == "fast"
+
+
+@pytest.mark.asyncio
+async def test_get_one_raises_timeout_error_when_no_provider_meets_deadline(
+    http_client,
+):
+    sut = PaperMetadataClient(http_client).use_custom_provider(SlowLookupProvider([5]))
+
+    with pytest.raises(TimeoutError):
+        await sut.get_one("10.1234/5678", timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_get_one_does_not_log_errors_for_providers_missing_deadline(
+    http_client, caplog
+):
+    sut = (
+        PaperMetadataClient(http_client, logger=logging.getLogger("test"))
+        .use_custom_provider(SlowLookupProvider([5]))
+        .use_custom_provider(CountingProvider())
+    )
+
+    with caplog.at_level(logging.WARNING):
+        await sut.get_one("10.1234/5678", timeout=0.1)
+
+    assert "missed the deadline" in caplog.text
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+
+@pytest.mark.asyncio
+async def test_get_one_hedges_straggling_provider_through_batch_lookup(http_client):
+    provider = SlowLookupProvider([0] * 20 + [5])
+    sut = PaperMetadataClient(http_client, hedge_percentile=0.9).use_custom_provider(
+        provider
+    )
+    for _ in range(20):
+        await sut.get_one("10.1234/5678")
+
+    started = time.monotonic()
+    actual = await sut.get_one("10.1234/5678")
+
+    assert time.monotonic() - started < 1
+    assert actual.doi == "10.1234/5678"
+    assert provider.get_many_calls == [["10.1234/5678"]]
+
+
+@pytest.mark.asyncio
+async def test_get_one_hedges_only_on_upstream_latency(http_client):
+    provider = SlowLookupProvider([0.05] * 20 + [0.02] * 20)
+    sut = PaperMetadataClient(
+        http_client, cache=InMemoryCache(), hedge_percentile=0.9
+    ).use_custom_provider(provider)
+    for i in range(20):
+        await sut.get_one(f"10.1/{i}")
+    for _ in range(300):
+        await sut.get_one("10.1/0")
+
+    for i in range(20, 40):
+        await sut.get_one(f"10.1/{i}")
+
+    assert provider.get_many_calls == []
+
+
+@pytest.mark.asyncio
+async def test_get_one_does_not_hedge_without_latency_history(http_client):
+    provider = SlowLookupProvider([0.05])
+    sut = PaperMetadataClient(http_client, hedge_percentile=0.5).use_custom_provider(
+        provider
+    )
+
+    await sut.get_one("10.1234/5678")
+
+    assert provider.get_many_calls == []
+
+
+class FailingProvider(CountingProvider):
+    async def get_one(self, doi: str) -> PaperDetails:
+        self.get_one_calls.append(doi)
+        raise httpx.ConnectError("provider down")
+
+
+@pytest.mark.asyncio
+async def test_get_one_skips_provider_with_open_circuit(http_client):
+    failing = FailingProvider()
+    sut = (
+        PaperMetadataClient(
+            http_client,
+            circuit_breaker=lambda: CircuitBreaker(window=2, min_calls=2),
+        )
+        .use_custom_provider(failing)
+        .use_custom_provider(CountingProvider())
+    )
+
+    for _ in range(5):
+        actual = await sut.get_one("10.1234/5678")
+
+    assert actual.doi == "10.1234/5678"
+    assert len(failing.get_one_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_one_keeps_circuit_closed_for_unknown_dois(http_client):
+    class UnknownDOIProvider(CountingProvider):
+        async def get_one(self, doi: str) -> PaperDetails:
+            self.get_one_calls.append(doi)
+            request = httpx.Request("GET", f"https://example.org/{doi}")
+            raise httpx.HTTPStatusError(
+                "not found", request=request, response=httpx.Response(404)
+            )
+
+    provider = UnknownDOIProvider()
+    sut = (
+        PaperMetadataClient(
+            http_client,
+            circuit_breaker=lambda: CircuitBreaker(window=2, min_calls=2),
+        )
+        .use_custom_provider(provider)
+        .use_custom_provider(CountingProvider())
+    )
+
+    for i in range(10):
+        await sut.get_one(f"10.1/{i}")
+
+    assert len(provider.get_one_calls) == 10
+
+
+@pytest.mark.asyncio
+async def test_search_skips_provider_with_open_circuit(http_client, query_parameters):
+    provider = StubProvider()
+    provider.search = AsyncMock(side_effect=httpx.ConnectError("provider down"))
+    sut = PaperMetadataClient(
+        http_client, circuit_breaker=lambda: CircuitBreaker(window=1, min_calls=1)
+    ).use_custom_provider(provider)
+
+    with pytest.raises(httpx.ConnectError):
+        await sut.search(query_parameters)
+
+    assert await sut.search(query_parameters) == []
+    assert provider.search.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_many_merges_built_in_providers_per_doi():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/graph/v1/paper/batch":
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        "externalIds": {"DOI": "10.1234/abc"},
+                        "title": "T",
+                        "authors": [{"name": "author"}],
+                    }
+                ],
+            )
+        if "/metadata/" in request.url.path:
+            return httpx.Response(
+                200, json=[{"id": "doi:10.1234/abc", "title": "T oc", "authors": "a"}]
+            )
+        return httpx.Response(200, json=[])
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sut = PaperMetadataClient(http_client).use_open_citations().use_semantic_scholar()
+
+    results = list(await sut.get_many(["10.1234/abc"]))
+
+    assert [paper.title for paper in results] == ["T oc"]
+
+
+class DelayedBatchProvider(StubProvider):
+    def __init__(self, delays, title="t"):
+        super().__init__()
+        self._delays = delays
+        self._title = title
+
+    async def get_many(self, identifiers):
+        identifiers = list(identifiers)
+        await asyncio.sleep(self._delays.get(identifiers[0], 0))
+        return [
+            PaperDetails(doi, self._title, ["a"], "", "", [], [], "", 2025)
+            for doi in identifiers
+        ]
+
+
+@pytest.mark.asyncio
+async def test_iter_many_yields_chunks_as_all_providers_answer(http_client):
+    sut = (
+        PaperMetadataClient(http_client)
+        .use_custom_provider(DelayedBatchProvider({"10.1/1": 0.2}))
+        .use_custom_provider(DelayedBatchProvider({}, title="longer title"))
+    )
+
+    results = [
+        paper.doi
+        async for paper in sut.iter_many(["10.1/1", "10.1/2", "10.1/3"], chunk_size=1)
+    ]
+
+    assert results == ["10.1/2", "10.1/3", "10.1/1"]
+
+
+@pytest.mark.asyncio
+async def test_iter_many_merges_data_per_doi(http_client):
+    sut = (
+        PaperMetadataClient(http_client)
+        .use_custom_provider(DelayedBatchProvider({}))
+        .use_custom_provider(DelayedBatchProvider({}, title="longer title"))
+    )
+
+    results = [paper async for paper in sut.iter_many(["10.1/1", "10.1/2"])]
+
+    assert [paper.doi for paper in results] == ["10.1/1", "10.1/2"]
+    assert all(paper.title == "longer title" for paper in results)
+
+
+@pytest.mark.asyncio
+async def test_iter_many_yields_partial_data_after_timeout(http_client):
+    sut = (
+        PaperMetadataClient(http_client)
+        .use_custom_provider(DelayedBatchProvider({"10.1/1": 5}, title="slow title"))
+        .use_custom_provider(DelayedBatchProvider({}))
+    )
+
+    started = asyncio.get_running_loop().time()
+    results = [paper async for paper in sut.iter_many(["10.1/1"], timeout=0.1)]
+
+    assert asyncio.get_running_loop().time() - started < 1
+    assert [(paper.doi, paper.title) for paper in results] == [("10.1/1", "t")]
+
+
+@pytest.mark.asyncio
+async def test_iter_many_times_out_chunks_without_any_answer(http_client):
+    sut = PaperMetadataClient(http_client).use_custom_provider(
+        DelayedBatchProvider({"10.1/1": 5})
+    )
+
+    started = asyncio.get_running_loop().time()
+    results = [paper async for paper in sut.iter_many(["10.1/1"], timeout=0.1)]
+
+    assert asyncio.get_running_loop().time() - started < 1
+    assert results == []
+
+
+@pytest.mark.asyncio
+async def test_iter_many_bounds_chunks_in_flight(http_client):
+    class ConcurrencyProbe(DelayedBatchProvider):
+        def __init__(self):
+            super().__init__({})
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def get_many(self, identifiers):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                return await super().get_many(identifiers)
+            finally:
+                self.in_flight -= 1
+
+    read = 0
+
+    def identifiers():
+        nonlocal read
+        for i in range(10_000):
+            read += 1
+            yield f"10.1/{i}"
+
+    provider = ConcurrencyProbe()
+    sut = PaperMetadataClient(http_client).use_custom_provider(provider)
+
+    results = sut.iter_many(identifiers(), chunk_size=10, max_pending_chunks=3)
+    first = await results.__anext__()
+    assert read <= 30
+    count = 1 + len([paper async for paper in results])
+
+    assert first.doi == "10.1/0"
+    assert count == 10_000
+    assert provider.max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_iter_many_skips_failing_providers(http_client):
+    class FailingProvider(StubProvider):
+        async def get_many(self, identifiers):
+            raise RuntimeError("test error")
+
+    sut = (
+        PaperMetadataClient(http_client)
+        .use_custom_provider(FailingProvider())
+        .use_custom_provider(DelayedBatchProvider({}))
+    )
+
+    results = [paper.doi async for paper in sut.iter_many(["10.1/1"])]
+
+    assert results == ["10.1/1"]
+
+
+@pytest.mark.asyncio
+async def test_get_one_coalesces_concurrent_lookups(http_client):
+    class SlowCountingProvider(CountingProvider):
+        async def get_one(self, doi: str) -> PaperDetails:
+            await asyncio.sleep(0.05)
+            return await super().get_one(doi)
+
+    provider = SlowCountingProvider()
+    sut = PaperMetadataClient(http_client).use_custom_provider(provider)
+
+    results = await asyncio.gather(
+        sut.get_one("10.1234/5678"),
+        sut.get_one("doi:10.1234/5678"),
+        sut.get_one("10.1234/5678"),
+    )
+
+    assert len(provider.get_one_calls) == 1
+    assert results[0] == results[1] == results[2]
+
+
+@pytest.mark.asyncio
+async def test_get_one_forwards_field_projection(http_client):
+    class ProjectingProvider(CountingProvider):
+        async def get_one(self, doi: str, fields=None) -> PaperDetails:
+            self.get_one_calls.append((doi, fields))
+            return self._details
+
+    provider = ProjectingProvider()
+    sut = PaperMetadataClient(http_client, cache=InMemoryCache()).use_custom_provider(
+        provider
+    )
+
+    await sut.get_one("10.1234/5678")
+    await sut.get_one("10.1234/5678", fields=["title"])
+
+    assert provider.get_one_calls == [
+        ("10.1234/5678", None),
+        ("10.1234/5678", {"doi", "title"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_reports_provider_calls_cache_lookups_and_merges(http_client):
+    collector = InMemoryCollector()
+    sut = PaperMetadataClient(
+        http_client, cache=InMemoryCache(), instrumentation=collector
+    ).use_custom_provider(CountingProvider())
+
+    await sut.get_one("10.1234/5678")
+    await sut.get_one("10.1234/5678")
+    list(await sut.get_many(["10.1/1", "10.1234/5678"]))
+
+    assert collector.counter("cache.hit", provider="CountingProvider") == 2
+    assert collector.counter("cache.miss", provider="CountingProvider") == 2
+    assert len(collector.durations("provider.call", operation="get_one")) == 1
+    assert len(collector.durations("provider.call", operation="get_many")) == 1
+    assert len(collector.durations("client.get_one")) == 2
+    assert len(collector.durations("client.merge")) == 4
+
+
+def test_client_shares_instrumentation_with_built_in_adapters():
+    collector = InMemoryCollector()
+    sut = (
+        PaperMetadataClient(instrumentation=collector)
+        .use_open_citations()
+        .use_semantic_scholar()
+    )
+
+    assert all(provider.instrumentation is collector for provider in sut.providers)
+
+
+@pytest.mark.asyncio
+async def test_aclose_leaves_supplied_http_client_open(http_client):
+    await PaperMetadataClient(http_client).aclose()
+
+    assert not http_client.is_closed
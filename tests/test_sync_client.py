@@ -0,0 +1,115 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from meta_paper.adapters import PaperDetails, PaperListing, PaperMetadataAdapter
+from meta_paper.client import PaperMetadataClient
+from meta_paper.search import QueryParameters
+from meta_paper.sync_client import SyncPaperMetadataClient
+
+
+class LoopRecordingProvider(PaperMetadataAdapter):
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.loops = set()
+        self.threads = set()
+
+    def __record(self):
+        self.loops.add(id(asyncio.get_running_loop()))
+        self.threads.add(threading.get_ident())
+
+    async def search(self, query: QueryParameters) -> list[PaperListing]:
+        self.__record()
+        return [PaperListing("10.1/1", "a title", ["an author"])]
+
+    async def get_one(self, doi: str) -> PaperDetails:
+        self.__record()
+        await asyncio.sleep(self.delay)
+        return PaperDetails(doi, "t", ["a"], "", "", [], [], "", 2025)
+
+    async def get_many(self, identifiers):
+        self.__record()
+        await asyncio.sleep(self.delay)
+        return [
+            PaperDetails(doi, "t", ["a"], "", "", [], [], "", 2025)
+            for doi in identifiers
+        ]
+
+
+@pytest.fixture
+def provider():
+    return LoopRecordingProvider()
+
+
+@pytest.fixture
+def sut(provider):
+    with SyncPaperMetadataClient(
+        PaperMetadataClient().use_custom_provider(provider)
+    ) as client:
+        yield client
+
+
+def test_blocking_calls_share_one_background_loop(sut, provider):
+    assert sut.get_one("10.1/1").doi == "10.1/1"
+    assert [paper.doi for paper in sut.get_many(["10.1/1", "10.1/2"])] == [
+        "10.1/1",
+        "10.1/2",
+    ]
+    assert len(sut.search(QueryParameters().title("t"))) == 1
+
+    assert len(provider.loops) == 1
+    assert provider.threads.isdisjoint({threading.get_ident()})
+
+
+def test_calls_from_many_threads_run_concurrently(provider):
+    provider.delay = 0.1
+    with SyncPaperMetadataClient(
+        PaperMetadataClient().use_custom_provider(provider)
+    ) as sut:
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            results = list(pool.map(sut.get_one, [f"10.1/{i}" for i in range(20)]))
+
+    assert [paper.doi for paper in results] == [f"10.1/{i}" for i in range(20)]
+    assert len(provider.loops) == 1
+
+
+def test_map_streams_merged_details(sut):
+    results = list(sut.map([f"10.1/{i}" for i in range(5)], chunk_size=2))
+
+    assert sorted(paper.doi for paper in results) == [f"10.1/{i}" for i in range(5)]
+
+
+def test_map_can_be_abandoned_early(sut):
+    results = sut.map([f"10.1/{i}" for i in range(5)], chunk_size=1)
+
+    assert next(results).doi.startswith("10.1/")
+    results.close()
+    assert sut.get_one("10.1/1").doi == "10.1/1"
+
+
+def test_map_reads_identifiers_as_results_are_consumed(sut):
+    read = 0
+
+    def identifiers():
+        nonlocal read
+        for i in range(10_000):
+            read += 1
+            yield f"10.1/{i}"
+
+    results = sut.map(identifiers(), chunk_size=10, max_pending_chunks=2)
+
+    assert next(results).doi == "10.1/0"
+    assert read <= 30
+    results.close()
+
+
+def test_close_is_idempotent_and_rejects_later_calls(provider):
+    sut = SyncPaperMetadataClient(PaperMetadataClient().use_custom_provider(provider))
+
+    sut.close()
+    sut.close()
+
+    with pytest.raises(RuntimeError):
+        sut.get_one("10.1/1")